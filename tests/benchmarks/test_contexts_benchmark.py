@@ -0,0 +1,100 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from support.browser import start_chrome
+from support.cases import group_by_precondition, run_groups
+from support.contexts import run_groups_in_contexts
+from support.fuzzing import differential_sample, to_transfer_case
+from support.procmem import browser_rss, megabytes
+from support.static_server import StaticServer
+from support.transfer_page import TransferPage
+
+
+CONCURRENCY = 4
+ROUNDS = 3
+
+
+class PeakSampler:
+    """Раз в interval секунд замеряет память и запоминает максимум."""
+
+    def __init__(self, measure: Callable[[], int | None], interval: float = 0.2):
+        self.measure = measure
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "PeakSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.measure() or 0)
+            self._stop.wait(self.interval)
+
+
+def throughput_per_gb(cases: int, seconds: float, peak: int) -> float:
+    return cases / seconds / (peak / 2**30) if peak else float("nan")
+
+
+@pytest.mark.benchmark
+def test_contexts_vs_chrome_per_test(chromedriver_path):
+    """
+    Одни и те же группы кейсов: CONCURRENCY отдельных Chrome (по браузеру
+    на группу) против CONCURRENCY изолированных контекстов в одном Chrome.
+    Сравнивается число кейсов в секунду на гигабайт пиковой памяти.
+    """
+    cases = [to_transfer_case(case) for case in differential_sample()]
+    groups = group_by_precondition(cases) * ROUNDS
+    total = len(cases) * ROUNDS
+    server = StaticServer().start()
+    drivers = []
+
+    def chrome_per_group(group):
+        driver = start_chrome(chromedriver_path)
+        drivers.append(driver)
+        try:
+            return run_groups(TransferPage(driver, server.url, fill_mode="fast"), [group])
+        finally:
+            drivers.remove(driver)
+            driver.quit()
+
+    try:
+        with PeakSampler(lambda: sum(browser_rss(driver) or 0 for driver in list(drivers))) as separate:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(CONCURRENCY) as executor:
+                list(executor.map(chrome_per_group, groups))
+            separate_seconds = time.perf_counter() - started
+
+        driver = start_chrome(chromedriver_path)
+        try:
+            with PeakSampler(lambda: browser_rss(driver)) as shared:
+                started = time.perf_counter()
+                run_groups_in_contexts(driver, server.url, groups, contexts=CONCURRENCY)
+                shared_seconds = time.perf_counter() - started
+        finally:
+            driver.quit()
+    finally:
+        server.stop()
+
+    separate_rate = throughput_per_gb(total, separate_seconds, separate.peak)
+    shared_rate = throughput_per_gb(total, shared_seconds, shared.peak)
+    print(
+        f"\nchrome per group: {total} cases in {separate_seconds:.1f}s, "
+        f"peak {megabytes(separate.peak)}, {separate_rate:.1f} cases/s/GB"
+    )
+    print(
+        f"contexts:         {total} cases in {shared_seconds:.1f}s, "
+        f"peak {megabytes(shared.peak)}, {shared_rate:.1f} cases/s/GB"
+    )
+    if separate.peak and shared.peak:
+        assert shared_rate > separate_rate
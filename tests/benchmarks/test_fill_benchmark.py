@@ -0,0 +1,25 @@
+import pytest
+
+from support.benchmark import measure
+
+
+ITERATIONS = 30
+
+
+@pytest.mark.benchmark
+def test_send_keys_vs_fast_fill(page):
+    """Заполнение карты и суммы: посимвольный send_keys против одного скрипта."""
+    page.open(balance=33000, reserved=1000)
+    page.enable_rubles()
+
+    def fill(mode: str):
+        page.card_input("5559000000000000", clear=True, mode=mode)
+        page.amount_input("1234", mode=mode)
+
+    keys = measure("send_keys", lambda: fill("keys"), ITERATIONS)
+    fast = measure("fast fill", lambda: fill("fast"), ITERATIONS)
+
+    print(keys.report())
+    print(fast.report())
+    print(f"saved per fill: {(keys.median - fast.median) * 1000:.1f}ms")
+    assert fast.median < keys.median
@@ -0,0 +1,19 @@
+import pytest
+
+from support import frontend_perf
+
+
+@pytest.mark.benchmark
+def test_bundle_within_budgets(pytestconfig, page):
+    """
+    Загружает приложение --perf-iterations раз и сравнивает p90 метрик
+    фронтенда с бюджетами (DEFAULT_BUDGETS_MS и --perf-budget).
+    """
+    budgets = frontend_perf.parse_budgets(pytestconfig.getoption("--perf-budget"))
+    bundle, results = frontend_perf.run(page, pytestconfig.getoption("--perf-iterations"))
+
+    print(f"\n{bundle}")
+    for result in results.values():
+        print(result.report())
+    over = frontend_perf.exceeded(results, budgets)
+    assert not over, f"{bundle} over budget:\n" + "\n".join(over)
@@ -0,0 +1,23 @@
+import pytest
+
+from support.scenarios import INTERLEAVINGS, Scenario, run_scenario
+
+
+USERS = (1, 8, 32)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("interleaving", INTERLEAVINGS)
+@pytest.mark.parametrize("users", USERS)
+def test_many_tabs_transfer_at_once(driver, base_url, users, interleaving):
+    """
+    users вкладок одновременно загружают приложение с одного сервера и
+    отправляют перевод; выводятся пропускная способность и перцентили
+    загрузки вкладки и ответа на «Перевести».
+    """
+    scenario = Scenario.users(users, "1000", "33000", "1000", interleaving=interleaving)
+    report = run_scenario(driver, base_url, scenario)
+    print()
+    for line in report.lines():
+        print(line)
+    assert report.sent == users, report.outcome_lines()
@@ -0,0 +1,58 @@
+import pytest
+
+from selenium.webdriver.common.by import By
+
+from support.benchmark import measure
+from support.locators import LOCATORS
+
+
+ITERATIONS = 50
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("page")
+class TestLocatorBenchmark:
+    def prepare_form(self):
+        self.page.open(balance=33000, reserved=1000)
+        self.page.enable_rubles()
+        self.page.card_input("5559000000000000")
+        self.page.amount_input("1000")
+
+    def test_query_vs_absolute_xpath(self):
+        """
+        Для каждого локатора сравнивает поиск по id/CSS с исходным
+        абсолютным XPath: оба должны находить один и тот же элемент.
+        """
+        self.prepare_form()
+        for locator in LOCATORS.values():
+            if locator.name == "error_message":
+                continue
+            by_query = self.driver.find_element(*locator.query)
+            by_xpath = self.driver.find_element(By.XPATH, locator.xpath)
+            assert by_query == by_xpath, locator.name
+
+            fast = measure(
+                f"{locator.name} [{locator.by}]",
+                lambda: self.driver.find_element(*locator.query),
+                ITERATIONS,
+            )
+            slow = measure(
+                f"{locator.name} [xpath]",
+                lambda: self.driver.find_element(By.XPATH, locator.xpath),
+                ITERATIONS,
+            )
+            print(fast.report())
+            print(slow.report())
+
+    def test_cached_element(self):
+        self.prepare_form()
+        self.page.get_fee()
+        cached = measure("fee [cached]", self.page.get_fee, ITERATIONS)
+        lookup = measure(
+            "fee [lookup]",
+            lambda: self.page.find_element("fee").text,
+            ITERATIONS,
+        )
+        print(cached.report())
+        print(lookup.report())
+        assert cached.median <= lookup.median
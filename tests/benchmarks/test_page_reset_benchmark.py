@@ -0,0 +1,27 @@
+import pytest
+
+from support.benchmark import measure
+from support.soft_reset import soft_reset
+
+
+ITERATIONS = 30
+
+
+@pytest.mark.benchmark
+def test_navigation_vs_soft_reset(page):
+    """Смена balance/reserved: полная загрузка страницы против сброса через роутер."""
+    queries = [(30000, 20001), (33000, 1000)]
+    counter = iter(range(10**6))
+
+    def next_url() -> str:
+        return page.url(*queries[next(counter) % len(queries)])
+
+    hard = measure("navigation", lambda: page.navigate(next_url()), ITERATIONS)
+    soft = measure("soft reset", lambda: soft_reset(page.driver, next_url()), ITERATIONS)
+
+    assert soft_reset(page.driver, page.url(30000, 20001))
+    state = page.snapshot()
+    assert (state.balance, state.reserve, state.card, state.currency) == ("30000", "20001", None, None)
+
+    print(hard.report())
+    print(soft.report())
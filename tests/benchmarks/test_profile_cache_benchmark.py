@@ -0,0 +1,56 @@
+from functools import partial
+
+import pytest
+
+from support.benchmark import BenchmarkResult
+from support.browser import start_chrome
+from support.chromedriver import chrome_version
+from support.profile_cache import ProfileCache
+from support.static_server import StaticServer
+from support.transfer_page import TransferPage
+
+
+ROUNDS = 5
+
+# Сколько байт бандла пришло по сети при загрузке (0 — из HTTP-кэша)
+BUNDLE_TRANSFER_SCRIPT = """
+const bundle = performance.getEntriesByType('resource').find((entry) => entry.name.endsWith('.js'));
+return bundle ? bundle.transferSize : null;
+"""
+
+
+def first_load(factory, base_url: str) -> tuple[float, int | None]:
+    driver = factory()
+    try:
+        page = TransferPage(driver, base_url)
+        seconds = page.navigate(page.url(33000, 1000))
+        return seconds, driver.execute_script(BUNDLE_TRANSFER_SCRIPT)
+    finally:
+        driver.quit()
+
+
+@pytest.mark.benchmark
+def test_cold_vs_warm_profile_first_load(chromedriver_path, tmp_path):
+    """Первая загрузка приложения в только что запущенном Chrome: чистый профиль и прогретый."""
+    server = StaticServer().start()
+    profiles = ProfileCache(server.url, browser=chrome_version(), root=tmp_path / "profiles")
+    start = partial(start_chrome, chromedriver_path)
+    try:
+        profiles.seed(lambda user_data_dir: start(user_data_dir=user_data_dir))
+        cold, warm, transferred = [], [], []
+        for _ in range(ROUNDS):
+            cold.append(first_load(start, server.url)[0])
+            seconds, size = first_load(lambda: start(user_data_dir=profiles.clone()), server.url)
+            warm.append(seconds)
+            transferred.append(size)
+    finally:
+        profiles.close()
+        server.stop()
+
+    cold_result, warm_result = BenchmarkResult("cold", cold), BenchmarkResult("warm", warm)
+    print()
+    print(cold_result.report())
+    print(warm_result.report())
+    print(f"bundle bytes over network with warm profile: {transferred}")
+    assert warm_result.median < cold_result.median
+    assert all(size == 0 for size in transferred)
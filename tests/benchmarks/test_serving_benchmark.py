@@ -0,0 +1,44 @@
+import pytest
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support.benchmark import measure
+from support.browser import start_chrome
+from support.interception import INTERCEPT_BASE_URL, BundleInterceptor, start_intercepting_chrome
+from support.static_server import StaticServer
+
+
+ITERATIONS = 30
+
+
+def page_load(driver, url: str):
+    driver.get(url)
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "rub-sum")))
+
+
+@pytest.mark.benchmark
+def test_server_vs_interception(chromedriver_path):
+    """Время загрузки страницы: встроенный HTTP-сервер против перехвата в браузере."""
+    query = "/?balance=30000&reserved=20001"
+
+    server = StaticServer().start()
+    driver = start_chrome(chromedriver_path)
+    try:
+        served = measure("memory server", lambda: page_load(driver, server.url + query), ITERATIONS)
+    finally:
+        driver.quit()
+        server.stop()
+
+    driver = start_intercepting_chrome(chromedriver_path, BundleInterceptor())
+    try:
+        intercepted = measure(
+            "interception", lambda: page_load(driver, INTERCEPT_BASE_URL + query), ITERATIONS
+        )
+        assert driver.find_element(By.ID, "rub-sum").text == "30'000"
+    finally:
+        driver.quit()
+
+    print(served.report())
+    print(intercepted.report())
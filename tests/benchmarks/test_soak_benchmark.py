@@ -0,0 +1,32 @@
+import pytest
+
+from support.memory import DEFAULT_THRESHOLDS, MemorySampler, format_value, leaks
+
+
+@pytest.mark.benchmark
+def test_transfer_cycle_does_not_leak(pytestconfig, page):
+    """
+    Цикл ввод карты → ввод суммы → «Перевести» → alert без перезагрузки
+    страницы; после каждого цикла снимается память. Тест падает, если
+    куча JS, узлы DOM, обработчики или RSS растут монотонно дальше порогов.
+    """
+    cycles = pytestconfig.getoption("--soak-cycles")
+    sampler = MemorySampler()
+    sampler.test = "soak"
+    page.open(balance=10**9, reserved=0)
+    page.enable_rubles()
+    for _ in range(cycles):
+        page.card_input("5559000000000000", clear=True)
+        page.amount_input("1")
+        page.send_money(page.element("send_button"))
+        page.get_alert()
+        sampler.sample(page.driver, "cycle")
+
+    first, last = sampler.samples[0], sampler.samples[-1]
+    print()
+    for metric in DEFAULT_THRESHOLDS:
+        before, after = getattr(first, metric), getattr(last, metric)
+        if before is not None:
+            print(f"{metric}: {format_value(metric, before)} -> {format_value(metric, after)}")
+    found = leaks(sampler.samples, DEFAULT_THRESHOLDS)
+    assert not found, found
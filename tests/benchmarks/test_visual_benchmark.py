@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from support.benchmark import measure
+from support.visual import different_pixels, mask_array, phash
+
+
+WIDTH, HEIGHT = 1920, 1080
+TOLERANCE = 8
+
+
+def naive_diff(actual: list, expected: list) -> int:
+    """Попиксельное сравнение циклами Python, как без NumPy."""
+    count = 0
+    for row_actual, row_expected in zip(actual, expected):
+        for pixel_actual, pixel_expected in zip(row_actual, row_expected):
+            if any(abs(a - e) > TOLERANCE for a, e in zip(pixel_actual, pixel_expected)):
+                count += 1
+    return count
+
+
+@pytest.mark.benchmark
+def test_numpy_diff_vs_python_loops():
+    """Сравнение двух снимков окна 1920x1080: циклы Python, NumPy и phash."""
+    rng = np.random.default_rng(0)
+    expected = rng.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+    actual = expected.copy()
+    actual[500:520, 900:1000] ^= 0x40
+    compared = mask_array(actual.shape, ())
+    actual_list, expected_list = actual.tolist(), expected.tolist()
+
+    loops = measure("python loops", lambda: naive_diff(actual_list, expected_list), 1, warmup=0)
+    vectorized = measure(
+        "numpy", lambda: different_pixels(actual, expected, TOLERANCE, compared), 10
+    )
+    hashed = measure("phash", lambda: phash(actual), 10)
+
+    for result in (loops, vectorized, hashed):
+        print(result.report())
+    print(f"numpy speed-up: {loops.median / vectorized.median:.0f}x")
+    assert int(different_pixels(actual, expected, TOLERANCE, compared).sum()) == naive_diff(
+        actual_list, expected_list
+    )
+    assert vectorized.median * 100 < loops.median
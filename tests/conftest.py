@@ -0,0 +1,458 @@
+import argparse
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from support import form_state, soft_reset
+from support.artifacts import DEFAULT_STEPS, ArtifactPlugin
+from support.cases import group_id, run_groups
+from support.contexts import run_groups_in_contexts
+from support.browser import start_chrome
+from support.browser_pool import BrowserPool
+from support.chromedriver import chrome_version, resolve_chromedriver
+from support.interception import INTERCEPT_BASE_URL, BundleInterceptor, start_intercepting_chrome
+from support.memory import MemoryPlugin, parse_thresholds
+from support.parallel import ParallelController, WorkerSelector, worker_count
+from support.profile_cache import ProfileCache, stable_port, warm_factory
+from support.reruns import RerunPlugin
+from support.result_cache import ResultCachePlugin
+from support.sharding import (
+    DURATIONS_FILE,
+    DurationRecorder,
+    ShardSelector,
+    parse_shard,
+    read_durations,
+)
+from support.static_server import StaticServer
+from support.stats import TIMINGS
+from support.tracing import TracingPlugin
+from support.waits import ENGINES
+from support.transfer_page import DEFAULT_BASE_URL, FILL_MODES, TransferPage
+from support.visual import BASELINE_DIR, VisualBaselines
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fbank", "F-Bank UI tests")
+    group.addoption(
+        "--browser-pool-size",
+        type=int,
+        default=1,
+        help="сколько браузеров держать прогретыми одновременно",
+    )
+    group.addoption(
+        "--browser-max-uses",
+        type=int,
+        default=50,
+        help="через сколько тестов перезапускать браузер",
+    )
+    group.addoption(
+        "--chromedriver",
+        default=None,
+        help="путь к chromedriver (иначе CHROMEDRIVER_PATH, кэш, PATH)",
+    )
+    group.addoption(
+        "--serve",
+        choices=("memory", "intercept", "external"),
+        default="memory",
+        help=(
+            "memory — раздавать dist/ встроенным сервером, "
+            "intercept — отдавать dist/ из памяти через перехват запросов в браузере, "
+            "external — использовать --base-url"
+        ),
+    )
+    group.addoption(
+        "--base-url",
+        default=os.environ.get("FBANK_BASE_URL", DEFAULT_BASE_URL),
+        help="адрес приложения для --serve=external (по умолчанию FBANK_BASE_URL или http://localhost:8000)",
+    )
+    group.addoption(
+        "--workers",
+        default="1",
+        help="число процессов для параллельного запуска, auto — по числу ядер",
+    )
+    group.addoption(
+        "--worker-servers",
+        action="store_true",
+        help="при --serve=external поднимать отдельный http.server для каждого воркера",
+    )
+    group.addoption(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        metavar="I/N",
+        help="запустить только шард I из N; тесты делятся по записанным длительностям",
+    )
+    group.addoption(
+        "--durations-path",
+        type=Path,
+        default=DURATIONS_FILE,
+        help="файл длительностей тестов для --shard (по умолчанию .test_durations в корне)",
+    )
+    group.addoption(
+        "--store-durations",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="дописать время каждого теста в этот файл длительностей",
+    )
+    group.addoption("--worker-index", type=int, default=None, help=argparse.SUPPRESS)
+    group.addoption("--worker-count", type=int, default=None, help=argparse.SUPPRESS)
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="запускать тесты с маркером benchmark",
+    )
+    group.addoption(
+        "--page-reuse",
+        action="store_true",
+        help="не перезагружать приложение между тестами, а сбрасывать его через роутер",
+    )
+    group.addoption(
+        "--profile-cache",
+        action="store_true",
+        help="запускать браузеры с копией профиля, прогретого загрузками текущего dist/assets",
+    )
+    group.addoption(
+        "--fill-mode",
+        choices=FILL_MODES,
+        default="keys",
+        help="keys — печатать в поля посимвольно, fast — ставить значение одним скриптом",
+    )
+    group.addoption(
+        "--wait-engine",
+        choices=ENGINES,
+        default="observer",
+        help="observer — ждать условия внутри страницы на MutationObserver, poll — WebDriverWait",
+    )
+    group.addoption(
+        "--contexts",
+        type=int,
+        default=0,
+        help="прогонять таблицы кейсов одновременно в N изолированных контекстах одного Chrome",
+    )
+    group.addoption(
+        "--reruns",
+        type=int,
+        default=0,
+        help="сколько раз сразу перезапускать упавший тест в том же браузере",
+    )
+    group.addoption(
+        "--flake-threshold",
+        type=float,
+        default=0.3,
+        help="доля нестабильных прогонов, после которой тест уходит в карантин (xfail)",
+    )
+    group.addoption(
+        "--quarantine",
+        action="store_true",
+        help="помечать xfail тесты, которые часто проходят только при перезапуске",
+    )
+    group.addoption(
+        "--result-cache",
+        action="store_true",
+        help="пропускать тесты, которые уже проходили с тем же dist/, кодом тестов, версией Chrome и режимом",
+    )
+    group.addoption(
+        "--invalidate-result-cache",
+        action="store_true",
+        help="игнорировать сохранённые результаты --result-cache и выполнить тесты заново",
+    )
+    group.addoption(
+        "--trace-spans",
+        type=Path,
+        default=None,
+        help="записывать интервалы шагов каждого теста в этот файл JSON Lines",
+    )
+    group.addoption(
+        "--trace-baseline",
+        type=Path,
+        default=None,
+        help="сравнить шаги с сохранённым файлом --trace-spans и показать регрессии",
+    )
+    group.addoption(
+        "--artifacts",
+        type=Path,
+        default=None,
+        help="сохранять в этот каталог последние шаги, DOM и скриншот упавших тестов",
+    )
+    group.addoption(
+        "--artifact-steps",
+        type=int,
+        default=DEFAULT_STEPS,
+        help="сколько последних шагов теста держать в памяти для --artifacts",
+    )
+    group.addoption(
+        "--memory-samples",
+        type=Path,
+        default=None,
+        help="после шагов page снимать кучу JS, узлы DOM, обработчики и RSS браузера в этот файл JSON Lines",
+    )
+    group.addoption(
+        "--leak-threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=VALUE",
+        help="рост метрики за тест, после которого он считается утечкой, например nodes=500",
+    )
+    group.addoption(
+        "--soak-cycles",
+        type=int,
+        default=200,
+        help="сколько циклов ввод → перевод → alert делать в soak-бенчмарке",
+    )
+    group.addoption(
+        "--visual",
+        action="store_true",
+        help="запускать визуальные тесты с маркером visual (нужны эталоны в visual_baselines/)",
+    )
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="перезаписать снимки-эталоны визуальных тестов (включает --visual)",
+    )
+    group.addoption(
+        "--visual-diffs",
+        type=Path,
+        default=Path("visual-diffs"),
+        help="куда класть actual.png и diff.png при визуальных расхождениях",
+    )
+    group.addoption(
+        "--perf-iterations",
+        type=int,
+        default=20,
+        help="сколько раз загружать приложение в бенчмарке фронтенда",
+    )
+    group.addoption(
+        "--perf-budget",
+        action="append",
+        default=[],
+        metavar="METRIC=MS",
+        help="бюджет p90 для метрики бенчмарка фронтенда, например first_render=800",
+    )
+    group.addoption(
+        "--validation-budget",
+        type=float,
+        default=form_state.DEFAULT_BUDGET,
+        help="сколько секунд ждать, пока форма покажет кнопку или ошибку",
+    )
+
+
+def pytest_configure(config):
+    form_state.DEFAULT_BUDGET = config.getoption("--validation-budget")
+
+    worker_index = config.getoption("--worker-index")
+    trace_path = config.getoption("--trace-spans")
+    if trace_path is not None:
+        config.pluginmanager.register(
+            TracingPlugin(trace_path, config.getoption("--trace-baseline"), worker_index),
+            "fbank-tracing",
+        )
+    shard = config.getoption("--shard")
+    if shard is not None:
+        durations = read_durations(config.getoption("--durations-path"))
+        config.pluginmanager.register(ShardSelector(*shard, durations), "fbank-shard")
+    store_durations = config.getoption("--store-durations")
+    if store_durations is not None and worker_index is None:
+        config.pluginmanager.register(DurationRecorder(store_durations), "fbank-durations")
+    memory_path = config.getoption("--memory-samples")
+    if memory_path is not None:
+        try:
+            thresholds = parse_thresholds(config.getoption("--leak-threshold"))
+        except ValueError as error:
+            raise pytest.UsageError(str(error)) from None
+        config.pluginmanager.register(
+            MemoryPlugin(memory_path, thresholds, worker_index), "fbank-memory"
+        )
+    if worker_index is not None:
+        config.pluginmanager.register(
+            WorkerSelector(worker_index, config.getoption("--worker-count")),
+            "fbank-worker",
+        )
+    else:
+        workers = worker_count(config.getoption("--workers"))
+        if workers > 1:
+            config.pluginmanager.register(
+                ParallelController(
+                    config,
+                    workers,
+                    own_servers=config.getoption("--serve") == "external"
+                    and config.getoption("--worker-servers"),
+                ),
+                "fbank-parallel",
+            )
+            # тесты и перезапуски выполняют воркеры
+            return
+    artifacts = config.getoption("--artifacts")
+    if artifacts is not None:
+        config.pluginmanager.register(
+            ArtifactPlugin(artifacts, config.getoption("--artifact-steps")), "fbank-artifacts"
+        )
+    config.pluginmanager.register(
+        RerunPlugin(
+            config,
+            reruns=config.getoption("--reruns"),
+            threshold=config.getoption("--flake-threshold"),
+            quarantine=config.getoption("--quarantine"),
+        ),
+        "fbank-reruns",
+    )
+    if config.getoption("--result-cache") or config.getoption("--invalidate-result-cache"):
+        if config.getoption("--serve") == "external":
+            # внешний сервер может отдавать не dist/, тогда ключ кэша ничего не гарантирует
+            return
+        config.pluginmanager.register(
+            ResultCachePlugin(config, invalidate=config.getoption("--invalidate-result-cache")),
+            "fbank-result-cache",
+        )
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Тесты с аргументом case_groups получают группы кейсов из CASE_GROUPS
+    своего модуля: по группе на тест или, с --contexts, все сразу.
+    """
+    if "case_groups" not in metafunc.fixturenames:
+        return
+    groups = metafunc.module.CASE_GROUPS
+    if metafunc.config.getoption("--contexts") > 0:
+        metafunc.parametrize("case_groups", [groups], ids=[f"{len(groups)}-groups-in-contexts"])
+    else:
+        metafunc.parametrize("case_groups", [[group] for group in groups], ids=map(group_id, groups))
+
+
+def pytest_collection_modifyitems(config, items):
+    enabled = {
+        "benchmark": config.getoption("--benchmark"),
+        # эталонов для платформы может не быть, поэтому визуальные тесты — по запросу
+        "visual": config.getoption("--visual") or config.getoption("--update-baselines"),
+    }
+    for marker, on in enabled.items():
+        if on:
+            continue
+        skip = pytest.mark.skip(reason=f"нужен --{marker}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter):
+    lines = TIMINGS.summary_lines()
+    if not lines:
+        return
+    terminalreporter.write_sep("-", "F-Bank timings")
+    for line in lines:
+        terminalreporter.write_line(line)
+    for savings in (form_state.savings_line(), soft_reset.savings_line()):
+        if savings is not None:
+            terminalreporter.write_line(savings)
+    histograms = TIMINGS.histogram_lines("wait.")
+    if histograms:
+        terminalreporter.write_sep("-", "F-Bank wait histograms")
+        for line in histograms:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig):
+    serve = pytestconfig.getoption("--serve")
+    if serve == "external":
+        yield pytestconfig.getoption("--base-url")
+        return
+    if serve == "intercept":
+        yield INTERCEPT_BASE_URL
+        return
+    server = None
+    if pytestconfig.getoption("--profile-cache"):
+        # кэши прогретого профиля действуют только для того же адреса
+        try:
+            server = StaticServer(port=stable_port(pytestconfig.getoption("--worker-index")))
+        except OSError:
+            pass
+    server = (server or StaticServer()).start()
+    yield server.url
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def chromedriver_path(pytestconfig) -> str:
+    return resolve_chromedriver(pytestconfig.getoption("--chromedriver")).path
+
+
+@pytest.fixture(scope="session")
+def profile_cache(pytestconfig, base_url):
+    if not pytestconfig.getoption("--profile-cache"):
+        yield None
+        return
+    profiles = ProfileCache(base_url, browser=chrome_version())
+    yield profiles
+    profiles.close()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig, chromedriver_path, profile_cache):
+    factory = partial(start_chrome, chromedriver_path)
+    if pytestconfig.getoption("--serve") == "intercept":
+        factory = partial(start_intercepting_chrome, chromedriver_path, BundleInterceptor())
+    if profile_cache is not None:
+        factory = warm_factory(factory, profile_cache)
+    pool = BrowserPool(
+        factory=factory,
+        size=pytestconfig.getoption("--browser-pool-size"),
+        max_uses=pytestconfig.getoption("--browser-max-uses"),
+        keep_page=pytestconfig.getoption("--page-reuse"),
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(request, browser_pool):
+    with browser_pool.lease() as driver:
+        if request.cls is not None:
+            request.cls.driver = driver
+        yield driver
+
+
+@pytest.fixture
+def page(request, pytestconfig, driver, base_url) -> TransferPage:
+    page = TransferPage(
+        driver,
+        base_url,
+        reuse=pytestconfig.getoption("--page-reuse"),
+        fill_mode=pytestconfig.getoption("--fill-mode"),
+        wait_engine=pytestconfig.getoption("--wait-engine"),
+    )
+    if request.cls is not None:
+        request.cls.page = page
+    return page
+
+
+@pytest.fixture
+def isolated_timings():
+    """Замеры поддельных драйверов не должны попадать в итоги F-Bank timings."""
+    with TIMINGS.isolated() as timings:
+        yield timings
+
+
+@pytest.fixture(scope="session")
+def visual(pytestconfig) -> VisualBaselines:
+    # шрифты и сглаживание отличаются между ОС, поэтому эталоны у каждой свои
+    return VisualBaselines(
+        BASELINE_DIR / sys.platform,
+        diffs=pytestconfig.getoption("--visual-diffs"),
+        update=pytestconfig.getoption("--update-baselines"),
+    )
+
+
+@pytest.fixture
+def run_case_groups(request, pytestconfig, base_url):
+    """Прогоняет группы кейсов на странице page или одновременно в контекстах браузера."""
+    contexts = pytestconfig.getoption("--contexts")
+    if contexts <= 0:
+        page = request.getfixturevalue("page")
+        return partial(run_groups, page)
+    driver = request.getfixturevalue("driver")
+    return partial(run_groups_in_contexts, driver, base_url, contexts=contexts)
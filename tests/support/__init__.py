@@ -0,0 +1 @@
+"""Общая инфраструктура UI-тестов F-Bank: браузеры, страницы, плагины."""
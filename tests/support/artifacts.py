@@ -0,0 +1,202 @@
+import base64
+import functools
+import json
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.stats import TIMINGS
+
+
+DEFAULT_STEPS = 20
+WRITERS = 2
+
+# outerHTML не содержит введённых значений, поэтому поля читаются отдельно
+CAPTURE_SCRIPT = """
+const fields = {};
+document.querySelectorAll('input').forEach((field, index) => {
+    fields[field.id || field.name || 'input-' + index] = field.value;
+});
+return {url: location.href, fields: fields, html: document.documentElement.outerHTML};
+"""
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass(frozen=True)
+class StepCapture:
+    step: str
+    at: float
+    url: str | None
+    fields: dict[str, str] | None
+    html: str | None
+    error: str | None = None
+
+
+class StepRecorder:
+    """
+    Кольцевой буфер последних состояний страницы в текущем тесте.
+
+    Перед каждым шагом, отмеченным @recorded, одним скриптом читаются
+    адрес, значения полей и DOM; в памяти остаются только steps
+    последних записей. Скриншоты и запись на диск здесь не делаются —
+    этим занимается ArtifactPlugin, и только для упавших тестов.
+    Пока запись выключена, шаги ничего не читают.
+    """
+
+    def __init__(self, steps: int = DEFAULT_STEPS):
+        self.enabled = False
+        self.buffer: deque[StepCapture] = deque(maxlen=steps)
+        self.driver: WebDriver | None = None
+        self.started = time.perf_counter()
+
+    def start(self, steps: int | None = None):
+        self.buffer = deque(maxlen=steps or self.buffer.maxlen)
+        self.driver = None
+        self.started = time.perf_counter()
+
+    def capture(self, driver: WebDriver, step: str) -> StepCapture:
+        started = time.perf_counter()
+        try:
+            raw = driver.execute_script(CAPTURE_SCRIPT)
+            capture = StepCapture(step, started - self.started, raw["url"], raw["fields"], raw["html"])
+        except WebDriverException as error:
+            capture = StepCapture(step, started - self.started, None, None, None, error.msg)
+        TIMINGS.record("capture.step", time.perf_counter() - started)
+        return capture
+
+    def record(self, driver: WebDriver, step: str):
+        self.driver = driver
+        self.buffer.append(self.capture(driver, step))
+
+
+RECORDER = StepRecorder()
+
+
+def recorded(step: str) -> Callable[[F], F]:
+    """Записывает состояние страницы перед шагом; у метода должен быть self.driver."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if RECORDER.enabled:
+                RECORDER.record(self.driver, step)
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _file_name(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text).strip("_")
+
+
+def artifact_dir(root: Path, nodeid: str, taken: Iterable[Path] = ()) -> Path:
+    """Каталог для теста; при повторном падении (перезапуск, старый прогон) — с суффиксом."""
+    name = _file_name(nodeid)
+    path, suffix = root / name, 1
+    while path.exists() or path in taken:
+        suffix += 1
+        path = root / f"{name}-{suffix}"
+    return path
+
+
+def write_artifacts(
+    path: Path, steps: list[StepCapture], final: StepCapture, screenshot: str | None
+) -> Path:
+    """Раскладывает записи упавшего теста по файлам; вызывается в фоновом потоке."""
+    path.mkdir(parents=True)
+    index = []
+    for number, capture in enumerate([*steps, final], 1):
+        entry = asdict(capture)
+        html = entry.pop("html")
+        if html is not None:
+            entry["html"] = f"{number:02d}-{_file_name(capture.step)}.html"
+            (path / entry["html"]).write_text(html, encoding="utf-8")
+        index.append(entry)
+    (path / "steps.json").write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+    if screenshot is not None:
+        (path / "screenshot.png").write_bytes(base64.b64decode(screenshot))
+    return path
+
+
+class ArtifactPlugin:
+    """
+    Сохраняет последние шаги, DOM и скриншот упавших тестов в root.
+
+    Пока тест идёт, шаги копятся в RECORDER. При падении в потоке
+    теста (пока браузер ещё не очищен) делаются только финальный снимок
+    и скриншот в base64, а декодирование PNG и запись файлов уходят в
+    пул потоков. В итогах выводится, сколько стоила запись одного шага.
+    """
+
+    def __init__(self, root: Path, steps: int = DEFAULT_STEPS):
+        self.root = root
+        self.steps = steps
+        self.executor = ThreadPoolExecutor(max_workers=WRITERS, thread_name_prefix="fbank-artifacts")
+        self.pending: dict[Path, Future] = {}
+        self.saved: dict[Path, str] = {}
+        self.test_seconds = 0.0
+
+    def pytest_configure(self, config):
+        RECORDER.enabled = True
+
+    def pytest_unconfigure(self, config):
+        RECORDER.enabled = False
+        self.executor.shutdown(wait=True)
+
+    def pytest_runtest_setup(self, item):
+        RECORDER.start(self.steps)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "call":
+            return
+        self.test_seconds += report.duration
+        if report.failed and RECORDER.driver is not None:
+            path = self.save(item.nodeid, RECORDER.driver)
+            report.sections.append(("fbank artifacts", str(path)))
+
+    def save(self, nodeid: str, driver: WebDriver) -> Path:
+        steps = list(RECORDER.buffer)
+        final = RECORDER.capture(driver, "failure")
+        try:
+            screenshot = driver.get_screenshot_as_base64()
+        except WebDriverException:
+            # например, открыт alert
+            screenshot = None
+        path = artifact_dir(self.root, nodeid, self.pending.keys())
+        self.pending[path] = self.executor.submit(write_artifacts, path, steps, final, screenshot)
+        self.saved[path] = nodeid
+        return path
+
+    def pytest_sessionfinish(self, session):
+        for future in self.pending.values():
+            future.result()
+        self.pending.clear()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        samples = TIMINGS.samples("capture.step")
+        if not samples:
+            return
+        terminalreporter.write_sep("-", f"F-Bank artifacts ({self.root})")
+        overhead = sum(samples)
+        share = overhead / self.test_seconds if self.test_seconds else 0.0
+        terminalreporter.write_line(
+            f"{len(samples)} steps captured, {overhead / len(samples) * 1000:.2f}ms per step, "
+            f"{overhead:.3f}s total ({share:.1%} of test time)"
+        )
+        for path, nodeid in self.saved.items():
+            terminalreporter.write_line(f"{nodeid}: {path}")
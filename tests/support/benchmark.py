@@ -0,0 +1,39 @@
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    samples: list[float]
+
+    def percentile(self, point: int) -> float:
+        if len(self.samples) == 1:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=100, method="inclusive")[point - 1]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def report(self) -> str:
+        return (
+            f"{self.name}: n={len(self.samples)} "
+            f"p50={self.percentile(50) * 1000:.2f}ms "
+            f"p90={self.percentile(90) * 1000:.2f}ms "
+            f"p99={self.percentile(99) * 1000:.2f}ms "
+            f"max={max(self.samples) * 1000:.2f}ms"
+        )
+
+
+def measure(name: str, action: Callable[[], object], iterations: int, warmup: int = 1) -> BenchmarkResult:
+    for _ in range(warmup):
+        action()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - started)
+    return BenchmarkResult(name=name, samples=samples)
@@ -0,0 +1,25 @@
+from selenium import webdriver
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+
+def chrome_options(bidi: bool = False, user_data_dir: str | None = None) -> ChromeOptions:
+    chrome_options = ChromeOptions()
+    chrome_options.enable_bidi = bidi
+    chrome_options.timeouts = {"script": 30_000}
+
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    if user_data_dir is not None:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    return chrome_options
+
+
+def start_chrome(
+    executable_path: str, bidi: bool = False, user_data_dir: str | None = None
+) -> webdriver.Chrome:
+    service = ChromeService(executable_path=executable_path)
+    return webdriver.Chrome(service=service, options=chrome_options(bidi, user_data_dir))
@@ -0,0 +1,142 @@
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.tracing import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+BLANK_PAGE = "about:blank"
+
+CLEAR_STORAGE_SCRIPT = """
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (e) {}
+"""
+
+
+@dataclass
+class PooledBrowser:
+    driver: WebDriver
+    uses: int = 0
+
+
+class BrowserPool:
+    """
+    Пул прогретых браузеров, которые переиспользуются между тестами.
+
+    После каждого теста браузер очищается (алерты, лишние вкладки, cookies,
+    storage, переход на пустую страницу). Если очистка не удалась или браузер
+    отработал max_uses тестов, он закрывается и при необходимости
+    запускается новый. С keep_page=True переход на пустую страницу
+    пропускается, чтобы следующий тест мог переиспользовать загруженное
+    приложение.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        size: int = 1,
+        max_uses: int = 50,
+        keep_page: bool = False,
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.keep_page = keep_page
+        self.launched = 0
+        self.recycled = 0
+        self._idle: list[PooledBrowser] = []
+        self._created = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def lease(self) -> Iterator[WebDriver]:
+        browser = self._acquire()
+        try:
+            yield browser.driver
+        finally:
+            self._release(browser)
+
+    def close(self):
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            self._discard(browser)
+
+    def _acquire(self) -> PooledBrowser:
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            with TRACER.span("browser.start"):
+                driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        self.launched += 1
+        return PooledBrowser(driver=driver)
+
+    def _release(self, browser: PooledBrowser):
+        browser.uses += 1
+        if browser.uses >= self.max_uses:
+            logger.info("recycling browser after %d uses", browser.uses)
+            self._discard(browser)
+            return
+        with TRACER.span("browser.reset"):
+            healthy = self._reset(browser.driver)
+        if not healthy:
+            logger.warning("browser failed health check, recycling")
+            self._discard(browser)
+            return
+        with self._condition:
+            self._idle.append(browser)
+            self._condition.notify()
+
+    def _discard(self, browser: PooledBrowser):
+        try:
+            browser.driver.quit()
+        except WebDriverException:
+            pass
+        with self._condition:
+            self._created -= 1
+            self.recycled += 1
+            self._condition.notify()
+
+    def _reset(self, driver: WebDriver) -> bool:
+        try:
+            self._dismiss_alert(driver)
+            self._close_extra_windows(driver)
+            driver.delete_all_cookies()
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            if not self.keep_page:
+                driver.get(BLANK_PAGE)
+            return driver.execute_script("return document.readyState") == "complete"
+        except WebDriverException:
+            return False
+
+    def _dismiss_alert(self, driver: WebDriver):
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+    def _close_extra_windows(self, driver: WebDriver):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
@@ -0,0 +1,255 @@
+import re
+from dataclasses import dataclass, field
+from itertools import groupby
+from pathlib import Path
+
+from selenium.common.exceptions import NoAlertPresentException
+
+from support.transfer_page import TransferPage, TransferSnapshot
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+DEFAULT_BALANCE = "33000"
+DEFAULT_RESERVED = "1000"
+VALID_CARD = "5559000000000000"
+
+CASE_HEADING = re.compile(r"^#{2,4}\s*\**\s*(TC-\d+)\s*[—–-]\s*(.+?)\s*\**\s*$", re.M)
+SECTION_LINE = re.compile(r"^\s*\*\*\s*(?P<label>[^*:()]+)\s*(?:\([^)]*\))?\s*:?\s*\**\s*:?\s*(?P<rest>.*)$")
+SECTIONS = {
+    "цель": "goal",
+    "предусловия": "preconditions",
+    "тестовые данные": "data",
+    "шаги": "steps",
+    "ожидаемый результат": "expected",
+}
+
+CARD_VALUE = re.compile(r"[Нн]омер[а-я ]* карты[^`\n]*`(\d[\d ]{10,24}\d)`")
+AMOUNT_LINE = re.compile(r"^[*|]\s*Сумма[^:|\n]*[:|]\s*(?P<value>[^|\n(]+)", re.M)
+AMOUNT_STEP = re.compile(
+    r"(?:[Вв]вести сумму|«Сумма перевода» значение)\s*[*`]*\s*(?P<value>-?\d[\d ,.]*)"
+)
+URL_PARAM = re.compile(r"\b(balance|reserved)=([^&\s)`]+)")
+TEXT_BALANCE = re.compile(r"[Бб]аланс(?:ом)?\s*[:=]?\s*(≥)?\s*(\d[\d ]*(?:[.,]\d+)?)")
+TEXT_RESERVED = re.compile(r"[Рр]езерв\s*[:=]\s*(\d[\d ]*(?:[.,]\d+)?)")
+FEE = re.compile(r"Комиссия\s*[=:]\s*[*`\s]*(\d[\d ]*)")
+MESSAGE = re.compile(r"`(Перевод [^`]+)`")
+NEW_BALANCE = re.compile(r"новое значение:\s*(\d[\d ]*)")
+REJECTED = re.compile(r"ошибк[аие](?! не)|неактивн|блокир|отклон|[Нн]едостаточно", re.I)
+ACCEPTED = re.compile(r"успешно|проходит|принят|кнопка \*\*«Перевести»\*\* активна|выполняется", re.I)
+
+
+@dataclass
+class MarkdownCase:
+    source: str
+    case_id: str
+    title: str
+    sections: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}/{self.case_id}"
+
+    def section(self, name: str) -> str:
+        return self.sections.get(name, "")
+
+
+@dataclass(frozen=True)
+class TransferCase:
+    key: str
+    title: str
+    currency: str
+    balance: str
+    reserved: str
+    card: str
+    amount: str | None
+    accepted: bool | None = None
+    fee: str | None = None
+    message: str | None = None
+    balance_after: str | None = None
+
+    @property
+    def precondition(self) -> tuple[str, str]:
+        return self.balance, self.reserved
+
+
+class NotCompilable(ValueError):
+    pass
+
+
+def parse_markdown(text: str, source: str) -> list[MarkdownCase]:
+    headings = list(CASE_HEADING.finditer(text))
+    cases = []
+    for index, heading in enumerate(headings):
+        end = headings[index + 1].start() if index + 1 < len(headings) else len(text)
+        case = MarkdownCase(source=source, case_id=heading.group(1), title=heading.group(2).strip("* "))
+        current = None
+        for line in text[heading.end():end].splitlines():
+            match = SECTION_LINE.match(line)
+            label = match.group("label").strip().lower() if match else ""
+            name = next((value for prefix, value in SECTIONS.items() if label.startswith(prefix)), None)
+            if name is not None:
+                current = name
+                line = match.group("rest")
+            if current is not None and line.strip() not in ("", "---"):
+                case.sections[current] = (case.sections.get(current, "") + "\n" + line.strip()).strip()
+        cases.append(case)
+    return cases
+
+
+def compile_case(case: MarkdownCase) -> TransferCase:
+    context = "\n".join((case.title, case.section("preconditions"), case.section("steps")))
+    data = "\n".join((case.section("data"), case.section("steps")))
+    expected = case.section("expected")
+
+    currency = "rub"
+    if re.search(r"доллар|USD|\$", context, re.I):
+        currency = "usd"
+    elif re.search(r"евро|EUR|€", context, re.I):
+        currency = "euro"
+
+    params = {name: value.rstrip(".,") for name, value in URL_PARAM.findall(context)}
+    balance = params.get("balance") or _balance(case.section("preconditions"))
+    reserved = params.get("reserved") or _number(TEXT_RESERVED, case.section("preconditions"))
+    if currency != "rub":
+        balance = reserved = None
+
+    amounts = [match.group("value") for match in AMOUNT_LINE.finditer(case.section("data"))]
+    if not amounts:
+        amounts = [match.group("value") for match in AMOUNT_STEP.finditer(case.section("steps"))]
+    amounts = list(dict.fromkeys(_clean_amount(amount) for amount in amounts))
+    if len(amounts) > 1:
+        raise NotCompilable(f"несколько сумм в одном кейсе: {amounts}")
+
+    card = CARD_VALUE.search(data)
+    if card is None and not amounts:
+        raise NotCompilable("в кейсе не вводятся ни карта, ни сумма")
+    rejected, accepted = REJECTED.search(expected), ACCEPTED.search(expected)
+    if rejected and accepted:
+        raise NotCompilable("ожидаемый результат описывает и успех, и ошибку")
+
+    compiled = TransferCase(
+        key=case.key,
+        title=case.title,
+        currency=currency,
+        balance=balance or DEFAULT_BALANCE,
+        reserved=reserved or (DEFAULT_RESERVED if balance is None else "0"),
+        card=card.group(1).replace(" ", "") if card else VALID_CARD,
+        amount=amounts[0] if amounts else None,
+        accepted=False if rejected else True if accepted else None,
+        fee=_number(FEE, expected),
+        message=MESSAGE.search(expected).group(1) if MESSAGE.search(expected) else None,
+        balance_after=_number(NEW_BALANCE, expected),
+    )
+    if (compiled.accepted, compiled.fee, compiled.message, compiled.balance_after) == (None,) * 4:
+        raise NotCompilable("в ожидаемом результате нет проверяемых полей формы")
+    return compiled
+
+
+def _number(pattern: re.Pattern, text: str) -> str | None:
+    match = pattern.search(text)
+    return match.group(1).replace(" ", "") if match else None
+
+
+def _balance(text: str) -> str | None:
+    match = TEXT_BALANCE.search(text)
+    if match is None:
+        return None
+    balance = match.group(2).replace(" ", "")
+    if match.group(1):
+        # «баланс ≥ N» — нижняя граница, берём запас не меньше баланса по умолчанию
+        balance = str(max(float(balance.replace(",", ".")), float(DEFAULT_BALANCE))).removesuffix(".0")
+    return balance
+
+
+def _clean_amount(value: str) -> str:
+    value = re.sub(r"[*`₽$€]", "", value)
+    value = re.sub(r"\(.*", "", value)
+    return value.strip().rstrip(".")
+
+
+def load_cases(root: Path = ROOT_DIR) -> tuple[list[TransferCase], dict[str, str]]:
+    """Компилирует test_cases_*.md; возвращает кейсы и причины пропуска остальных."""
+    compiled, skipped = [], {}
+    for path in sorted(root.glob("test_cases_*.md")):
+        source = path.stem.removeprefix("test_cases_")
+        for case in parse_markdown(path.read_text(encoding="utf-8"), source):
+            try:
+                compiled.append(compile_case(case))
+            except NotCompilable as reason:
+                skipped[case.key] = str(reason)
+    return compiled, skipped
+
+
+def group_by_precondition(cases: list[TransferCase]) -> list[list[TransferCase]]:
+    ordered = sorted(cases, key=lambda case: (case.precondition, case.key))
+    return [list(group) for _, group in groupby(ordered, key=lambda case: case.precondition)]
+
+
+def check_state(case: TransferCase, state: TransferSnapshot) -> list[str]:
+    """Сверяет заполненную форму с ожиданиями кейса."""
+    problems = []
+    if case.fee is not None and state.fee != case.fee:
+        problems.append(f"комиссия {state.fee!r}, ожидалась {case.fee!r}")
+    if case.accepted is not None and state.send_button_clickable != case.accepted:
+        problems.append(
+            "кнопка «Перевести» " + ("неактивна" if case.accepted else "активна")
+        )
+    if case.accepted is False and state.amount is not None and state.error is None:
+        problems.append("нет сообщения об ошибке")
+    return problems
+
+
+def needs_send(case: TransferCase, state: TransferSnapshot) -> bool:
+    return bool(case.message or case.balance_after) and state.send_button_clickable
+
+
+def check_sent(case: TransferCase, alert: str, balance: str | None) -> list[str]:
+    problems = []
+    if case.message is not None and alert != case.message:
+        problems.append(f"сообщение {alert!r}, ожидалось {case.message!r}")
+    if case.balance_after is not None and balance != case.balance_after:
+        problems.append(f"баланс {balance!r}, ожидался {case.balance_after!r}")
+    return problems
+
+
+def run_case(page: TransferPage, case: TransferCase) -> list[str]:
+    """Прогоняет кейс на уже открытой странице и возвращает расхождения."""
+    try:
+        page.driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+    {"rub": page.enable_rubles, "usd": page.enable_dollars, "euro": page.enable_euro}[case.currency]()
+    page.card_input(case.card, clear=True)
+    if len(case.card) >= 16:
+        # страница общая для группы: сумму предыдущего кейса надо стереть, даже если своей нет;
+        # одну очистку поля без ввода React не замечает, поэтому пустую сумму ставит скрипт
+        page.amount_input(case.amount or "", mode=None if case.amount else "fast")
+
+    state = page.snapshot()
+    problems = check_state(case, state)
+    if needs_send(case, state):
+        page.send_money(page.element("send_button"))
+        alert = page.get_alert()
+        problems += check_sent(case, alert, page.snapshot().balance)
+    return problems
+
+
+def run_groups(page: TransferPage, groups: list[list[TransferCase]]) -> dict[str, list[str]]:
+    """Группы подряд на одной странице: одна загрузка на группу."""
+    failures = {}
+    for cases in groups:
+        page.open(balance=cases[0].balance, reserved=cases[0].reserved)
+        for case in cases:
+            problems = run_case(page, case)
+            if problems:
+                failures[f"{case.key} {case.title}"] = problems
+    return failures
+
+
+def group_id(cases: list[TransferCase]) -> str:
+    return f"balance={cases[0].balance}&reserved={cases[0].reserved}"
+
+
+def format_failures(failures: dict[str, list[str]]) -> str:
+    return "\n".join(f"{key}: {'; '.join(problems)}" for key, problems in failures.items())
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from support.tracing import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+ENV_DRIVER_PATH = "CHROMEDRIVER_PATH"
+ENV_CACHE_DIR = "FBANK_CACHE_DIR"
+
+DRIVER_NAME = "chromedriver.exe" if sys.platform == "win32" else "chromedriver"
+
+CHROME_CANDIDATES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+class ChromedriverNotFound(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class Resolution:
+    path: str
+    source: str
+    seconds: float
+
+
+def cache_dir() -> Path:
+    default = Path.home() / ".cache" / "fbank-tests"
+    return Path(os.environ.get(ENV_CACHE_DIR, default))
+
+
+def parse_major(output: str) -> int | None:
+    match = VERSION_PATTERN.search(output)
+    return int(match.group(1)) if match else None
+
+
+def run_version(binary: str) -> str:
+    try:
+        result = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout
+
+
+def chrome_version() -> str | None:
+    """Версия установленного Chrome без обращения к сети."""
+    if sys.platform == "win32":
+        return _chrome_version_from_registry()
+    for candidate in CHROME_CANDIDATES:
+        binary = shutil.which(candidate) or (candidate if os.path.exists(candidate) else None)
+        if binary is None:
+            continue
+        match = VERSION_PATTERN.search(run_version(binary))
+        if match:
+            return match.group(0)
+    return None
+
+
+def _chrome_version_from_registry() -> str | None:
+    import winreg
+
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def sha256_of(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_driver(major: int) -> Path | None:
+    """Драйвер из локального кэша, если его содержимое совпадает с манифестом."""
+    folder = cache_dir() / "chromedriver" / str(major)
+    binary = folder / DRIVER_NAME
+    manifest = folder / "manifest.json"
+    if not binary.exists() or not manifest.exists():
+        return None
+    expected = json.loads(manifest.read_text(encoding="utf-8")).get("sha256")
+    if expected != sha256_of(binary):
+        logger.warning("cached chromedriver %s failed checksum, ignoring", binary)
+        return None
+    return binary
+
+
+def store_in_cache(source: str, major: int) -> Path:
+    folder = cache_dir() / "chromedriver" / str(major)
+    folder.mkdir(parents=True, exist_ok=True)
+    binary = folder / DRIVER_NAME
+    shutil.copy2(source, binary)
+    manifest = {"sha256": sha256_of(binary), "source": source}
+    (folder / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return binary
+
+
+def resolve_chromedriver(override: str | None = None) -> Resolution:
+    """
+    Находит chromedriver один раз за сессию.
+
+    Порядок: явный путь (опция или CHROMEDRIVER_PATH), проверенный кэш,
+    PATH с совпадающей мажорной версией. Сеть (webdriver-manager)
+    используется только если ничего не найдено, результат кладётся в кэш.
+    """
+    started = time.perf_counter()
+    with TRACER.span("chromedriver.resolve"):
+        path, source = _resolve(override or os.environ.get(ENV_DRIVER_PATH))
+    resolution = Resolution(path=path, source=source, seconds=time.perf_counter() - started)
+    logger.info(
+        "chromedriver resolved from %s in %.3fs: %s",
+        resolution.source, resolution.seconds, resolution.path,
+    )
+    return resolution
+
+
+def _resolve(override: str | None) -> tuple[str, str]:
+    if override:
+        if not os.path.isfile(override):
+            raise ChromedriverNotFound(f"chromedriver override does not exist: {override}")
+        return override, "override"
+
+    major = parse_major(chrome_version() or "")
+    if major is not None:
+        cached = cached_driver(major)
+        if cached is not None:
+            return str(cached), "cache"
+
+    on_path = shutil.which(DRIVER_NAME)
+    if on_path is not None:
+        driver_major = parse_major(run_version(on_path))
+        if major is None or driver_major == major:
+            if major is not None:
+                store_in_cache(on_path, major)
+            return on_path, "path"
+        logger.warning(
+            "chromedriver on PATH is %s, Chrome is %s, skipping", driver_major, major
+        )
+
+    try:
+        downloaded = ChromeDriverManager().install()
+    except Exception as error:
+        raise ChromedriverNotFound(
+            f"no chromedriver for Chrome {major} in {ENV_DRIVER_PATH}, "
+            f"{cache_dir()} or PATH, and download failed: {error}"
+        ) from error
+    if major is not None:
+        store_in_cache(downloaded, major)
+    return downloaded, "download"
@@ -0,0 +1,199 @@
+import json
+import urllib.request
+from contextlib import asynccontextmanager
+
+import trio
+from selenium.webdriver.common.bidi import cdp
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support import locators
+from support.cases import TransferCase, check_sent, check_state, needs_send
+from support.readiness import READY_SCRIPT
+from support.transfer_page import (
+    FAST_FILL_SCRIPT,
+    SNAPSHOT_SCRIPT,
+    TransferSnapshot,
+    parse_snapshot,
+)
+
+
+CURRENCY_CARDS = {"rub": "rubles_card", "usd": "dollars_card", "euro": "euro_card"}
+
+
+def devtools_endpoint(driver: WebDriver) -> tuple[str, str]:
+    """Websocket DevTools браузера и мажорная версия Chrome для выбора модуля devtools."""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urllib.request.urlopen(f"http://{address}/json/version") as response:
+        info = json.load(response)
+    return info["webSocketDebuggerUrl"], info["Browser"].split("/")[1].split(".")[0]
+
+
+def _call(script: str, *args: str) -> str:
+    """Выражение, которое выполняет тело execute_script-скрипта; args — выражения JS."""
+    return f"(function() {{{script}}}).apply(null, [{', '.join(args)}])"
+
+
+def _call_async(script: str, *args: str) -> str:
+    """То же для execute_async_script: последним аргументом передаётся resolve промиса."""
+    return f"new Promise((done) => {_call(script, *args, 'done')})"
+
+
+def _query(name: str) -> str:
+    return f"document.querySelector({json.dumps(locators.locator(name).value)})"
+
+
+class ContextPage:
+    """
+    Страница перевода в отдельном контексте браузера (как инкогнито:
+    свои cookies и storage). Управляется напрямую по CDP, без WebDriver,
+    поэтому несколько таких страниц работают одновременно.
+    """
+
+    def __init__(self, session, devtools, base_url: str, timeout: float = 10):
+        self.session = session
+        self.devtools = devtools
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.currency: str | None = None
+
+    async def evaluate(self, expression: str, await_promise: bool = False):
+        result, exception = await self.session.execute(
+            self.devtools.runtime.evaluate(
+                expression, return_by_value=True, await_promise=await_promise
+            )
+        )
+        if exception is not None:
+            raise RuntimeError(exception.text)
+        return result.value
+
+    async def open(self, balance: str, reserved: str):
+        url = f"{self.base_url}/?balance={balance}&reserved={reserved}"
+        await self.session.execute(self.devtools.page.navigate(url))
+        deadline = trio.current_time() + self.timeout
+        # evaluate может попасть в старый документ, пока новый не подключён
+        while await self._evaluate_or_none(f"location.href !== {json.dumps(url)}") is not False:
+            if trio.current_time() > deadline:
+                raise TimeoutError(f"{url} did not load in {self.timeout}s")
+            await trio.sleep(0.01)
+        ready = await self.evaluate(
+            _call_async(READY_SCRIPT, str(int(self.timeout * 1000))), await_promise=True
+        )
+        if not ready["ready"]:
+            raise TimeoutError(f"app did not render #rub-sum within {self.timeout}s")
+        self.currency = None
+
+    async def _evaluate_or_none(self, expression: str):
+        try:
+            return await self.evaluate(expression)
+        except (RuntimeError, cdp.BrowserError):
+            return None
+
+    async def enable(self, currency: str):
+        await self.evaluate(f"{_query(CURRENCY_CARDS[currency])}.click()")
+        self.currency = currency
+
+    async def fill(self, name: str, text: str) -> str:
+        script = _call(FAST_FILL_SCRIPT, _query(name), json.dumps(text), "false")
+        return (await self.evaluate(script)).replace(" ", "")
+
+    async def snapshot(self) -> TransferSnapshot:
+        raw = await self.evaluate(_call(SNAPSHOT_SCRIPT, json.dumps(locators.FORM)))
+        return parse_snapshot(raw, self.currency)
+
+    async def send_money(self) -> str:
+        """Нажимает «Перевести» и принимает alert; возвращает его текст."""
+        # закрытый канал selenium сам отписывает от событий
+        with self.session.listen(self.devtools.page.JavascriptDialogOpening) as dialogs:
+            async with trio.open_nursery() as nursery:
+                # alert блокирует страницу, поэтому клик и ответ на диалог идут параллельно
+                nursery.start_soon(self.evaluate, f"{_query('send_button')}.click()")
+                with trio.fail_after(self.timeout):
+                    dialog = await dialogs.receive()
+                await self.session.execute(
+                    self.devtools.page.handle_java_script_dialog(accept=True)
+                )
+        return dialog.message
+
+
+async def run_case(page: ContextPage, case: TransferCase) -> list[str]:
+    await page.enable(case.currency)
+    await page.fill("card_number", case.card)
+    if len(case.card) >= 16:
+        # вкладка общая для группы: сумму предыдущего кейса надо стереть, даже если своей нет
+        await page.fill("amount", case.amount or "")
+    state = await page.snapshot()
+    problems = check_state(case, state)
+    if needs_send(case, state):
+        alert = await page.send_money()
+        problems += check_sent(case, alert, (await page.snapshot()).balance)
+    return problems
+
+
+@asynccontextmanager
+async def open_page(
+    connection, devtools, base_url: str, context_id=None, new_window: bool = False
+):
+    """Новая вкладка (или окно) в контексте context_id, по умолчанию — в общем контексте браузера."""
+    target_id = await connection.execute(
+        devtools.target.create_target(
+            "about:blank", browser_context_id=context_id, new_window=new_window or None
+        )
+    )
+    try:
+        session = await connection.connect_session(target_id)
+        await session.execute(devtools.page.enable())
+        yield ContextPage(session, devtools, base_url)
+    finally:
+        await connection.execute(devtools.target.close_target(target_id))
+
+
+@asynccontextmanager
+async def isolated_page(connection, devtools, base_url: str):
+    """Новый контекст браузера с одной вкладкой; после работы контекст удаляется."""
+    context_id = await connection.execute(
+        devtools.target.create_browser_context(dispose_on_detach=True)
+    )
+    try:
+        async with open_page(connection, devtools, base_url, context_id) as page:
+            yield page
+    finally:
+        await connection.execute(devtools.target.dispose_browser_context(context_id))
+
+
+async def _run_groups(
+    driver: WebDriver, base_url: str, groups: list[list[TransferCase]], contexts: int
+) -> dict[str, list[str]]:
+    url, version = devtools_endpoint(driver)
+    devtools = cdp.import_devtools(version)
+    failures: dict[str, list[str]] = {}
+    send, receive = trio.open_memory_channel(len(groups))
+    for cases in groups:
+        send.send_nowait(cases)
+    send.close()
+
+    async def worker(connection):
+        async with isolated_page(connection, devtools, base_url) as page:
+            async for cases in receive:
+                await page.open(cases[0].balance, cases[0].reserved)
+                for case in cases:
+                    problems = await run_case(page, case)
+                    if problems:
+                        failures[f"{case.key} {case.title}"] = problems
+
+    async with cdp.open_cdp(url) as connection:
+        async with trio.open_nursery() as nursery:
+            for _ in range(min(contexts, len(groups))):
+                nursery.start_soon(worker, connection)
+    return failures
+
+
+def run_groups_in_contexts(
+    driver: WebDriver, base_url: str, groups: list[list[TransferCase]], contexts: int = 4
+) -> dict[str, list[str]]:
+    """
+    Прогоняет группы кейсов одновременно в contexts изолированных
+    контекстах одного Chrome. Каждый контекст берёт следующую группу из
+    общей очереди, открывает страницу один раз на группу и проверяет
+    её кейсы. Возвращает расхождения, как cases.run_groups.
+    """
+    return trio.run(_run_groups, driver, base_url, groups, contexts)
@@ -0,0 +1,95 @@
+import time
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.locators import FORM
+from support.stats import TIMINGS
+
+
+# Сколько тесты ждали отсутствующий элемент до появления этого модуля.
+LEGACY_TIMEOUT = 10
+
+DEFAULT_BUDGET = 1.0
+
+POLL_INTERVAL = 0.02
+
+VALIDATION_STATE_SCRIPT = """
+const form = document.querySelector(arguments[0]);
+if (!form) {
+    return {form: false, amount: false, button: false, error: false};
+}
+const inputs = form.querySelectorAll(':scope > input');
+const button = form.querySelector(':scope > button');
+const error = form.querySelector(':scope > span:nth-of-type(2)');
+const visible = (el) => !!el && el.getClientRects().length > 0;
+return {
+    form: true,
+    amount: inputs.length > 1,
+    button: visible(button) && !button.disabled,
+    error: visible(error),
+};
+"""
+
+
+@dataclass(frozen=True)
+class ValidationState:
+    form_visible: bool
+    amount_visible: bool
+    button_clickable: bool
+    error_visible: bool
+    seconds: float
+
+    @property
+    def settled(self) -> bool:
+        """
+        Состояние формы известно: формы или поля суммы нет вовсе
+        (кнопка не может появиться), либо уже отрисована ровно одна
+        из двух веток — кнопка «Перевести» или сообщение об ошибке.
+        """
+        if not self.form_visible or not self.amount_visible:
+            return True
+        return self.button_clickable != self.error_visible
+
+
+def read_validation_state(driver: WebDriver, budget: float | None = None) -> ValidationState:
+    budget = DEFAULT_BUDGET if budget is None else budget
+    started = time.perf_counter()
+    while True:
+        raw = driver.execute_script(VALIDATION_STATE_SCRIPT, FORM)
+        state = ValidationState(
+            form_visible=raw["form"],
+            amount_visible=raw["amount"],
+            button_clickable=raw["button"],
+            error_visible=raw["error"],
+            seconds=time.perf_counter() - started,
+        )
+        if state.settled or state.seconds >= budget:
+            TIMINGS.record("form_state.settle", state.seconds)
+            return state
+        time.sleep(POLL_INTERVAL)
+
+
+def is_send_button_clickable(driver: WebDriver, budget: float | None = None) -> bool:
+    state = read_validation_state(driver, budget)
+    if not state.button_clickable:
+        TIMINGS.record("form_state.absent", state.seconds)
+    return state.button_clickable
+
+
+def is_error_message_shown(driver: WebDriver, budget: float | None = None) -> bool:
+    state = read_validation_state(driver, budget)
+    if not state.error_visible:
+        TIMINGS.record("form_state.absent", state.seconds)
+    return state.error_visible
+
+
+def savings_line() -> str | None:
+    absent = TIMINGS.samples("form_state.absent")
+    if not absent:
+        return None
+    saved = LEGACY_TIMEOUT * len(absent) - sum(absent)
+    return (
+        f"negative checks: {len(absent)} settled in {sum(absent):.2f}s, "
+        f"~{saved:.0f}s saved vs {LEGACY_TIMEOUT}s timeouts"
+    )
@@ -0,0 +1,144 @@
+import posixpath
+
+from selenium.common.exceptions import TimeoutException
+
+from support import locators
+from support.benchmark import BenchmarkResult
+from support.transfer_page import TransferPage
+
+
+# Бюджеты по p90 в миллисекундах; переопределяются опцией --perf-budget
+DEFAULT_BUDGETS_MS = {
+    "navigation.ttfb": 200,
+    "navigation.dom_content_loaded": 1000,
+    "navigation.load": 1500,
+    "bundle.download": 500,
+    "script.duration": 500,
+    "first_render": 1500,
+    "input_to_fee": 100,
+}
+
+NAVIGATION_TIMING_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const report = () => setTimeout(() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const bundle = performance.getEntriesByType('resource')
+        .find((entry) => entry.name.endsWith('.js'));
+    done({
+        ttfb: nav.responseStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        bundle: bundle ? bundle.name : null,
+        bundle_download: bundle ? bundle.responseEnd - bundle.startTime : null,
+    });
+}, 0);
+if (document.readyState === 'complete') {
+    report();
+} else {
+    window.addEventListener('load', report, {once: true});
+}
+"""
+
+ARM_INPUT_LATENCY_SCRIPT = """
+const field = document.querySelector(arguments[0]);
+const fee = document.getElementById('comission');
+const latency = window.__fbankLatency = {keydown: null, changed: null};
+const stamp = () => { latency.keydown = performance.now(); };
+field.addEventListener('keydown', stamp, {capture: true, once: true});
+const observer = new MutationObserver(() => {
+    latency.changed = performance.now();
+    observer.disconnect();
+});
+observer.observe(fee, {childList: true, subtree: true, characterData: true});
+"""
+
+READ_INPUT_LATENCY_SCRIPT = """
+const [timeout, done] = [arguments[0], arguments[arguments.length - 1]];
+const started = performance.now();
+const poll = () => {
+    const latency = window.__fbankLatency;
+    if (latency.changed !== null && latency.keydown !== null) {
+        done(latency.changed - latency.keydown);
+    } else if (performance.now() - started > timeout) {
+        done(null);
+    } else {
+        requestAnimationFrame(poll);
+    }
+};
+poll();
+"""
+
+
+def measure_load(
+    page: TransferPage, balance: int = 33000, reserved: int = 1000
+) -> tuple[str, dict[str, float]]:
+    """
+    Одна загрузка index.html: тайминги навигации, работа скриптов по
+    CDP Performance.getMetrics, первая отрисовка приложения и задержка
+    от нажатия клавиши в поле суммы до обновления #comission.
+    Возвращает имя бандла и метрики в секундах.
+    """
+    driver = page.driver
+    driver.execute_cdp_cmd("Performance.disable", {})
+    driver.execute_cdp_cmd("Performance.enable", {})
+    first_render = page.navigate(page.url(balance, reserved))
+    timing = driver.execute_async_script(NAVIGATION_TIMING_SCRIPT)
+    metrics = {
+        metric["name"]: metric["value"]
+        for metric in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    }
+
+    page.enable_rubles()
+    page.card_input("5559000000000000", clear=True)
+    amount = page.element("amount")
+    driver.execute_script(ARM_INPUT_LATENCY_SCRIPT, locators.locator("amount").value)
+    amount.send_keys("5")
+    latency = driver.execute_async_script(READ_INPUT_LATENCY_SCRIPT, page.timeout * 1000)
+    if latency is None:
+        raise TimeoutException("#comission did not change after typing into the amount field")
+
+    samples = {
+        "navigation.ttfb": timing["ttfb"] / 1000,
+        "navigation.dom_content_loaded": timing["dom_content_loaded"] / 1000,
+        "navigation.load": timing["load"] / 1000,
+        "script.duration": metrics["ScriptDuration"],
+        "first_render": first_render,
+        "input_to_fee": latency / 1000,
+    }
+    if timing["bundle_download"] is not None:
+        samples["bundle.download"] = timing["bundle_download"] / 1000
+    return posixpath.basename(timing["bundle"] or "") or "unknown bundle", samples
+
+
+def run(page: TransferPage, iterations: int) -> tuple[str, dict[str, BenchmarkResult]]:
+    collected: dict[str, list[float]] = {}
+    bundle = "unknown bundle"
+    for _ in range(iterations):
+        bundle, samples = measure_load(page)
+        for name, seconds in samples.items():
+            collected.setdefault(name, []).append(seconds)
+    return bundle, {name: BenchmarkResult(name, samples) for name, samples in collected.items()}
+
+
+def parse_budgets(values: list[str]) -> dict[str, float]:
+    """--perf-budget first_render=800 → {"first_render": 800.0} поверх DEFAULT_BUDGETS_MS."""
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for value in values:
+        name, _, limit = value.partition("=")
+        if name not in DEFAULT_BUDGETS_MS or not limit:
+            raise ValueError(
+                f"unknown budget {value!r}, expected one of {sorted(DEFAULT_BUDGETS_MS)}"
+            )
+        budgets[name] = float(limit)
+    return budgets
+
+
+def exceeded(
+    results: dict[str, BenchmarkResult], budgets: dict[str, float], point: int = 90
+) -> list[str]:
+    lines = []
+    for name, result in sorted(results.items()):
+        value = result.percentile(point) * 1000
+        if name in budgets and value > budgets[name]:
+            lines.append(f"{name}: p{point}={value:.1f}ms > {budgets[name]:.0f}ms")
+    return lines
@@ -0,0 +1,267 @@
+import random
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from decimal import Decimal
+
+from support.cases import TransferCase
+from support.oracle import (
+    FIXED_ACCOUNTS,
+    TransferInput,
+    Verdict,
+    available,
+    check,
+    max_amount,
+    parse_amount,
+)
+
+
+RUB_PRECONDITIONS = [("33000", "1000"), ("1100", "0"), ("10000", "0")]
+CURRENCIES = ("rub", "usd", "euro")
+CARD_KINDS = ("valid", "short", "long")
+
+# Для каждого вида суммы — ожидаемый ответ оракула при валидной карте
+AMOUNT_KINDS = {
+    "integer": True,
+    "comma": True,
+    "dot": True,
+    "near_limit": True,
+    "over_limit": False,
+    "spaced": None,
+    "three_decimals": False,
+    "leading_zero": False,
+    "zero": False,
+    "negative": False,
+    "garbage": False,
+}
+
+# Известные расхождения приложения (dist/) со спецификацией. Кейсы, исход
+# которых они меняют, сверяются отдельно как xfail, чтобы не прятать новые.
+KNOWN_DIVERGENCES = {
+    "amount_format": "из суммы выбрасывается всё, кроме цифр и минуса в начале (12,34 → 1234)",
+    "rub_balance": "для долларов и евро сумма сверяется с рублёвым счётом",
+    "fee_tens": "комиссия округляется вниз до десятков: floor(сумма / 100) * 10",
+    "strict_limit": "сумма с комиссией, равная доступному остатку, отклоняется",
+    "long_card": "номер карты обрезается до 17 цифр, и 17 цифр принимаются",
+}
+
+
+@dataclass(frozen=True)
+class FuzzCase:
+    stratum: tuple[str, str, str]
+    transfer: TransferInput
+    verdict: Verdict
+
+
+@dataclass
+class FuzzReport:
+    cases: list[FuzzCase]
+    seconds: float
+    violations: dict[str, list[FuzzCase]] = field(default_factory=dict)
+
+    @property
+    def rate(self) -> float:
+        return len(self.cases) / self.seconds if self.seconds else float("inf")
+
+    def summary(self) -> str:
+        strata = len({case.stratum for case in self.cases})
+        return (
+            f"fuzz: {len(self.cases)} cases in {self.seconds:.2f}s ({self.rate:.0f}/s), "
+            f"{strata} strata, {sum(map(len, self.violations.values()))} violations"
+        )
+
+
+def _card(rng: random.Random, kind: str) -> str:
+    length = {"valid": 16, "short": rng.randint(1, 15), "long": rng.randint(17, 20)}[kind]
+    return str(rng.randint(1, 9)) + "".join(rng.choices("0123456789", k=length - 1))
+
+
+def _amount(rng: random.Random, kind: str, limit: Decimal) -> str:
+    top = max(1, max_amount(limit))
+    whole = rng.randint(1, top)
+    if kind == "integer":
+        return str(whole)
+    if kind in ("comma", "dot"):
+        # дробная часть добавляет меньше рубля, берём целую с запасом на комиссию
+        whole = max(1, rng.randint(1, top) - 1)
+        return f"{whole}{',' if kind == 'comma' else '.'}{rng.randint(0, 99):0{rng.choice((1, 2))}d}"
+    if kind == "near_limit":
+        return str(max(1, top - rng.randint(0, 2)))
+    if kind == "over_limit":
+        return str(top + rng.randint(1, 1000))
+    if kind == "spaced":
+        return f"{rng.randint(1000, 999_999):,}".replace(",", " ")
+    if kind == "three_decimals":
+        return f"{whole},{rng.randint(0, 999):03d}"
+    if kind == "leading_zero":
+        return "0" * rng.randint(1, 3) + str(whole)
+    if kind == "zero":
+        return rng.choice(("0", "0,00", "0.0", "00"))
+    if kind == "negative":
+        return f"-{whole}"
+    return rng.choice(("abc", "12a", "1e3", "1,2,3", "--5", "", " "))
+
+
+def generate(rng: random.Random) -> FuzzCase:
+    currency = rng.choice(CURRENCIES)
+    balance, reserved = rng.choice(RUB_PRECONDITIONS)
+    card_kind = rng.choice(CARD_KINDS)
+    amount_kind = rng.choice(list(AMOUNT_KINDS))
+    limit = available(currency, balance, reserved)
+    transfer = TransferInput(
+        currency=currency,
+        balance=balance,
+        reserved=reserved,
+        card=_card(rng, card_kind),
+        amount=_amount(rng, amount_kind, limit),
+    )
+    # с невалидной картой вид суммы на результат не влияет
+    stratum = (currency, card_kind, amount_kind if card_kind == "valid" else "any")
+    return FuzzCase(stratum, transfer, check(transfer))
+
+
+def violations(case: FuzzCase) -> list[str]:
+    """Свойства, которые оракул обязан соблюдать на любом входе."""
+    transfer, verdict = case.transfer, case.verdict
+    problems = []
+    if verdict.accepted and not verdict.card_valid:
+        problems.append("accepted with invalid card")
+    if verdict.accepted and verdict.amount + verdict.fee > available(
+        transfer.currency, transfer.balance, transfer.reserved
+    ):
+        problems.append("accepted over the available balance")
+    if verdict.fee is not None and not (verdict.fee <= verdict.amount / 10 < verdict.fee + 1):
+        problems.append("fee is not floor(amount * 10%)")
+    unspaced = replace(transfer, amount=transfer.amount.replace(" ", ""))
+    if " " in transfer.amount and check(unspaced) != verdict:
+        problems.append("thousand separators change the verdict")
+    currency, card_kind, amount_kind = case.stratum
+    expected = AMOUNT_KINDS.get(amount_kind)
+    if card_kind == "valid" and expected is not None and verdict.accepted != expected:
+        problems.append(f"{amount_kind} amount must be {'accepted' if expected else 'rejected'}")
+    if card_kind != "valid" and verdict.accepted:
+        problems.append(f"{card_kind} card accepted")
+    return problems
+
+
+def fuzz(count: int = 10_000, seed: int = 0) -> FuzzReport:
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    cases = [generate(rng) for _ in range(count)]
+    found: dict[str, list[FuzzCase]] = defaultdict(list)
+    for case in cases:
+        for problem in violations(case):
+            found[problem].append(case)
+    return FuzzReport(cases=cases, seconds=time.perf_counter() - started, violations=dict(found))
+
+
+def stratified_sample(cases: list[FuzzCase], per_stratum: int = 1, seed: int = 0) -> list[FuzzCase]:
+    strata: dict[tuple[str, str, str], list[FuzzCase]] = defaultdict(list)
+    for case in cases:
+        strata[case.stratum].append(case)
+    rng = random.Random(seed)
+    sample = []
+    for stratum in sorted(strata):
+        members = strata[stratum]
+        sample.extend(rng.sample(members, min(per_stratum, len(members))))
+    return sample
+
+
+def boundary_cases() -> list[FuzzCase]:
+    """Границы: ровно доступный остаток, на рубль больше, округление комиссии, длина карты."""
+    card = "5559000000000000"
+    accounts = [("rub", balance, reserved) for balance, reserved in RUB_PRECONDITIONS]
+    accounts += [(currency, *RUB_PRECONDITIONS[0]) for currency in FIXED_ACCOUNTS]
+    inputs = []
+    for currency, balance, reserved in accounts:
+        top = max_amount(available(currency, balance, reserved))
+        for kind, amount in (("limit", str(top)), ("limit+1", str(top + 1))):
+            inputs.append(((currency, "valid", kind), card, amount, balance, reserved))
+    balance, reserved = RUB_PRECONDITIONS[0]
+    for amount in ("9,99", "10", "99", "1234,56", "0,01", "12,34", "12,345"):
+        inputs.append((("rub", "valid", f"fee {amount}"), card, amount, balance, reserved))
+    for length in (15, 16, 17):
+        inputs.append((("rub", f"card {length}", "any"), card[:1] * length, "100", balance, reserved))
+    cases = []
+    for stratum, card_number, amount, balance, reserved in inputs:
+        transfer = TransferInput(stratum[0], balance, reserved, card_number, amount)
+        cases.append(FuzzCase(stratum, transfer, check(transfer)))
+    return cases
+
+
+def differential_sample(count: int = 10_000, per_stratum: int = 1, seed: int = 0) -> list[FuzzCase]:
+    """Небольшая выборка для сверки с браузером: по per_stratum из каждой страты и все границы."""
+    return stratified_sample(fuzz(count, seed).cases, per_stratum, seed) + boundary_cases()
+
+
+def app_amount(text: str) -> int:
+    """Сумма, как её разбирает приложение."""
+    digits = re.sub(r"\D", "", text)
+    return int(digits or 0) * (-1 if text.startswith("-") else 1)
+
+
+def app_outcome(transfer: TransferInput) -> tuple[bool, int | None]:
+    """
+    Что приложение показывает для заполненной формы: активна ли кнопка
+    «Перевести» и комиссия; None — форма суммы не показана.
+    """
+    if len(re.sub(r"\D", "", transfer.card)[:17]) < 16:
+        return False, None
+    amount = app_amount(transfer.amount)
+    fee = amount // 100 * 10
+    limit = available("rub", transfer.balance, transfer.reserved)
+    return limit - fee - amount > 0, fee
+
+
+def known_divergences(case: FuzzCase) -> list[str]:
+    """
+    Ключи KNOWN_DIVERGENCES, из-за которых приложение покажет для кейса
+    не то, что оракул; пусто, если исходы совпадают или расхождение
+    ничем известным не объясняется.
+    """
+    transfer, verdict = case.transfer, case.verdict
+    accepted, app_fee = app_outcome(transfer)
+    fee_checked = verdict.card_valid and verdict.fee is not None
+    if accepted == verdict.accepted and (not fee_checked or app_fee == verdict.fee):
+        return []
+    amount = parse_amount(transfer.amount)
+    same_amount = amount is not None and amount == app_amount(transfer.amount)
+    reasons = []
+    if not same_amount:
+        reasons.append("amount_format")
+    if transfer.currency != "rub":
+        reasons.append("rub_balance")
+    if same_amount and fee_checked and app_fee != verdict.fee:
+        reasons.append("fee_tens")
+    limit = available("rub", transfer.balance, transfer.reserved)
+    if same_amount and app_fee is not None and amount + app_fee == limit:
+        reasons.append("strict_limit")
+    if len(re.sub(r"\D", "", transfer.card)) > 16:
+        reasons.append("long_card")
+    return reasons
+
+
+def to_transfer_case(case: FuzzCase) -> TransferCase:
+    transfer, verdict = case.transfer, case.verdict
+    known = "".join(f"; {KNOWN_DIVERGENCES[reason]}" for reason in known_divergences(case))
+    return TransferCase(
+        key="/".join(case.stratum),
+        title=f"{transfer.amount!r} на {transfer.card}{known}",
+        currency=transfer.currency,
+        balance=transfer.balance,
+        reserved=transfer.reserved,
+        card=transfer.card,
+        amount=transfer.amount,
+        accepted=verdict.accepted,
+        fee=str(verdict.fee) if verdict.card_valid and verdict.fee is not None else None,
+    )
+
+
+def differential_cases(known: bool, seed: int = 0) -> list[TransferCase]:
+    """Кейсы выборки для браузера: без известных расхождений (known=False) или только с ними."""
+    return [
+        to_transfer_case(case)
+        for case in differential_sample(seed=seed)
+        if bool(known_divergences(case)) == known
+    ]
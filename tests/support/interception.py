@@ -0,0 +1,93 @@
+import base64
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from selenium.webdriver.common.bidi.common import command_builder
+from selenium.webdriver.common.bidi.network import Request
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.browser import start_chrome
+from support.static_server import DIST_DIR, load_assets
+
+
+INTERCEPT_BASE_URL = "http://localhost:8000"
+
+
+@dataclass(frozen=True)
+class CannedResponse:
+    status: int
+    reason: str
+    headers: list[dict]
+    body: dict
+
+
+def header(name: str, value: str) -> dict:
+    return {"name": name, "value": {"type": "string", "value": value}}
+
+
+NOT_FOUND = CannedResponse(
+    status=404,
+    reason="Not Found",
+    headers=[header("Content-Type", "text/plain")],
+    body={"type": "string", "value": ""},
+)
+
+
+class BundleInterceptor:
+    """
+    Отдаёт dist/ прямо внутри Chrome, без сокетов и серверов.
+
+    Запросы к base_url перехватываются через WebDriver BiDi
+    (network.addIntercept) и сразу получают готовый ответ
+    (network.provideResponse) из заранее закодированной копии в памяти.
+    """
+
+    def __init__(self, base_url: str = INTERCEPT_BASE_URL):
+        parts = urlsplit(base_url)
+        self.url_pattern = {
+            "type": "pattern",
+            "protocol": parts.scheme,
+            "hostname": parts.hostname,
+            "port": str(parts.port or 80),
+        }
+        self.responses = {
+            path: CannedResponse(
+                status=200,
+                reason="OK",
+                headers=[
+                    header("Content-Type", asset.content_type),
+                    header("Cache-Control", asset.cache_control),
+                    header("ETag", asset.etag),
+                ],
+                body={"type": "base64", "value": base64.b64encode(asset.body).decode("ascii")},
+            )
+            for path, asset in load_assets(DIST_DIR).items()
+        }
+
+    def install(self, driver: WebDriver):
+        driver.network.add_request_handler(
+            "before_request", self._fulfil, url_patterns=[self.url_pattern]
+        )
+
+    def _fulfil(self, request: Request):
+        response = self.responses.get(urlsplit(request.url).path, NOT_FOUND)
+        request.network.conn.execute(
+            command_builder(
+                "network.provideResponse",
+                {
+                    "request": request.request_id,
+                    "statusCode": response.status,
+                    "reasonPhrase": response.reason,
+                    "headers": response.headers,
+                    "body": response.body,
+                },
+            )
+        )
+
+
+def start_intercepting_chrome(
+    executable_path: str, interceptor: BundleInterceptor, user_data_dir: str | None = None
+) -> WebDriver:
+    driver = start_chrome(executable_path, bidi=True, user_data_dir=user_data_dir)
+    interceptor.install(driver)
+    return driver
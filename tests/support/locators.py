@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+
+from selenium.webdriver.common.by import By
+
+
+@dataclass(frozen=True)
+class Locator:
+    """
+    Локатор элемента страницы перевода.
+
+    query — быстрый способ поиска (id или CSS относительно #root),
+    xpath — исходный абсолютный XPath, оставлен для сравнения в бенчмарке.
+    """
+
+    name: str
+    by: str
+    value: str
+    xpath: str
+
+    @property
+    def query(self) -> tuple[str, str]:
+        return self.by, self.value
+
+
+LOCATORS: dict[str, Locator] = {}
+
+
+def register(name: str, by: str, value: str, xpath: str) -> Locator:
+    if name in LOCATORS:
+        raise ValueError(f"locator {name!r} is already registered")
+    LOCATORS[name] = Locator(name=name, by=by, value=value, xpath=xpath)
+    return LOCATORS[name]
+
+
+def locator(name: str) -> Locator:
+    return LOCATORS[name]
+
+
+CARDS = "#root > div > div > div:nth-of-type(1)"
+FORM = "#root > div > div > div:nth-of-type(2)"
+
+RUBLES_CARD = register(
+    "rubles_card", By.CSS_SELECTOR, f"{CARDS} > div:nth-of-type(1) > div",
+    '//*[@id="root"]/div/div/div[1]/div[1]/div',
+)
+DOLLARS_CARD = register(
+    "dollars_card", By.CSS_SELECTOR, f"{CARDS} > div:nth-of-type(2) > div",
+    '//*[@id="root"]/div/div/div[1]/div[2]/div',
+)
+EURO_CARD = register(
+    "euro_card", By.CSS_SELECTOR, f"{CARDS} > div:nth-of-type(3) > div",
+    '//*[@id="root"]/div/div/div[1]/div[3]/div',
+)
+CARD_NUMBER = register(
+    "card_number", By.CSS_SELECTOR, f"{FORM} > input:nth-of-type(1)",
+    '//*[@id="root"]/div/div/div[2]/input',
+)
+AMOUNT = register(
+    "amount", By.CSS_SELECTOR, f"{FORM} > input:nth-of-type(2)",
+    '//*[@id="root"]/div/div/div[2]/input[2]',
+)
+SEND_BUTTON = register(
+    "send_button", By.CSS_SELECTOR, f"{FORM} > button > span",
+    '//*[@id="root"]/div/div/div[2]/button/span',
+)
+ERROR_MESSAGE = register(
+    "error_message", By.CSS_SELECTOR, f"{FORM} > span:nth-of-type(2)",
+    '//*[@id="root"]/div/div/div[2]/span[2]',
+)
+FEE = register("fee", By.ID, "comission", '//*[@id="comission"]')
+RUBLE_BALANCE = register("ruble_balance", By.ID, "rub-sum", '//*[@id="rub-sum"]')
+RUBLE_RESERVE = register("ruble_reserve", By.ID, "rub-reserved", '//*[@id="rub-reserved"]')
@@ -0,0 +1,228 @@
+import functools
+import json
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.procmem import browser_rss
+from support.stats import TIMINGS
+
+
+# Метрика семпла → имя в Performance.getMetrics
+CDP_METRICS = {"js_heap": "JSHeapUsedSize", "nodes": "Nodes", "listeners": "JSEventListeners"}
+
+# Рост от первого окна к последнему, после которого ряд считается утечкой
+DEFAULT_THRESHOLDS = {"js_heap": 2 * 2**20, "nodes": 200, "listeners": 50, "rss": 100 * 2**20}
+
+# Ряд делится на WINDOWS окон; минимум окна отсекает пилу сборщика мусора
+WINDOWS = 5
+MIN_SAMPLES = 2 * WINDOWS
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    test: str | None
+    step: str
+    at: float
+    js_heap: float
+    nodes: int
+    listeners: int
+    rss: int | None
+
+
+def leak(values: list[float], threshold: float) -> float | None:
+    """
+    Рост ряда, если он монотонный и больше threshold, иначе None.
+
+    Монотонность проверяется по минимумам окон: в куче JS значения
+    скачут между сборками мусора, а минимум окна растёт, только если
+    растёт то, что сборщик освободить не может.
+    """
+    if len(values) < MIN_SAMPLES:
+        return None
+    size = len(values) / WINDOWS
+    minima = [min(values[round(i * size) : round((i + 1) * size)]) for i in range(WINDOWS)]
+    if any(later < earlier for earlier, later in zip(minima, minima[1:])):
+        return None
+    growth = minima[-1] - minima[0]
+    return growth if growth > threshold else None
+
+
+def leaks(samples: list[MemorySample], thresholds: dict[str, float]) -> list[str]:
+    series: dict[str, list[MemorySample]] = defaultdict(list)
+    for sample in samples:
+        series[sample.test].append(sample)
+    lines = []
+    for test, points in series.items():
+        for metric, threshold in sorted(thresholds.items()):
+            values = [getattr(point, metric) for point in points]
+            if None in values:
+                continue
+            growth = leak(values, threshold)
+            if growth is not None:
+                lines.append(
+                    f"{test}: {metric} +{format_value(metric, growth)} over {len(values)} samples"
+                )
+    return lines
+
+
+def rss_unavailable(samples: list[MemorySample]) -> str | None:
+    """Строка для итогов, если RSS снять не удалось: без неё утечки RSS молча не проверяются."""
+    missing = sum(sample.rss is None for sample in samples)
+    if not missing:
+        return None
+    return (
+        f"rss unavailable in {missing} of {len(samples)} samples "
+        "(install psutil from requirements.txt), rss leaks not checked"
+    )
+
+
+def format_value(metric: str, value: float) -> str:
+    if metric in ("js_heap", "rss"):
+        return f"{value / 2**20:.1f} MB"
+    return f"{value:.0f}"
+
+
+def parse_thresholds(values: list[str]) -> dict[str, float]:
+    """--leak-threshold nodes=500 → {"nodes": 500.0, ...} поверх DEFAULT_THRESHOLDS."""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for value in values:
+        name, _, limit = value.partition("=")
+        if name not in DEFAULT_THRESHOLDS or not limit:
+            raise ValueError(
+                f"unknown leak threshold {value!r}, expected one of {sorted(DEFAULT_THRESHOLDS)}"
+            )
+        thresholds[name] = float(limit)
+    return thresholds
+
+
+class MemorySampler:
+    """
+    Снимает память страницы после шагов, отмеченных @sampled.
+
+    Один семпл — одна команда Performance.getMetrics (куча JS, число
+    узлов DOM и обработчиков событий) и RSS процессов браузера из
+    support.procmem, без снимка кучи. Пока семплирование выключено,
+    шаги ничего не делают.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.rss = True
+        self.test: str | None = None
+        self.samples: list[MemorySample] = []
+        self.started = time.perf_counter()
+        self._sessions: set[str] = set()
+
+    def sample(self, driver: WebDriver, step: str) -> MemorySample:
+        started = time.perf_counter()
+        if driver.session_id not in self._sessions:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            self._sessions.add(driver.session_id)
+        metrics = {
+            metric["name"]: metric["value"]
+            for metric in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        }
+        sample = MemorySample(
+            self.test,
+            step,
+            started - self.started,
+            js_heap=metrics[CDP_METRICS["js_heap"]],
+            nodes=int(metrics[CDP_METRICS["nodes"]]),
+            listeners=int(metrics[CDP_METRICS["listeners"]]),
+            rss=browser_rss(driver) if self.rss else None,
+        )
+        self.samples.append(sample)
+        TIMINGS.record("memory.sample", time.perf_counter() - started)
+        return sample
+
+
+SAMPLER = MemorySampler()
+
+
+def sampled(step: str) -> Callable[[F], F]:
+    """Снимает память после шага; у метода должен быть self.driver."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
+            if SAMPLER.enabled:
+                SAMPLER.sample(self.driver, step)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def write_samples(path: Path, samples: list[MemorySample]):
+    with open(path, "a", encoding="utf-8") as file:
+        for sample in samples:
+            file.write(json.dumps(asdict(sample), ensure_ascii=False) + "\n")
+
+
+def read_samples(path: Path) -> list[MemorySample]:
+    with open(path, encoding="utf-8") as file:
+        return [MemorySample(**json.loads(line)) for line in file if line.strip()]
+
+
+class MemoryPlugin:
+    """
+    Пишет ряды памяти каждого теста в JSON Lines и выводит тесты, где
+    память монотонно растёт дальше порогов. В воркерах параллельного
+    запуска файл получает суффикс .w<номер>, главный процесс сливает их.
+    """
+
+    def __init__(
+        self, path: Path, thresholds: dict[str, float], worker_index: int | None = None
+    ):
+        self.path = path
+        if worker_index is not None:
+            self.path = path.with_name(f"{path.stem}.w{worker_index}{path.suffix}")
+        self.thresholds = thresholds
+        self.worker = worker_index is not None
+
+    def pytest_configure(self, config):
+        self.path.unlink(missing_ok=True)
+        SAMPLER.samples = []
+        SAMPLER.enabled = True
+
+    def pytest_unconfigure(self, config):
+        SAMPLER.enabled = False
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        SAMPLER.test = item.nodeid
+        SAMPLER.started = time.perf_counter()
+        yield
+        SAMPLER.test = None
+
+    def pytest_sessionfinish(self, session):
+        write_samples(self.path, SAMPLER.samples)
+        if self.worker:
+            return
+        for part in sorted(self.path.parent.glob(f"{self.path.stem}.w*{self.path.suffix}")):
+            samples = read_samples(part)
+            write_samples(self.path, samples)
+            SAMPLER.samples.extend(samples)
+            part.unlink()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not SAMPLER.samples:
+            return
+        found = leaks(SAMPLER.samples, self.thresholds)
+        terminalreporter.write_sep("-", f"F-Bank memory ({self.path}): {len(found)} leaks")
+        for line in found:
+            terminalreporter.write_line(line)
+        unavailable = rss_unavailable(SAMPLER.samples)
+        if unavailable:
+            terminalreporter.write_line(unavailable)
@@ -0,0 +1,90 @@
+import re
+from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal
+
+# Правила перевода по спецификации (test_cases_*.md), без браузера.
+
+FEE_RATE = Decimal("0.1")
+CARD_LENGTH = 16
+
+# Счета в долларах и евро в приложении фиксированы, рублёвый задаётся в URL
+FIXED_ACCOUNTS = {
+    "usd": (Decimal(100), Decimal(0)),
+    "euro": (Decimal(300), Decimal(26)),
+}
+
+AMOUNT_FORMAT = re.compile(r"^(?:[1-9]\d*|0(?=[.,]))(?:[.,]\d{1,2})?$")
+
+
+@dataclass(frozen=True)
+class TransferInput:
+    currency: str
+    balance: str
+    reserved: str
+    card: str
+    amount: str
+
+    @property
+    def precondition(self) -> tuple[str, str]:
+        return self.balance, self.reserved
+
+
+@dataclass(frozen=True)
+class Verdict:
+    card_valid: bool
+    amount: Decimal | None
+    fee: int | None
+    accepted: bool
+    reason: str | None = None
+
+
+def parse_amount(text: str) -> Decimal | None:
+    """
+    Сумма перевода: пробелы между разрядами допустимы, дробная часть —
+    через запятую или точку, не больше двух знаков, без ведущих нулей.
+    """
+    text = text.replace(" ", "")
+    if not AMOUNT_FORMAT.match(text):
+        return None
+    amount = Decimal(text.replace(",", "."))
+    return amount if amount > 0 else None
+
+
+def fee(amount: Decimal) -> int:
+    """Комиссия 10%, округлённая вниз до целого: 1234,56 → 123."""
+    return int((amount * FEE_RATE).to_integral_value(rounding=ROUND_FLOOR))
+
+
+def account(currency: str, balance: str, reserved: str) -> tuple[Decimal, Decimal]:
+    if currency in FIXED_ACCOUNTS:
+        return FIXED_ACCOUNTS[currency]
+    return Decimal(balance.replace(",", ".")), Decimal(reserved.replace(",", "."))
+
+
+def available(currency: str, balance: str, reserved: str) -> Decimal:
+    balance_value, reserved_value = account(currency, balance, reserved)
+    return balance_value - reserved_value
+
+
+def max_amount(limit: Decimal) -> int:
+    """Наибольшая целая сумма, которая вместе с комиссией укладывается в limit."""
+    amount = int(limit * 10 / 11)
+    while amount + 1 + fee(Decimal(amount + 1)) <= limit:
+        amount += 1
+    while amount > 0 and amount + fee(Decimal(amount)) > limit:
+        amount -= 1
+    return amount
+
+
+def check(transfer: TransferInput) -> Verdict:
+    card_valid = re.fullmatch(r"\d{%d}" % CARD_LENGTH, transfer.card.replace(" ", "")) is not None
+    amount = parse_amount(transfer.amount)
+    if amount is None:
+        return Verdict(card_valid, None, None, False, "сумма в неверном формате")
+    amount_fee = fee(amount)
+    if not card_valid:
+        return Verdict(card_valid, amount, amount_fee, False, "номер карты не из 16 цифр")
+    limit = available(transfer.currency, transfer.balance, transfer.reserved)
+    if amount + amount_fee > limit:
+        return Verdict(card_valid, amount, amount_fee, False, "недостаточно средств")
+    return Verdict(card_valid, amount, amount_fee, True)
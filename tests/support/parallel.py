@@ -0,0 +1,226 @@
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from _pytest.reports import TestReport
+
+
+DIST_DIR = Path(__file__).resolve().parents[2] / "dist"
+
+# Серверы воркеров слушают только этот адрес; base_url строится с ним же
+SERVER_HOST = "127.0.0.1"
+
+
+def group_key(nodeid: str) -> str:
+    """Тесты одного класса (или модуля) всегда попадают к одному воркеру."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+def worker_buckets(nodeids: list[str], workers: int) -> list[list[str]]:
+    groups: dict[str, list[str]] = {}
+    for nodeid in nodeids:
+        groups.setdefault(group_key(nodeid), []).append(nodeid)
+    buckets: list[list[str]] = [[] for _ in range(workers)]
+    for key in sorted(groups, key=lambda key: (-len(groups[key]), key)):
+        smallest = min(range(workers), key=lambda index: (len(buckets[index]), index))
+        buckets[smallest].extend(groups[key])
+    return buckets
+
+
+def junit_address(nodeid: str) -> tuple[str, str]:
+    names = nodeid.split("::")
+    names[0] = re.sub(r"\.py$", "", names[0].replace("/", "."))
+    return ".".join(names[:-1]), names[-1]
+
+
+def strip_option(args: list[str], option: str) -> list[str]:
+    stripped = []
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+        elif arg == option:
+            skip_value = True
+        elif not arg.startswith(f"{option}="):
+            stripped.append(arg)
+    return stripped
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((SERVER_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((SERVER_HOST, port), timeout=0.2):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+@dataclass
+class Worker:
+    index: int
+    junit: Path
+    log: Path
+    process: subprocess.Popen | None = None
+    server: subprocess.Popen | None = None
+
+
+class WorkerSelector:
+    """Оставляет воркеру только его долю тестов."""
+
+    def __init__(self, index: int, count: int):
+        self.index = index
+        self.count = count
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        mine = set(worker_buckets([item.nodeid for item in items], self.count)[self.index])
+        selected = [item for item in items if item.nodeid in mine]
+        deselected = [item for item in items if item.nodeid not in mine]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+class ParallelController:
+    """
+    Запускает тесты в нескольких процессах pytest.
+
+    Каждый воркер получает те же аргументы плюс --worker-index, сам
+    собирает тесты и оставляет свою долю (классы целиком). Результаты
+    воркеров читаются из их JUnit XML и публикуются в этом процессе как
+    обычные отчёты, поэтому итоговая сводка и код возврата общие.
+    """
+
+    def __init__(self, config, workers: int, own_servers: bool):
+        self.config = config
+        self.workers = workers
+        self.own_servers = own_servers
+        self.workdir = Path(tempfile.mkdtemp(prefix="fbank-parallel-"))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly or not session.items:
+            return None
+        workers = [
+            Worker(index, self.workdir / f"worker-{index}.xml", self.workdir / f"worker-{index}.log")
+            for index in range(self.workers)
+        ]
+        try:
+            for worker in workers:
+                self._start(worker)
+            for worker in workers:
+                worker.process.wait()
+        finally:
+            for worker in workers:
+                if worker.server is not None:
+                    worker.server.terminate()
+        self._publish(session, workers)
+        return True
+
+    def _start(self, worker: Worker):
+        args = strip_option(list(self.config.invocation_params.args), "--workers")
+        args = strip_option(args, "--junitxml")
+        args += [
+            f"--worker-index={worker.index}",
+            f"--worker-count={self.workers}",
+            f"--junitxml={worker.junit}",
+        ]
+        if self.own_servers:
+            port = free_port()
+            worker.server = subprocess.Popen(
+                [sys.executable, "-m", "http.server", str(port), "--bind", SERVER_HOST],
+                cwd=DIST_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            wait_for_port(port)
+            args = strip_option(args, "--base-url") + [f"--base-url=http://{SERVER_HOST}:{port}"]
+        with open(worker.log, "wb") as log:
+            worker.process = subprocess.Popen(
+                [sys.executable, "-m", "pytest", *args],
+                cwd=self.config.invocation_params.dir,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=os.environ.copy(),
+            )
+
+    def _publish(self, session, workers: list[Worker]):
+        results = {}
+        for worker in workers:
+            if worker.junit.exists():
+                results.update(read_junit(worker.junit))
+        for item in session.items:
+            outcome, longrepr, duration = results.get(
+                junit_address(item.nodeid),
+                ("failed", "воркер не вернул результат, см. лог воркера", 0.0),
+            )
+            reason = longrepr
+            if outcome == "skipped":
+                path, lineno, _ = item.location
+                longrepr = (str(path), (lineno or 0) + 1, longrepr)
+            elif outcome == "xfailed":
+                longrepr = None
+            report = TestReport(
+                nodeid=item.nodeid,
+                location=item.location,
+                keywords={name: 1 for name in item.keywords},
+                outcome="skipped" if outcome == "xfailed" else outcome,
+                longrepr=longrepr,
+                when="call",
+                duration=duration,
+            )
+            if outcome == "xfailed":
+                # так xfail отмечает плагин skipping: итоги и junitxml покажут XFAIL, а не SKIPPED
+                report.wasxfail = reason
+            # session.testsfailed считает сам pytest_runtest_logreport сессии
+            item.ihook.pytest_runtest_logreport(report=report)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", f"parallel: {self.workers} workers")
+        for log in sorted(self.workdir.glob("worker-*.log")):
+            lines = log.read_text(encoding="utf-8", errors="replace").strip().splitlines()
+            terminalreporter.write_line(f"{log.name}: {lines[-1] if lines else 'нет вывода'}")
+
+
+def read_junit(path: Path) -> dict[tuple[str, str], tuple[str, str | None, float]]:
+    results = {}
+    for case in ET.parse(path).getroot().iter("testcase"):
+        key = (case.get("classname", ""), case.get("name", ""))
+        duration = float(case.get("time", 0) or 0)
+        problem = case.find("failure")
+        if problem is None:
+            problem = case.find("error")
+        skipped = case.find("skipped")
+        if problem is not None:
+            results[key] = ("failed", problem.text or problem.get("message", ""), duration)
+        elif key in results and results[key][0] == "failed":
+            continue
+        elif skipped is not None:
+            # junitxml пишет xfail как <skipped type="pytest.xfail">
+            outcome = "xfailed" if skipped.get("type") == "pytest.xfail" else "skipped"
+            results[key] = (outcome, skipped.get("message", ""), duration)
+        else:
+            results[key] = ("passed", None, duration)
+    return results
+
+
+def worker_count(value: str) -> int:
+    return (os.cpu_count() or 1) if value == "auto" else int(value)
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+PROC = Path("/proc")
+
+
+def _children_from_proc() -> dict[int, list[int]]:
+    children: dict[int, list[int]] = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            # поле comm может содержать пробелы и скобки, ppid — второе после последней «)»
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+    return children
+
+
+def _rss_from_proc(pid: int) -> int:
+    try:
+        for line in (PROC / str(pid) / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def tree_rss(pid: int) -> int | None:
+    """
+    Суммарный RSS процесса и всех его потомков в байтах.
+
+    Через psutil, если он установлен, иначе из /proc (Linux); на
+    остальных системах без psutil возвращает None.
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root, *root.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return total
+    if not PROC.is_dir() or not (PROC / str(pid)).exists():
+        return None
+    children = _children_from_proc()
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss_from_proc(current)
+        pending.extend(children.get(current, []))
+    return total
+
+
+def browser_rss(driver: WebDriver) -> int | None:
+    """RSS chromedriver вместе со всеми процессами Chrome, которые он запустил."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return tree_rss(process.pid) if process is not None else None
+
+
+def megabytes(value: int | None) -> str:
+    return "n/a" if value is None else f"{value / 2**20:.0f} MB"
@@ -0,0 +1,147 @@
+import json
+import re
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.chromedriver import cache_dir, parse_major
+from support.readiness import wait_app_ready
+from support.result_cache import digest_files
+from support.static_server import DIST_DIR
+from support.stats import TIMINGS
+
+
+# Меняется, когда меняется способ прогрева: старые профили тогда не подходят
+PROFILE_VERSION = 1
+
+# Код скрипта попадает в кэш V8 не с первой загрузки, а когда скрипт «горячий»
+SEED_VISITS = 3
+
+# Кэши Chrome привязаны к URL, поэтому --serve=memory с профилем слушает постоянный порт
+STABLE_PORT = 18765
+
+MARKER = "fbank-profile.json"
+PUBLISH_ATTEMPTS = 10
+
+# Файлы блокировки запущенного Chrome: в копию профиля их переносить нельзя
+LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+
+def assets_digest(assets: Path = DIST_DIR / "assets") -> str:
+    return digest_files((path for path in assets.rglob("*") if path.is_file()), assets)
+
+
+def origin_slug(base_url: str) -> str:
+    return re.sub(r"[^\w]+", "-", base_url.split("://", 1)[-1]).strip("-")
+
+
+class ProfileCache:
+    """
+    Прогретый профиль Chrome для адреса base_url.
+
+    Профиль один раз заполняется загрузками приложения (HTTP-кэш бандла
+    и стилей, кэш скомпилированного кода V8) и лежит в
+    <кэш>/profiles/<ключ>; ключ включает версию формата, мажорную
+    версию Chrome, адрес и хэш dist/assets/, так что после пересборки
+    бандла или обновления Chrome профиль прогревается заново, а старые
+    профили того же адреса удаляются. Chrome не умеет делить один
+    user-data-dir между процессами, поэтому каждый браузер получает
+    свою копию (clone).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        browser: str | None = None,
+        root: Path | None = None,
+        assets: Path = DIST_DIR / "assets",
+    ):
+        self.base_url = base_url
+        self.root = root or cache_dir() / "profiles"
+        self.origin = origin_slug(base_url)
+        major = parse_major(browser or "") or "unknown"
+        self.key = f"v{PROFILE_VERSION}-chrome{major}-{self.origin}-{assets_digest(assets)[:16]}"
+        self.path = self.root / self.key
+        self.clones = Path(tempfile.mkdtemp(prefix="fbank-profiles-"))
+
+    @property
+    def ready(self) -> bool:
+        return (self.path / MARKER).exists()
+
+    def seed(self, factory: Callable[[str], WebDriver]) -> Path:
+        """Прогревает профиль, если его ещё нет; factory запускает Chrome с user-data-dir."""
+        if self.ready:
+            return self.path
+        started = time.perf_counter()
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f"{self.key}.", suffix=".tmp", dir=self.root))
+        driver = factory(str(staging))
+        try:
+            for _ in range(SEED_VISITS):
+                driver.get(self.base_url)
+                wait_app_ready(driver)
+                driver.get("about:blank")
+        finally:
+            # кэши сбрасываются на диск при штатном закрытии браузера
+            driver.quit()
+        (staging / MARKER).write_text(
+            json.dumps({"key": self.key, "base_url": self.base_url, "seeded": time.time()}),
+            encoding="utf-8",
+        )
+        self._publish(staging)
+        self.prune()
+        TIMINGS.record("profile.seed", time.perf_counter() - started)
+        return self.path
+
+    def _publish(self, staging: Path):
+        for _ in range(PUBLISH_ATTEMPTS):
+            try:
+                staging.rename(self.path)
+                return
+            except OSError:
+                if self.ready:
+                    # профиль уже прогрел параллельный воркер
+                    shutil.rmtree(staging, ignore_errors=True)
+                    return
+                # на Windows закрытый Chrome ещё какое-то время держит файлы профиля
+                time.sleep(0.5)
+        shutil.rmtree(staging, ignore_errors=True)
+        raise RuntimeError(f"could not move seeded profile to {self.path}")
+
+    def prune(self):
+        """Удаляет профили этого адреса с другим ключом и брошенные заготовки."""
+        for path in self.root.glob(f"v*-{self.origin}-*"):
+            if path.name != self.key and not path.name.startswith(f"{self.key}."):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def clone(self) -> str:
+        """Копия прогретого профиля для одного браузера; удаляется в close()."""
+        started = time.perf_counter()
+        target = Path(tempfile.mkdtemp(dir=self.clones)) / "profile"
+        shutil.copytree(self.path, target, ignore=shutil.ignore_patterns(*LOCK_FILES))
+        TIMINGS.record("profile.clone", time.perf_counter() - started)
+        return str(target)
+
+    def close(self):
+        shutil.rmtree(self.clones, ignore_errors=True)
+
+
+def warm_factory(
+    factory: Callable[..., WebDriver], profiles: ProfileCache
+) -> Callable[[], WebDriver]:
+    """Фабрика браузеров для BrowserPool: каждый запускается с копией прогретого профиля."""
+    profiles.seed(lambda user_data_dir: factory(user_data_dir=user_data_dir))
+
+    def start() -> WebDriver:
+        return factory(user_data_dir=profiles.clone())
+
+    return start
+
+
+def stable_port(worker_index: int | None) -> int:
+    return STABLE_PORT + (worker_index or 0)
+
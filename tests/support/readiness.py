@@ -0,0 +1,45 @@
+import posixpath
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.stats import TIMINGS
+
+
+READY_SCRIPT = """
+const [timeout, done] = [arguments[0], arguments[arguments.length - 1]];
+const script = document.querySelector('script[type="module"]');
+const finish = (ready) => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done({ready: ready, at: performance.now(), bundle: script ? script.src : null});
+};
+const mounted = () => {
+    const sum = document.getElementById('rub-sum');
+    return sum !== null && sum.textContent !== '';
+};
+const observer = new MutationObserver(() => mounted() && finish(true));
+const timer = setTimeout(() => finish(false), timeout);
+if (mounted()) {
+    finish(true);
+} else {
+    observer.observe(document, {childList: true, subtree: true, characterData: true});
+}
+"""
+
+
+def wait_app_ready(driver: WebDriver, timeout: float = 10) -> float:
+    """
+    Ждёт, пока React смонтирует приложение в #root и заполнит баланс.
+
+    Ожидание идёт внутри страницы на MutationObserver, поэтому
+    возвращается сразу после отрисовки. Возвращает время готовности от
+    начала навигации и записывает его в статистику по имени бандла.
+    """
+    result = driver.execute_async_script(READY_SCRIPT, int(timeout * 1000))
+    if not result["ready"]:
+        raise TimeoutException(f"app did not render #rub-sum within {timeout}s")
+    seconds = result["at"] / 1000
+    bundle = posixpath.basename(result["bundle"] or "") or "unknown bundle"
+    TIMINGS.record(f"app.ready {bundle}", seconds)
+    return seconds
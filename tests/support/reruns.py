@@ -0,0 +1,159 @@
+import time
+
+import pytest
+from _pytest.runner import call_and_report
+
+
+HISTORY_KEY = "fbank/flake-history"
+HISTORY_SIZE = 20
+MIN_RUNS = 5
+
+PASSED, FAILED, FLAKY = "passed", "failed", "flaky"
+
+
+def flake_rate(history: list[str]) -> float:
+    """
+    Доля нестабильных прогонов: упал и прошёл при перезапуске. Простое
+    падение нестабильностью не считается — иначе настоящая регрессия
+    после серии зелёных прогонов уходила бы в карантин.
+    """
+    if not history:
+        return 0.0
+    return sum(outcome == FLAKY for outcome in history) / len(history)
+
+
+class _Parents:
+    """
+    nextitem для разборки перед перезапуском: разбирается только сам тест,
+    а фикстуры модуля и сессии (пул браузеров, сервер) остаются, даже если
+    тест последний в модуле или сессии.
+    """
+
+    def __init__(self, item):
+        self.item = item
+
+    def listchain(self):
+        return self.item.listchain()[:-1]
+
+
+def run_attempt(item, nextitem, last: bool) -> list:
+    """Одна попытка теста, как runtestprotocol, но разборка зависит от того, будет ли перезапуск."""
+    if hasattr(item, "_request") and not item._request:
+        item._initrequest()
+    try:
+        reports = [call_and_report(item, "setup", log=False)]
+        if reports[0].passed:
+            reports.append(call_and_report(item, "call", log=False))
+        if item.session.shouldfail or item.session.shouldstop:
+            nextitem = None
+        retry = not last and any(report.failed for report in reports)
+        teardown_next = _Parents(item) if retry else nextitem
+        reports.append(call_and_report(item, "teardown", log=False, nextitem=teardown_next))
+    finally:
+        if hasattr(item, "_request"):
+            item._request = False
+            item.funcargs = None
+    return reports
+
+
+class RerunPlugin:
+    """
+    Перезапускает упавшие тесты сразу, в том же процессе и с теми же
+    прогретыми браузерами (session-фикстуры не пересоздаются).
+
+    История исходов по каждому тесту хранится в кэше pytest; тесты, у
+    которых доля нестабильных прогонов выше порога, помечаются xfail
+    (карантин) и не валят прогон.
+    """
+
+    def __init__(self, config, reruns: int = 0, threshold: float = 0.3, quarantine: bool = False):
+        self.cache = getattr(config, "cache", None)
+        self.reruns = reruns
+        self.threshold = threshold
+        self.quarantine = quarantine
+        self.history: dict[str, list[str]] = self.cache.get(HISTORY_KEY, {}) if self.cache else {}
+        self.results: dict[str, str] = {}
+        self.rerun: set[str] = set()
+        self.quarantined: list[str] = []
+        self.retry_seconds = 0.0
+        self.started = time.perf_counter()
+
+    def pytest_sessionstart(self, session):
+        self.started = time.perf_counter()
+
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.quarantine:
+            return
+        for item in items:
+            history = self.history.get(item.nodeid, [])
+            rate = flake_rate(history)
+            if len(history) >= MIN_RUNS and rate >= self.threshold:
+                reason = f"карантин: нестабилен в {rate:.0%} прогонов"
+                item.add_marker(pytest.mark.xfail(reason=reason, strict=False))
+                self.quarantined.append(item.nodeid)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.reruns <= 0:
+            return None
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for attempt in range(self.reruns + 1):
+            started = time.perf_counter()
+            last = attempt == self.reruns or bool(item.session.shouldfail or item.session.shouldstop)
+            reports = run_attempt(item, nextitem, last)
+            if attempt:
+                self.retry_seconds += time.perf_counter() - started
+            failed = [report for report in reports if report.failed]
+            if not failed or last:
+                break
+            for report in failed:
+                report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+        for report in reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome == "rerun":
+            self.rerun.add(report.nodeid)
+        elif report.failed and not hasattr(report, "wasxfail"):
+            self.results[report.nodeid] = FAILED
+        elif report.when == "call" and report.passed and not hasattr(report, "wasxfail"):
+            self.results.setdefault(report.nodeid, PASSED)
+        elif hasattr(report, "wasxfail"):
+            # тест в карантине: исход всё равно пишем в историю
+            self.results[report.nodeid] = PASSED if report.passed else FAILED
+
+    def pytest_sessionfinish(self, session):
+        if self.cache is None or not self.results:
+            return
+        # воркеры параллельного запуска пишут в один кэш, поэтому перечитываем его
+        history = self.cache.get(HISTORY_KEY, {})
+        for nodeid, outcome in self.results.items():
+            if outcome == PASSED and nodeid in self.rerun:
+                outcome = FLAKY
+            history[nodeid] = (history.get(nodeid, []) + [outcome])[-HISTORY_SIZE:]
+        self.cache.set(HISTORY_KEY, history)
+        self.history = history
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.rerun and not self.quarantined:
+            return
+        terminalreporter.write_sep("-", "F-Bank reruns")
+        if self.rerun:
+            recovered = sum(self.results.get(nodeid) == PASSED for nodeid in self.rerun)
+            session = time.perf_counter() - self.started
+            terminalreporter.write_line(
+                f"{len(self.rerun)} tests rerun in place ({recovered} passed on retry) "
+                f"in {self.retry_seconds:.1f}s, ~{session - self.retry_seconds:.1f}s saved "
+                f"vs re-running the whole session ({session:.1f}s)"
+            )
+        for nodeid in self.quarantined:
+            rate = flake_rate(self.history.get(nodeid, []))
+            terminalreporter.write_line(f"quarantined ({rate:.0%} flaky): {nodeid}")
@@ -0,0 +1,139 @@
+import hashlib
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from support.chromedriver import chrome_version
+from support.static_server import DIST_DIR
+
+
+CACHE_KEY = "fbank/result-cache"
+SKIP_REASON = "cached pass"
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+# Общие для всех тестов файлы: изменение любого из них сбрасывает кэш
+SHARED_SOURCES = (
+    "pytest.ini",
+    "requirements.txt",
+    "tests/conftest.py",
+    "tests/support/*.py",
+    "test_cases_*.md",
+    "tests/visual_baselines/**/*",
+)
+
+# Опции, которые меняют, как выполняется тест: проход в одном режиме не значит проход в другом
+KEY_OPTIONS = (
+    "--serve",
+    "--page-reuse",
+    "--profile-cache",
+    "--fill-mode",
+    "--wait-engine",
+    "--validation-budget",
+)
+
+
+def digest_files(paths: Iterable[Path], root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def shared_digest(
+    dist: Path = DIST_DIR,
+    root: Path = ROOT_DIR,
+    browser: str | None = None,
+    options: dict[str, object] | None = None,
+) -> str:
+    """Хэш бандла из dist/, общего кода, данных, эталонов и зависимостей тестов, версии браузера и режима запуска."""
+    shared = [
+        path for pattern in SHARED_SOURCES for path in root.glob(pattern) if path.is_file()
+    ]
+    parts = (
+        digest_files((path for path in dist.rglob("*") if path.is_file()), dist),
+        digest_files(shared, root),
+        browser or "unknown browser",
+        *(f"{name}={value}" for name, value in sorted((options or {}).items())),
+    )
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class ResultCachePlugin:
+    """
+    Пропускает тесты, которые уже проходили на тех же входных данных.
+
+    Ключ теста — хэш dist/, общих файлов (SHARED_SOURCES), файла с
+    самим тестом, его id, версии Chrome и значений KEY_OPTIONS. Ключи прошедших тестов лежат
+    в кэше pytest; упавший или пропущенный тест из кэша удаляется.
+    С invalidate=True сохранённые результаты игнорируются и тесты
+    выполняются заново.
+    Бенчмарки не кэшируются: их результат — замеры, а не pass/fail.
+    """
+
+    def __init__(self, config, invalidate: bool = False):
+        self.cache = config.cache
+        self.entries: dict[str, dict] = {} if invalidate else self.cache.get(CACHE_KEY, {})
+        self.keys: dict[str, str] = {}
+        self.hits: set[str] = set()
+        self.passed: dict[str, float] = {}
+        self.dropped: set[str] = set()
+        self._files: dict[Path, str] = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not items:
+            return
+        options = {name: config.getoption(name) for name in KEY_OPTIONS}
+        shared = shared_digest(browser=chrome_version(), options=options)
+        for item in items:
+            if item.get_closest_marker("benchmark") is not None:
+                continue
+            path = Path(item.path)
+            if path not in self._files:
+                self._files[path] = digest_files([path], path.parent)
+            key = f"{shared}\n{self._files[path]}\n{item.nodeid}"
+            key = self.keys[item.nodeid] = hashlib.sha256(key.encode()).hexdigest()
+            entry = self.entries.get(item.nodeid)
+            if entry is not None and entry["key"] == key:
+                self.hits.add(item.nodeid)
+                reason = f"{SKIP_REASON} ({entry['seconds']:.1f}s)"
+                item.add_marker(pytest.mark.skip(reason=reason))
+
+    def pytest_report_teststatus(self, report):
+        if report.skipped and report.nodeid in self.hits:
+            return "cached", "c", ("CACHED", {"green": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = report.nodeid
+        if nodeid not in self.keys or nodeid in self.hits:
+            return
+        if report.failed or report.skipped or hasattr(report, "wasxfail"):
+            self.dropped.add(nodeid)
+            self.passed.pop(nodeid, None)
+        elif report.outcome == "passed" and nodeid not in self.dropped:
+            self.passed[nodeid] = self.passed.get(nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        # воркеры параллельного запуска пишут в один кэш, поэтому перечитываем его;
+        # после сброса устаревшие записи безвредны — их ключи уже не совпадут
+        entries = self.cache.get(CACHE_KEY, {})
+        for nodeid in self.dropped:
+            entries.pop(nodeid, None)
+        for nodeid, seconds in self.passed.items():
+            if nodeid not in self.dropped:
+                entries[nodeid] = {"key": self.keys[nodeid], "seconds": seconds}
+        self.cache.set(CACHE_KEY, entries)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        saved = sum(self.entries[nodeid]["seconds"] for nodeid in self.hits)
+        terminalreporter.write_sep("-", "F-Bank result cache")
+        terminalreporter.write_line(
+            f"{len(self.hits)} cached passes skipped (~{saved:.1f}s saved), "
+            f"{len(self.passed)} results stored, {len(self.dropped)} dropped"
+        )
@@ -0,0 +1,176 @@
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+
+import trio
+from selenium.webdriver.common.bidi import cdp
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.benchmark import BenchmarkResult
+from support.contexts import ContextPage, devtools_endpoint, open_page
+from support.transfer_page import TransferSnapshot
+
+
+INTERLEAVINGS = ("together", "sequential", "staggered")
+
+DEFAULT_CARD = "5559000000000000"
+
+
+@dataclass(frozen=True)
+class TabTransfer:
+    amount: str
+    currency: str = "rub"
+    card: str = DEFAULT_CARD
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Переводы из нескольких вкладок, открытых с одними ?balance=&reserved=.
+
+    Все вкладки сначала одновременно загружаются и заполняются, затем
+    «Перевести» нажимается в порядке interleaving: together — во всех
+    вкладках сразу, sequential — по очереди в порядке transfers,
+    staggered — по очереди с шагом stagger секунд, не дожидаясь
+    предыдущих. new_windows открывает каждую вкладку в своём окне.
+    """
+
+    balance: str
+    reserved: str
+    transfers: tuple[TabTransfer, ...]
+    interleaving: str = "together"
+    stagger: float = 0.05
+    new_windows: bool = True
+
+    def __post_init__(self):
+        if self.interleaving not in INTERLEAVINGS:
+            raise ValueError(
+                f"unknown interleaving {self.interleaving!r}, expected one of {INTERLEAVINGS}"
+            )
+
+    @classmethod
+    def users(cls, count: int, amount: str, balance: str, reserved: str, **options) -> "Scenario":
+        """count вкладок с одинаковым переводом — нагрузка от count пользователей."""
+        return cls(balance, reserved, (TabTransfer(amount),) * count, **options)
+
+
+@dataclass(frozen=True)
+class TabOutcome:
+    tab: int
+    transfer: TabTransfer
+    sent: bool
+    alert: str | None
+    error: str | None
+    balance: str | None
+    open_seconds: float
+    send_seconds: float | None
+
+
+@dataclass(frozen=True)
+class ScenarioReport:
+    scenario: Scenario
+    outcomes: list[TabOutcome]
+    fire_seconds: float
+
+    @property
+    def sent(self) -> int:
+        return sum(outcome.sent for outcome in self.outcomes)
+
+    @property
+    def throughput(self) -> float:
+        """Отправленных переводов в секунду с первого нажатия «Перевести» до последнего alert."""
+        return self.sent / self.fire_seconds if self.fire_seconds else 0.0
+
+    def latencies(self) -> list[BenchmarkResult]:
+        results = [BenchmarkResult("tab.open", [outcome.open_seconds for outcome in self.outcomes])]
+        sends = [outcome.send_seconds for outcome in self.outcomes if outcome.send_seconds is not None]
+        if sends:
+            results.append(BenchmarkResult("tab.send", sends))
+        return results
+
+    def lines(self) -> list[str]:
+        header = (
+            f"{len(self.outcomes)} tabs, {self.scenario.interleaving}: {self.sent} sent, "
+            f"{len(self.outcomes) - self.sent} rejected, {self.throughput:.1f} transfers/s"
+        )
+        return [header, *(result.report() for result in self.latencies())]
+
+    def outcome_lines(self) -> list[str]:
+        lines = []
+        for outcome in self.outcomes:
+            result = f"alert {outcome.alert!r}, balance {outcome.balance}"
+            if not outcome.sent:
+                result = f"rejected {outcome.error!r}"
+            transfer = outcome.transfer
+            lines.append(f"tab {outcome.tab}: {transfer.amount} {transfer.currency} -> {result}")
+        return lines
+
+
+async def _prepare(
+    page: ContextPage, scenario: Scenario, transfer: TabTransfer
+) -> tuple[float, TransferSnapshot]:
+    started = trio.current_time()
+    await page.open(scenario.balance, scenario.reserved)
+    opened = trio.current_time() - started
+    await page.enable(transfer.currency)
+    await page.fill("card_number", transfer.card)
+    await page.fill("amount", transfer.amount)
+    return opened, await page.snapshot()
+
+
+async def _fire(
+    page: ContextPage, tab: int, transfer: TabTransfer, opened: float, state: TransferSnapshot
+) -> TabOutcome:
+    if not state.send_button_clickable:
+        return TabOutcome(tab, transfer, False, None, state.error, state.balance, opened, None)
+    started = trio.current_time()
+    alert = await page.send_money()
+    seconds = trio.current_time() - started
+    balance = (await page.snapshot()).balance
+    return TabOutcome(tab, transfer, True, alert, None, balance, opened, seconds)
+
+
+async def _run_scenario(driver: WebDriver, base_url: str, scenario: Scenario) -> ScenarioReport:
+    url, version = devtools_endpoint(driver)
+    devtools = cdp.import_devtools(version)
+    tabs = range(len(scenario.transfers))
+    prepared: list[tuple[float, TransferSnapshot]] = [None] * len(tabs)
+    outcomes: list[TabOutcome] = [None] * len(tabs)
+
+    async def prepare(tab: int):
+        prepared[tab] = await _prepare(pages[tab], scenario, scenario.transfers[tab])
+
+    async def fire(tab: int, delay: float = 0.0):
+        await trio.sleep(delay)
+        outcomes[tab] = await _fire(pages[tab], tab, scenario.transfers[tab], *prepared[tab])
+
+    async with cdp.open_cdp(url) as connection, AsyncExitStack() as stack:
+        pages = [
+            await stack.enter_async_context(
+                open_page(connection, devtools, base_url, new_window=scenario.new_windows)
+            )
+            for _ in tabs
+        ]
+        async with trio.open_nursery() as nursery:
+            for tab in tabs:
+                nursery.start_soon(prepare, tab)
+
+        started = trio.current_time()
+        if scenario.interleaving == "sequential":
+            for tab in tabs:
+                await fire(tab)
+        else:
+            step = scenario.stagger if scenario.interleaving == "staggered" else 0.0
+            async with trio.open_nursery() as nursery:
+                for tab in tabs:
+                    nursery.start_soon(fire, tab, tab * step)
+        fire_seconds = trio.current_time() - started
+    return ScenarioReport(scenario, outcomes, fire_seconds)
+
+
+def run_scenario(driver: WebDriver, base_url: str, scenario: Scenario) -> ScenarioReport:
+    """
+    Открывает по вкладке на перевод в браузере driver и выполняет
+    scenario. Вкладками управляет support.contexts по CDP, поэтому они
+    работают одновременно, а alert каждой вкладки принимается в ней же.
+    """
+    return trio.run(_run_scenario, driver, base_url, scenario)
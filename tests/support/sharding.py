@@ -0,0 +1,188 @@
+import argparse
+import glob
+import heapq
+import json
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from support.parallel import read_junit
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DURATIONS_FILE = ROOT_DIR / ".test_durations"
+
+# Длительность теста, которого ещё нет в файле и не с чем сравнить
+DEFAULT_DURATION = 1.0
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """--shard 2/4 → (1, 4): номер шарда с нуля и число шардов."""
+    index, _, count = value.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {index} is out of 1..{count}")
+    return index - 1, count
+
+
+def read_durations(path: Path) -> dict[str, float]:
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def write_durations(path: Path, durations: dict[str, float]):
+    rounded = {nodeid: round(seconds, 3) for nodeid, seconds in sorted(durations.items())}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(rounded, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def estimate(nodeids: list[str], durations: dict[str, float]) -> dict[str, float]:
+    """Длительности тестов; для новых — средняя по известным."""
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    fallback = sum(known) / len(known) if known else DEFAULT_DURATION
+    return {nodeid: durations.get(nodeid, fallback) for nodeid in nodeids}
+
+
+def partition(durations: dict[str, float], count: int) -> list[list[str]]:
+    """
+    Раскладка тестов по count шардам с близким суммарным временем
+    (LPT: самый долгий из оставшихся — в наименее загруженный шард).
+    Зависит только от длительностей и id, поэтому все шарды получают
+    одну и ту же раскладку независимо друг от друга.
+    """
+    shards: list[list[str]] = [[] for _ in range(count)]
+    heap = [(0.0, index) for index in range(count)]
+    for nodeid in sorted(durations, key=lambda nodeid: (-durations[nodeid], nodeid)):
+        total, index = heapq.heappop(heap)
+        shards[index].append(nodeid)
+        heapq.heappush(heap, (total + durations[nodeid], index))
+    return shards
+
+
+class ShardSelector:
+    """Оставляет только тесты шарда index из count по записанным длительностям."""
+
+    def __init__(self, index: int, count: int, durations: dict[str, float]):
+        self.index = index
+        self.count = count
+        self.durations = durations
+        self.totals: list[float] = []
+        self.selected = 0
+        self.collected = 0
+        self.known = 0
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        estimated = estimate([item.nodeid for item in items], self.durations)
+        shards = partition(estimated, self.count)
+        self.totals = [sum(estimated[nodeid] for nodeid in shard) for shard in shards]
+        mine = set(shards[self.index])
+        selected = [item for item in items if item.nodeid in mine]
+        deselected = [item for item in items if item.nodeid not in mine]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        self.collected, self.selected = len(items), len(selected)
+        self.known = sum(item.nodeid in self.durations for item in items)
+        items[:] = selected
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.totals:
+            return
+        terminalreporter.write_sep("-", f"shard {self.index + 1}/{self.count}")
+        terminalreporter.write_line(
+            f"{self.selected} of {self.collected} tests, ~{self.totals[self.index]:.1f}s expected "
+            f"(total {sum(self.totals):.1f}s, slowest shard {max(self.totals):.1f}s)"
+        )
+        if not self.known:
+            terminalreporter.write_line("no recorded durations: tests are split by count, not time")
+
+
+class DurationRecorder:
+    """
+    Записывает время каждого теста (setup, call, teardown и перезапуски)
+    в path, дополняя уже записанные. Пропущенные тесты не пишутся: их
+    время ничего не говорит о настоящем прогоне.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.durations: dict[str, float] = {}
+        self.skipped: set[str] = set()
+
+    def pytest_runtest_logreport(self, report):
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        measured = {
+            nodeid: seconds for nodeid, seconds in self.durations.items() if nodeid not in self.skipped
+        }
+        if measured:
+            write_durations(self.path, read_durations(self.path) | measured)
+
+
+def merge_junit(paths: list[Path], output: Path) -> dict[str, int]:
+    """Сливает JUnit XML шардов в один testsuite и возвращает счётчики исходов."""
+    results = {}
+    suite = ET.Element("testsuite", name="pytest")
+    seconds = 0.0
+    for path in paths:
+        results.update(read_junit(path))
+        for case in ET.parse(path).getroot().iter("testcase"):
+            suite.append(case)
+            seconds += float(case.get("time", 0) or 0)
+    outcomes = [outcome for outcome, _, _ in results.values()]
+    counts = {name: outcomes.count(name) for name in ("passed", "failed", "skipped", "xfailed")}
+    suite.set("tests", str(len(outcomes)))
+    suite.set("failures", str(counts["failed"]))
+    # как у junitxml самого pytest: xfail входит в skipped, а в testcase остаётся type="pytest.xfail"
+    suite.set("skipped", str(counts["skipped"] + counts["xfailed"]))
+    suite.set("errors", "0")
+    suite.set("time", f"{seconds:.3f}")
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.ElementTree(root).write(output, encoding="utf-8", xml_declaration=True)
+    return counts
+
+
+def _expand(patterns: list[str]) -> list[Path]:
+    # в PowerShell на Windows шаблоны не раскрываются оболочкой
+    return sorted({Path(path) for pattern in patterns for path in glob.glob(pattern)})
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Сводит результаты шардов:
+    python -m support.sharding --junit report.xml --durations ../.test_durations
+        --shard-durations "durations-*.json" -- "shard-*.xml"
+    """
+    parser = argparse.ArgumentParser(prog="python -m support.sharding")
+    parser.add_argument("--junit", type=Path, required=True, help="итоговый JUnit XML")
+    parser.add_argument("--durations", type=Path, help="файл длительностей, который дополнить")
+    parser.add_argument("--shard-durations", nargs="*", default=[], help="файлы длительностей шардов")
+    parser.add_argument("shards", nargs="+", help="JUnit XML шардов (можно шаблоном)")
+    args = parser.parse_args(argv)
+
+    reports = _expand(args.shards)
+    if not reports:
+        parser.error(f"no shard reports match {args.shards}")
+    counts = merge_junit(reports, args.junit)
+    if args.durations is not None:
+        durations = read_durations(args.durations)
+        for path in _expand(args.shard_durations):
+            durations |= read_durations(path)
+        write_durations(args.durations, durations)
+    print(
+        f"{len(reports)} shards: {counts['passed']} passed, {counts['failed']} failed, "
+        f"{counts['skipped']} skipped, {counts['xfailed']} xfailed -> {args.junit}"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.stats import TIMINGS
+
+
+# Путь, на котором в приложении нет ни одного маршрута: уход на него
+# размонтирует форму, возврат на "/" монтирует её с чистым состоянием
+UNMOUNT_PATH = "/__fbank_reset"
+
+SOFT_RESET_SCRIPT = """
+const [origin, target, unmountPath, timeout, done] = arguments;
+if (location.origin !== origin || !document.getElementById('root')) {
+    done({ok: false, reason: 'foreign page'});
+    return;
+}
+const go = (url) => {
+    history.replaceState(null, '', url);
+    window.dispatchEvent(new PopStateEvent('popstate', {state: null}));
+};
+const sum = () => document.getElementById('rub-sum');
+let stage = 'unmount';
+const finish = (ok, reason) => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done({ok: ok, reason: reason});
+};
+const check = () => {
+    if (stage === 'unmount' && sum() === null) {
+        stage = 'mount';
+        go(target);
+    } else if (stage === 'mount' && sum() !== null && sum().textContent !== '') {
+        finish(true, null);
+    }
+};
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(false, stage + ' timeout'), timeout);
+observer.observe(document, {childList: true, subtree: true, characterData: true});
+go(unmountPath);
+check();
+"""
+
+
+def soft_reset(driver: WebDriver, url: str, timeout: float = 10) -> bool:
+    """
+    Открывает url без перезагрузки страницы, через роутер SPA.
+
+    Форма сначала размонтируется (переход на UNMOUNT_PATH), затем
+    монтируется заново с новыми balance/reserved, поэтому выбранная
+    валюта, номер карты и сумма сбрасываются так же, как при загрузке.
+    Бандл при этом не скачивается и не разбирается повторно.
+    Возвращает False, если браузер не на странице приложения, открыт
+    alert или приложение не отрисовалось — тогда нужна обычная навигация.
+    """
+    parts = urlsplit(url)
+    target = parts.path + ("?" + parts.query if parts.query else "")
+    started = time.perf_counter()
+    try:
+        result = driver.execute_async_script(
+            SOFT_RESET_SCRIPT,
+            f"{parts.scheme}://{parts.netloc}",
+            target,
+            UNMOUNT_PATH,
+            int(timeout * 1000),
+        )
+    except WebDriverException:
+        return False
+    if not result["ok"]:
+        if result["reason"] != "foreign page":
+            TIMINGS.record("page.soft_reset failed", time.perf_counter() - started)
+        return False
+    TIMINGS.record("page.soft_reset", time.perf_counter() - started)
+    return True
+
+
+def savings_line() -> str | None:
+    soft = TIMINGS.samples("page.soft_reset")
+    if not soft:
+        return None
+    line = f"page reuse: {len(soft)} hard navigations avoided"
+    hard = TIMINGS.samples("page.navigate")
+    if hard:
+        saved = (statistics.median(hard) - statistics.median(soft)) * len(soft)
+        line += f", ~{saved:.1f}s saved vs median navigation"
+    return line
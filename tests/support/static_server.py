@@ -0,0 +1,128 @@
+import gzip
+import hashlib
+import mimetypes
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+DIST_DIR = Path(__file__).resolve().parents[2] / "dist"
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+@dataclass(frozen=True)
+class Asset:
+    body: bytes
+    gzipped: bytes | None
+    content_type: str
+    etag: str
+    cache_control: str
+
+
+def load_assets(root: Path = DIST_DIR) -> dict[str, Asset]:
+    """
+    Читает dist/ в память: для каждого файла заранее считаются gzip,
+    ETag и Cache-Control. Файлы из assets/ содержат хэш в имени,
+    поэтому кэшируются навсегда, index.html — с перепроверкой.
+    """
+    assets = {}
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type.endswith("javascript"):
+            content_type += "; charset=utf-8"
+        url = "/" + path.relative_to(root).as_posix()
+        assets[url] = Asset(
+            body=body,
+            gzipped=gzipped if len(gzipped) < len(body) else None,
+            content_type=content_type,
+            etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+            cache_control=IMMUTABLE if url.startswith("/assets/") else REVALIDATE,
+        )
+    if "/index.html" in assets:
+        assets["/"] = assets["/index.html"]
+    return assets
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._respond(with_body=True)
+
+    def do_HEAD(self):
+        self._respond(with_body=False)
+
+    def _respond(self, with_body: bool):
+        asset = self.server.assets.get(urlsplit(self.path).path)
+        if asset is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == asset.etag:
+            self.send_response(304)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Cache-Control", asset.cache_control)
+            self.end_headers()
+            return
+
+        body = asset.body
+        use_gzip = asset.gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        self.send_response(200)
+        if use_gzip:
+            body = asset.gzipped
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", asset.etag)
+        self.send_header("Cache-Control", asset.cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AssetServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], assets: dict[str, Asset]):
+        self.assets = assets
+        super().__init__(address, AssetHandler)
+
+
+class StaticServer:
+    """
+    Многопоточный сервер dist/ из памяти на свободном порту.
+
+    Сокет слушает уже после конструктора, так что сервер готов сразу
+    после start() — опрашивать его не нужно.
+    """
+
+    def __init__(self, root: Path = DIST_DIR, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = AssetServer((host, port), load_assets(root))
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StaticServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
@@ -0,0 +1,78 @@
+import bisect
+import statistics
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+# Границы корзин гистограмм, мс
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class TimingStats:
+    """Накопитель длительностей операций, выводится в итогах pytest."""
+
+    def __init__(self):
+        self._samples: dict[str, list[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            self._samples[name].append(seconds)
+
+    def samples(self, name: str) -> list[float]:
+        with self._lock:
+            return list(self._samples.get(name, []))
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._samples)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    @contextmanager
+    def isolated(self):
+        """Замеры внутри блока не попадают в накопленные: для тестов с поддельным драйвером."""
+        with self._lock:
+            saved, self._samples = self._samples, defaultdict(list)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._samples = saved
+
+    def summary_lines(self) -> list[str]:
+        lines = []
+        for name in self.names():
+            samples = self.samples(name)
+            lines.append(
+                f"{name}: n={len(samples)} total={sum(samples):.3f}s "
+                f"median={statistics.median(samples) * 1000:.1f}ms "
+                f"max={max(samples) * 1000:.1f}ms"
+            )
+        return lines
+
+    def histogram(self, name: str, buckets: tuple[float, ...] = HISTOGRAM_BUCKETS_MS) -> list[int]:
+        """Число замеров в корзинах «< buckets[i] мс»; последняя корзина — всё, что больше."""
+        counts = [0] * (len(buckets) + 1)
+        for seconds in self.samples(name):
+            counts[bisect.bisect_right(buckets, seconds * 1000)] += 1
+        return counts
+
+    def histogram_lines(
+        self, prefix: str, buckets: tuple[float, ...] = HISTOGRAM_BUCKETS_MS
+    ) -> list[str]:
+        labels = [f"<{bound:g}ms" for bound in buckets] + [f">={buckets[-1]:g}ms"]
+        lines = []
+        for name in self.names():
+            if not name.startswith(prefix):
+                continue
+            counts = self.histogram(name, buckets)
+            cells = [f"{label} {count}" for label, count in zip(labels, counts) if count]
+            lines.append(f"{name}: " + " | ".join(cells))
+        return lines
+
+
+TIMINGS = TimingStats()
@@ -0,0 +1,192 @@
+import functools
+import json
+import statistics
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+
+# Регрессия — медиана выросла больше чем на REGRESSION_RATIO и хотя бы на REGRESSION_FLOOR
+REGRESSION_RATIO = 0.2
+REGRESSION_FLOOR = 0.005
+
+SLOWEST_STEPS = 10
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass(frozen=True)
+class Span:
+    test: str | None
+    name: str
+    parent: str | None
+    start: float
+    seconds: float
+
+
+class Tracer:
+    """
+    Собирает вложенные интервалы по текущему тесту.
+
+    Пока трассировка выключена, span() возвращает готовый nullcontext и
+    ничего не записывает.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.test: str | None = None
+        self.spans: list[Span] = []
+        self._stack = threading.local()
+        self._disabled = nullcontext()
+
+    def span(self, name: str):
+        if not self.enabled:
+            return self._disabled
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str) -> Iterator[None]:
+        stack = self._stack.__dict__.setdefault("names", [])
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self.spans.append(Span(self.test, name, parent, started, time.perf_counter() - started))
+
+    def clear(self):
+        self.spans = []
+
+
+TRACER = Tracer()
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER._span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def write_spans(path: Path, spans: list[Span]):
+    with open(path, "a", encoding="utf-8") as file:
+        for span in spans:
+            file.write(json.dumps(asdict(span), ensure_ascii=False) + "\n")
+
+
+def read_spans(path: Path) -> list[Span]:
+    with open(path, encoding="utf-8") as file:
+        return [Span(**json.loads(line)) for line in file if line.strip()]
+
+
+def by_name(spans: list[Span]) -> dict[str, list[float]]:
+    grouped = defaultdict(list)
+    for span in spans:
+        grouped[span.name].append(span.seconds)
+    return dict(grouped)
+
+
+def slowest_lines(spans: list[Span], limit: int = SLOWEST_STEPS) -> list[str]:
+    grouped = sorted(by_name(spans).items(), key=lambda item: sum(item[1]), reverse=True)
+    return [
+        f"{name}: n={len(samples)} total={sum(samples):.3f}s "
+        f"median={statistics.median(samples) * 1000:.1f}ms max={max(samples) * 1000:.1f}ms"
+        for name, samples in grouped[:limit]
+    ]
+
+
+def regressions(spans: list[Span], baseline: list[Span]) -> list[str]:
+    """Шаги, медиана которых заметно выросла относительно сохранённого прогона."""
+    before = by_name(baseline)
+    lines = []
+    for name, samples in sorted(by_name(spans).items()):
+        if name not in before:
+            continue
+        old, new = statistics.median(before[name]), statistics.median(samples)
+        if new - old > REGRESSION_FLOOR and new > old * (1 + REGRESSION_RATIO):
+            lines.append(f"{name}: median {old * 1000:.1f}ms -> {new * 1000:.1f}ms")
+    return lines
+
+
+class TracingPlugin:
+    """
+    Пишет интервалы каждого теста в JSON Lines и выводит самые медленные шаги.
+
+    Кроме методов страницы, отмеченных @traced, оборачивается
+    RemoteConnection.execute, так что видна каждая команда WebDriver —
+    в том числе опросы из WebDriverWait. В воркерах параллельного запуска
+    файл получает суффикс .w<номер>, главный процесс потом сливает их.
+    """
+
+    def __init__(self, path: Path, baseline: Path | None = None, worker_index: int | None = None):
+        self.path = path
+        if worker_index is not None:
+            self.path = path.with_name(f"{path.stem}.w{worker_index}{path.suffix}")
+        self.baseline = baseline
+        self.worker = worker_index is not None
+        self._execute = RemoteConnection.execute
+
+    def pytest_configure(self, config):
+        original = self._execute
+
+        def execute(connection, command, params):
+            with TRACER.span(f"webdriver.{command}"):
+                return original(connection, command, params)
+
+        RemoteConnection.execute = execute
+        self.path.unlink(missing_ok=True)
+        TRACER.clear()
+        TRACER.enabled = True
+
+    def pytest_unconfigure(self, config):
+        RemoteConnection.execute = self._execute
+        TRACER.enabled = False
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        TRACER.test = item.nodeid
+        yield
+        TRACER.test = None
+
+    def pytest_sessionfinish(self, session):
+        write_spans(self.path, TRACER.spans)
+        if self.worker:
+            return
+        for part in sorted(self.path.parent.glob(f"{self.path.stem}.w*{self.path.suffix}")):
+            spans = read_spans(part)
+            write_spans(self.path, spans)
+            TRACER.spans.extend(spans)
+            part.unlink()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not TRACER.spans:
+            return
+        terminalreporter.write_sep("-", f"slowest steps ({self.path})")
+        for line in slowest_lines(TRACER.spans):
+            terminalreporter.write_line(line)
+        if self.baseline is None:
+            return
+        if not self.baseline.exists():
+            terminalreporter.write_line(f"baseline {self.baseline} not found")
+            return
+        found = regressions(TRACER.spans, read_spans(self.baseline))
+        terminalreporter.write_sep("-", f"regressions vs {self.baseline}: {len(found)}")
+        for line in found:
+            terminalreporter.write_line(line)
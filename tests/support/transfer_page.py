@@ -0,0 +1,267 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from support import locators
+from support.artifacts import recorded
+from support.form_state import is_error_message_shown, is_send_button_clickable
+from support.memory import sampled
+from support.readiness import wait_app_ready
+from support.soft_reset import soft_reset
+from support.stats import TIMINGS
+from support.tracing import traced
+from support.waits import wait_for
+
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+
+CURRENCIES = {"₽": "rub", "$": "usd", "€": "euro"}
+
+SNAPSHOT_SCRIPT = """
+const text = (el) => el ? el.textContent : null;
+const form = document.querySelector(arguments[0]);
+const child = (selector) => form ? form.querySelector(':scope > ' + selector) : null;
+const card = child('input:nth-of-type(1)');
+const amount = child('input:nth-of-type(2)');
+const button = child('button');
+const error = child('span:nth-of-type(2)');
+const visible = (el) => !!el && el.getClientRects().length > 0;
+return {
+    balance: text(document.getElementById('rub-sum')),
+    reserve: text(document.getElementById('rub-reserved')),
+    fee: text(document.getElementById('comission')),
+    symbol: text(child('span:nth-of-type(1)')),
+    card: card ? card.value : null,
+    amount: amount ? amount.value : null,
+    error: visible(error) ? text(error) : null,
+    button: visible(button) && !button.disabled,
+};
+"""
+
+# Значение ставится одним вызовом через нативный сеттер: иначе React не
+# заметит изменения. Событие input запускает onChange (маска, валидация).
+FAST_FILL_SCRIPT = """
+const [field, text, append] = arguments;
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+field.focus();
+setter.call(field, append ? field.value + text : text);
+field.dispatchEvent(new Event('input', {bubbles: true}));
+field.dispatchEvent(new Event('change', {bubbles: true}));
+return field.value;
+"""
+
+FILL_MODES = ("keys", "fast")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class TransferSnapshot:
+    """Состояние страницы перевода, прочитанное одним скриптом."""
+
+    balance: str | None
+    reserve: str | None
+    fee: str | None
+    currency: str | None
+    card: str | None
+    amount: str | None
+    error: str | None
+    send_button_clickable: bool
+
+
+def parse_snapshot(raw: dict, currency: str | None = None) -> TransferSnapshot:
+    """Результат SNAPSHOT_SCRIPT без разделителей разрядов; currency — если символа валюты нет."""
+    symbol = (raw["symbol"] or "").strip()
+
+    def clean(value: str | None, separator: str) -> str | None:
+        return None if value is None else value.replace(separator, "")
+
+    return TransferSnapshot(
+        balance=clean(raw["balance"], "'"),
+        reserve=clean(raw["reserve"], "'"),
+        fee=clean(raw["fee"], " "),
+        currency=CURRENCIES.get(symbol, currency),
+        card=clean(raw["card"], " "),
+        amount=clean(raw["amount"], " "),
+        error=raw["error"],
+        send_button_clickable=raw["button"],
+    )
+
+
+class TransferPage:
+    """
+    Страница перевода на карту.
+
+    Найденные элементы кэшируются по имени локатора; при
+    StaleElementReferenceException элемент ищется заново.
+    С reuse=True open() переиспользует уже загруженное приложение
+    (см. support.soft_reset) и перезагружает страницу, только если
+    это не удалось. fill_mode="fast" заполняет поля одним скриптом
+    вместо посимвольного send_keys. Ожидания идут через
+    support.waits (wait_engine="observer" или "poll").
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = 10,
+        reuse: bool = False,
+        fill_mode: str = "keys",
+        wait_engine: str = "observer",
+    ):
+        self.driver = driver
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.reuse = reuse
+        self.fill_mode = fill_mode
+        self.wait_engine = wait_engine
+        self._elements: dict[str, WebElement] = {}
+        self.currency: str | None = None
+
+    def url(self, balance: int | float | str, reserved: int | float | str) -> str:
+        return f"{self.base_url}/?balance={balance}&reserved={reserved}"
+
+    @sampled("open")
+    @traced("page.open")
+    @recorded("open")
+    def open(self, balance: int | float | str, reserved: int | float | str):
+        url = self.url(balance, reserved)
+        if self.reuse and soft_reset(self.driver, url, self.timeout):
+            self._elements.clear()
+            self.currency = None
+            return
+        self.navigate(url)
+
+    @traced("page.navigate")
+    def navigate(self, url: str) -> float:
+        """Загружает url и возвращает время до отрисовки приложения от начала навигации."""
+        self._elements.clear()
+        self.currency = None
+        started = time.perf_counter()
+        self.driver.get(url)
+        ready = wait_app_ready(self.driver, self.timeout)
+        TIMINGS.record("page.navigate", time.perf_counter() - started)
+        return ready
+
+    @traced("page.find_element")
+    def find_element(self, name: str) -> WebElement:
+        return self.wait(name, "clickable")
+
+    def wait(self, name: str, condition: str, text: str | None = None) -> WebElement | None:
+        """Ждёт условия для элемента реестра: wait("fee", "text_changed", old_fee)."""
+        return wait_for(
+            self.driver,
+            locators.locator(name).query,
+            condition,
+            timeout=self.timeout,
+            text=text,
+            engine=self.wait_engine,
+        )
+
+    def element(self, name: str) -> WebElement:
+        return self._with_element(name, lambda element: element)
+
+    def _with_element(self, name: str, action: Callable[[WebElement], T]) -> T:
+        element = self._elements.get(name)
+        if element is not None:
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                del self._elements[name]
+        element = self.find_element(name)
+        self._elements[name] = element
+        return action(element)
+
+    @recorded("enable_rubles")
+    def enable_rubles(self):
+        self._with_element("rubles_card", WebElement.click)
+        self.currency = "rub"
+
+    @recorded("enable_dollars")
+    def enable_dollars(self):
+        self._with_element("dollars_card", WebElement.click)
+        self.currency = "usd"
+
+    @recorded("enable_euro")
+    def enable_euro(self):
+        self._with_element("euro_card", WebElement.click)
+        self.currency = "euro"
+
+    @sampled("card_input")
+    @traced("page.card_input")
+    @recorded("card_input")
+    def card_input(self, card_number: str, clear: bool = False, mode: str | None = None) -> str:
+        return self._fill("card_number", card_number, clear, mode)
+
+    @sampled("amount_input")
+    @traced("page.amount_input")
+    @recorded("amount_input")
+    def amount_input(self, amount: str, mode: str | None = None) -> str:
+        return self._fill("amount", amount, True, mode)
+
+    def _fill(self, name: str, text: str, clear: bool, mode: str | None) -> str:
+        """mode: "keys" — посимвольно, "fast" — одним скриптом, None — как fill_mode страницы."""
+        def type_keys(field: WebElement) -> str:
+            if clear:
+                field.clear()
+            field.send_keys(text)
+            return field.get_attribute("value")
+
+        def set_value(field: WebElement) -> str:
+            return self.driver.execute_script(FAST_FILL_SCRIPT, field, text, not clear)
+
+        fill = set_value if (mode or self.fill_mode) == "fast" else type_keys
+        return self._with_element(name, fill).replace(" ", "")
+
+    def get_fee(self) -> str:
+        return self._text("fee").replace(" ", "")
+
+    def get_ruble_balance(self) -> str:
+        return self._text("ruble_balance").replace("'", "")
+
+    def get_ruble_reserve(self) -> str:
+        return self._text("ruble_reserve").replace("'", "")
+
+    def _text(self, name: str) -> str:
+        return self._with_element(name, lambda element: element.text)
+
+    @traced("page.snapshot")
+    def snapshot(self) -> TransferSnapshot:
+        self.element("ruble_balance")
+        raw = self.driver.execute_script(SNAPSHOT_SCRIPT, locators.FORM)
+        return parse_snapshot(raw, self.currency)
+
+    def get_send_button(self) -> WebElement | None:
+        if not is_send_button_clickable(self.driver):
+            return None
+        try:
+            return self.element("send_button")
+        except TimeoutException:
+            return None
+
+    def get_exception_message(self) -> WebElement | None:
+        if not is_error_message_shown(self.driver):
+            return None
+        try:
+            return self.element("error_message")
+        except TimeoutException:
+            return None
+
+    @traced("page.send_money")
+    @recorded("send_money")
+    def send_money(self, button: WebElement):
+        button.click()
+
+    @sampled("get_alert")
+    @traced("page.get_alert")
+    def get_alert(self) -> str:
+        alert = self.driver.switch_to.alert
+        alert_text = alert.text
+        alert.accept()
+        return alert_text
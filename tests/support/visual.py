@@ -0,0 +1,242 @@
+import base64
+import hashlib
+import io
+import json
+import time
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support import locators
+from support.stats import TIMINGS
+
+
+BASELINE_DIR = Path(__file__).resolve().parents[1] / "visual_baselines"
+INDEX_FILE = "index.json"
+
+# Допустимая разница канала пикселя (антиалиасинг текста между запусками)
+DEFAULT_TOLERANCE = 8
+# Доля отличающихся пикселей, которая ещё считается совпадением
+DEFAULT_MAX_RATIO = 0.0
+# Расстояние Хэмминга между phash, начиная с которого изображения точно разные
+PHASH_LIMIT = 10
+PHASH_SIZE = 32
+PHASH_BITS = 8
+
+
+@dataclass(frozen=True)
+class Region:
+    """Прямоугольник в пикселях изображения: маска или область захвата."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class VisualResult:
+    """
+    Итог сравнения со снимком-эталоном. method — чем решено:
+    missing (эталона нет), new (эталон записан с update=True), size,
+    digest (пиксели совпали побайтно), pixels (поканальное сравнение с
+    допуском и масками); phash — расхождение, найденное поканальным
+    сравнением, при котором и перцептивные хэши далеки (сменилась раскладка).
+    """
+
+    name: str
+    matched: bool
+    method: str
+    different: int = 0
+    ratio: float = 0.0
+    phash_distance: int | None = None
+    diff: Path | None = None
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def element_png(driver: WebDriver, name: str) -> bytes:
+    """Скриншот одного элемента реестра support.locators."""
+    return driver.find_element(*locators.locator(name).query).screenshot_as_png
+
+
+def region_png(driver: WebDriver, region: Region) -> bytes:
+    """Скриншот области страницы по CDP Page.captureScreenshot без снимка всего окна."""
+    clip = {"x": region.x, "y": region.y, "width": region.width, "height": region.height, "scale": 1}
+    result = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png", "clip": clip})
+    return base64.b64decode(result["data"])
+
+
+def pixel_digest(pixels: np.ndarray) -> str:
+    digest = hashlib.sha256(str(pixels.shape).encode())
+    digest.update(np.ascontiguousarray(pixels).tobytes())
+    return digest.hexdigest()
+
+
+@cache
+def _dct_matrix(size: int) -> np.ndarray:
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+def phash(pixels: np.ndarray) -> int:
+    """
+    Перцептивный хэш: 64 бита низких частот DCT уменьшенного серого
+    изображения относительно их медианы. Мелкие сдвиги и шум почти не
+    меняют хэш, изменения раскладки — меняют многие биты.
+    """
+    gray = Image.fromarray(pixels).convert("L").resize((PHASH_SIZE, PHASH_SIZE), Image.LANCZOS)
+    matrix = _dct_matrix(PHASH_SIZE)
+    low = (matrix @ np.asarray(gray, dtype=np.float64) @ matrix.T)[:PHASH_BITS, :PHASH_BITS]
+    bits = (low > np.median(low.ravel()[1:])).ravel()
+    return int("".join("1" if bit else "0" for bit in bits), 2)
+
+
+def hamming(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def mask_array(shape: tuple[int, ...], masks: tuple[Region, ...]) -> np.ndarray:
+    """True там, где пиксели сравниваются."""
+    compared = np.ones(shape[:2], dtype=bool)
+    for region in masks:
+        compared[region.y : region.y + region.height, region.x : region.x + region.width] = False
+    return compared
+
+
+def different_pixels(
+    actual: np.ndarray, expected: np.ndarray, tolerance: int, compared: np.ndarray
+) -> np.ndarray:
+    """Маска пикселей, у которых хоть один канал отличается больше чем на tolerance."""
+    # |a - e| в uint8 без переполнения и без копий в int16
+    delta = np.maximum(actual, expected)
+    delta -= np.minimum(actual, expected)
+    # max(axis=2) по оси из трёх каналов на порядок медленнее поканальных maximum
+    delta = np.maximum(np.maximum(delta[..., 0], delta[..., 1]), delta[..., 2])
+    return (delta > tolerance) & compared
+
+
+def diff_image(expected: np.ndarray, different: np.ndarray, compared: np.ndarray) -> np.ndarray:
+    """Бледный эталон, отличия — красным, маски — синим."""
+    gray = expected.mean(axis=2, keepdims=True)
+    image = np.repeat(gray * 0.3 + 178, 3, axis=2).astype(np.uint8)
+    image[~compared] = (image[~compared] * [0.5, 0.5, 1.0]).astype(np.uint8)
+    image[different] = (255, 0, 0)
+    return image
+
+
+def _write_png(path: Path, pixels: np.ndarray):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(pixels).save(path)
+
+
+class VisualBaselines:
+    """
+    Снимки-эталоны элементов в root и сравнение с ними.
+
+    По каждому эталону в index.json хранятся размер, sha256 пикселей и
+    phash, поэтому совпавший побайтно снимок не требует декодировать
+    PNG эталона. Остальные сравниваются поканально целиком в NumPy с
+    допуском tolerance и масками; phash только подписывает найденное
+    расхождение: на почти однотонных элементах шум в пределах допуска
+    сильно меняет phash, и решать по нему одному нельзя. Файлы actual.png и diff.png пишутся в
+    diffs только при расхождении. Эталоны пишутся только с update=True:
+    без него отсутствующий эталон — расхождение, а не новый снимок.
+    """
+
+    def __init__(
+        self,
+        root: Path = BASELINE_DIR,
+        diffs: Path = Path("visual-diffs"),
+        update: bool = False,
+        tolerance: int = DEFAULT_TOLERANCE,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+    ):
+        self.root = root
+        self.diffs = diffs
+        self.update = update
+        self.tolerance = tolerance
+        self.max_ratio = max_ratio
+        index = root / INDEX_FILE
+        self.index: dict[str, dict] = json.loads(index.read_text("utf-8")) if index.exists() else {}
+        self.results: list[VisualResult] = []
+
+    def check(
+        self,
+        name: str,
+        png: bytes,
+        masks: tuple[Region, ...] = (),
+        tolerance: int | None = None,
+        max_ratio: float | None = None,
+    ) -> VisualResult:
+        started = time.perf_counter()
+        result = self._check(
+            name,
+            decode_png(png),
+            masks,
+            self.tolerance if tolerance is None else tolerance,
+            self.max_ratio if max_ratio is None else max_ratio,
+        )
+        TIMINGS.record(f"visual.{result.method}", time.perf_counter() - started)
+        self.results.append(result)
+        return result
+
+    def _check(
+        self,
+        name: str,
+        actual: np.ndarray,
+        masks: tuple[Region, ...],
+        tolerance: int,
+        max_ratio: float,
+    ) -> VisualResult:
+        entry = self.index.get(name)
+        path = self.root / f"{name}.png"
+        if self.update:
+            self._store(name, actual)
+            return VisualResult(name, True, "new")
+        if entry is None or not path.exists():
+            self._save_diff(name, actual)
+            return VisualResult(name, False, "missing", diff=self.diffs / name)
+        if list(actual.shape) != entry["shape"]:
+            self._save_diff(name, actual)
+            return VisualResult(name, False, "size", diff=self.diffs / name)
+        if pixel_digest(actual) == entry["digest"]:
+            return VisualResult(name, True, "digest")
+
+        expected = decode_png(path.read_bytes())
+        compared = mask_array(actual.shape, masks)
+        different = different_pixels(actual, expected, tolerance, compared)
+        count = int(different.sum())
+        ratio = count / max(int(compared.sum()), 1)
+        if ratio <= max_ratio:
+            return VisualResult(name, True, "pixels", count, ratio)
+        distance = hamming(phash(actual), entry["phash"])
+        method = "phash" if distance > PHASH_LIMIT else "pixels"
+        self._save_diff(name, actual, diff_image(expected, different, compared))
+        return VisualResult(name, False, method, count, ratio, distance, self.diffs / name)
+
+    def _store(self, name: str, pixels: np.ndarray):
+        _write_png(self.root / f"{name}.png", pixels)
+        self.index[name] = {
+            "shape": list(pixels.shape),
+            "digest": pixel_digest(pixels),
+            "phash": phash(pixels),
+        }
+        (self.root / INDEX_FILE).write_text(
+            json.dumps(self.index, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+    def _save_diff(self, name: str, actual: np.ndarray, diff: np.ndarray | None = None):
+        _write_png(self.diffs / name / "actual.png", actual)
+        if diff is not None:
+            _write_png(self.diffs / name / "diff.png", diff)
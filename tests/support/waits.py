@@ -0,0 +1,125 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support.stats import TIMINGS
+
+
+ENGINES = ("observer", "poll")
+CONDITIONS = ("present", "visible", "clickable", "hidden", "text_changed")
+
+WAIT_SCRIPT = """
+const [by, value, condition, text, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const find = () => {
+    if (by === 'id') {
+        return document.getElementById(value);
+    }
+    if (by === 'xpath') {
+        return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return document.querySelector(value);
+};
+const visible = (el) => {
+    if (!el || el.getClientRects().length === 0) {
+        return false;
+    }
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+};
+const checks = {
+    present: (el) => el !== null,
+    visible: visible,
+    clickable: (el) => visible(el) && !el.disabled,
+    hidden: (el) => !visible(el),
+    text_changed: (el) => el !== null && el.textContent !== text,
+};
+const started = performance.now();
+let settled = false;
+let observer = null;
+let timer = null;
+const finish = (ok, el) => {
+    settled = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearTimeout(timer);
+    done({ok: ok, element: ok && el ? el : null, ms: performance.now() - started});
+};
+const test = () => {
+    if (settled) {
+        return true;
+    }
+    const el = find();
+    if (checks[condition](el)) {
+        finish(true, el);
+        return true;
+    }
+    return false;
+};
+if (!test()) {
+    observer = new MutationObserver(test);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(() => finish(false, null), timeout);
+}
+"""
+
+POLL_CONDITIONS = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+    "hidden": EC.invisibility_of_element_located,
+}
+
+
+def wait_for(
+    driver: WebDriver,
+    query: tuple[str, str],
+    condition: str = "clickable",
+    timeout: float = 10,
+    text: str | None = None,
+    engine: str = "observer",
+) -> WebElement | None:
+    """
+    Ждёт, пока элемент query удовлетворит condition, и возвращает его.
+
+    Движок observer проверяет условие внутри страницы на каждой мутации
+    DOM и отвечает одним вызовом execute_async_script, сразу после
+    изменения. Движок poll — прежний WebDriverWait с опросом раз в 0,5 с.
+    Для hidden элемента может не быть, тогда возвращается None.
+    Время ожидания записывается в статистику как «wait.<движок> <условие>».
+    """
+    if condition not in CONDITIONS:
+        raise ValueError(f"unknown wait condition {condition!r}, expected one of {CONDITIONS}")
+    started = time.perf_counter()
+    if engine == "observer":
+        by, value = query
+        result = driver.execute_async_script(
+            WAIT_SCRIPT, by, value, condition, text, int(timeout * 1000)
+        )
+        if not result["ok"]:
+            raise TimeoutException(f"{value} is not {condition} after {timeout}s")
+        element = result["element"]
+    elif condition == "text_changed":
+        element = WebDriverWait(driver, timeout).until(
+            lambda current: _changed(current, query, text)
+        )
+    else:
+        element = WebDriverWait(driver, timeout).until(POLL_CONDITIONS[condition](query))
+        if not isinstance(element, WebElement):
+            element = None
+    TIMINGS.record(f"wait.{engine} {condition}", time.perf_counter() - started)
+    return element
+
+
+def _changed(driver: WebDriver, query: tuple[str, str], text: str | None) -> WebElement | bool:
+    elements = driver.find_elements(*query)
+    if elements and elements[0].get_attribute("textContent") != text:
+        return elements[0]
+    return False
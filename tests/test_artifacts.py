@@ -0,0 +1,60 @@
+import base64
+import json
+
+import pytest
+from selenium.common.exceptions import UnexpectedAlertPresentException
+
+from support.artifacts import StepCapture, StepRecorder, artifact_dir, write_artifacts
+
+
+pytestmark = pytest.mark.usefixtures("isolated_timings")
+
+
+class ScriptDriver:
+    """Отвечает на CAPTURE_SCRIPT без браузера."""
+
+    def __init__(self):
+        self.calls = 0
+        self.alert = False
+
+    def execute_script(self, script):
+        self.calls += 1
+        if self.alert:
+            raise UnexpectedAlertPresentException("alert open")
+        return {"url": "http://x/", "fields": {"input-0": str(self.calls)}, "html": "<html></html>"}
+
+
+def test_ring_buffer_keeps_last_steps():
+    recorder = StepRecorder(steps=3)
+    driver = ScriptDriver()
+    for step in ("open", "enable_rubles", "card_input", "amount_input", "send_money"):
+        recorder.record(driver, step)
+    assert [capture.step for capture in recorder.buffer] == ["card_input", "amount_input", "send_money"]
+    assert recorder.buffer[-1].fields == {"input-0": "5"}
+    recorder.start()
+    assert not recorder.buffer and recorder.buffer.maxlen == 3
+
+
+def test_capture_survives_open_alert():
+    driver = ScriptDriver()
+    driver.alert = True
+    capture = StepRecorder().capture(driver, "failure")
+    assert capture.html is None and "alert open" in capture.error
+
+
+def test_write_artifacts(tmp_path):
+    steps = [StepCapture("card_input", 0.1, "http://x/", {"card": "1"}, "<p>1</p>")]
+    final = StepCapture("failure", 0.2, None, None, None, "alert open")
+    png = base64.b64encode(b"\x89PNG").decode()
+    path = write_artifacts(tmp_path / "t", steps, final, png)
+    index = json.loads((path / "steps.json").read_text(encoding="utf-8"))
+    assert [entry["step"] for entry in index] == ["card_input", "failure"]
+    assert (path / index[0]["html"]).read_text(encoding="utf-8") == "<p>1</p>"
+    assert "html" not in index[1]
+    assert (path / "screenshot.png").read_bytes() == b"\x89PNG"
+
+
+def test_artifact_dir_does_not_overwrite(tmp_path):
+    first = artifact_dir(tmp_path, "tests/test_x.py::TestX::test_y[a b]")
+    assert first.name == "tests_test_x.py_TestX_test_y_a_b"
+    assert artifact_dir(tmp_path, "tests/test_x.py::TestX::test_y[a b]", [first]).name.endswith("-2")
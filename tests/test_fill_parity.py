@@ -0,0 +1,30 @@
+import pytest
+
+
+CARDS = ["5559000000000000", "5559 0000 0000 0000", "123456789012", "123456789012345678", "4111-1111"]
+AMOUNTS = ["1000", "1 000", "1234,56", "1234,567", "000123", "-100", "abc"]
+
+
+@pytest.mark.usefixtures("page")
+class TestFillParity:
+    def fill(self, mode: str, card: str, amount: str | None):
+        self.page.open(balance=33000, reserved=1000)
+        self.page.enable_rubles()
+        self.page.card_input(card, clear=True, mode=mode)
+        if amount is not None:
+            self.page.amount_input(amount, mode=mode)
+        return self.page.snapshot()
+
+    @pytest.mark.parametrize("card", CARDS)
+    def test_card_number(self, card):
+        assert self.fill("fast", card, None) == self.fill("keys", card, None)
+
+    @pytest.mark.parametrize("amount", AMOUNTS)
+    def test_amount(self, amount):
+        assert self.fill("fast", CARDS[0], amount) == self.fill("keys", CARDS[0], amount)
+
+    def test_appending_to_card(self):
+        self.fill("keys", "5559", None)
+        typed = self.page.card_input("000000000000", mode="keys")
+        self.fill("fast", "5559", None)
+        assert self.page.card_input("000000000000", mode="fast") == typed
@@ -0,0 +1,52 @@
+import pytest
+
+from support.form_state import (
+    DEFAULT_BUDGET,
+    is_error_message_shown,
+    is_send_button_clickable,
+    read_validation_state,
+)
+
+
+pytestmark = pytest.mark.usefixtures("isolated_timings")
+
+
+class StateDriver:
+    """Отдаёт VALIDATION_STATE_SCRIPT заранее заданные состояния формы."""
+
+    def __init__(self, *states: dict):
+        self.states = list(states)
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return self.states[min(self.calls, len(self.states)) - 1]
+
+
+def state(form=True, amount=True, button=False, error=False) -> dict:
+    return {"form": form, "amount": amount, "button": button, "error": error}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [state(form=False, amount=False), state(amount=False), state(error=True)],
+    ids=["no-form", "no-amount", "error-shown"],
+)
+def test_absent_button_settles_without_waiting(raw, isolated_timings):
+    driver = StateDriver(raw)
+    assert not is_send_button_clickable(driver)
+    assert driver.calls == 1
+    assert len(isolated_timings.samples("form_state.absent")) == 1
+
+
+def test_absent_error_waits_for_render():
+    # React ещё не отрисовал ни кнопку, ни ошибку — ждём, пока появится одна из веток
+    driver = StateDriver(state(), state(), state(button=True))
+    assert not is_error_message_shown(driver)
+    assert driver.calls == 3
+
+
+def test_unsettled_form_gives_up_after_budget():
+    result = read_validation_state(StateDriver(state()), budget=0.05)
+    assert not result.settled
+    assert 0.05 <= result.seconds < DEFAULT_BUDGET
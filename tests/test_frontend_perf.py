@@ -0,0 +1,21 @@
+import pytest
+
+from support.benchmark import BenchmarkResult
+from support.frontend_perf import DEFAULT_BUDGETS_MS, exceeded, parse_budgets
+
+
+def test_budget_override_and_check():
+    budgets = parse_budgets(["first_render=800"])
+    assert budgets["first_render"] == 800
+    assert budgets["input_to_fee"] == DEFAULT_BUDGETS_MS["input_to_fee"]
+
+    results = {
+        "first_render": BenchmarkResult("first_render", [0.5] * 9 + [0.9, 0.9]),
+        "input_to_fee": BenchmarkResult("input_to_fee", [0.01] * 10),
+    }
+    assert exceeded(results, budgets) == ["first_render: p90=900.0ms > 800ms"]
+
+
+def test_unknown_budget_is_rejected():
+    with pytest.raises(ValueError):
+        parse_budgets(["bundle_size=10"])
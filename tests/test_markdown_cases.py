@@ -0,0 +1,41 @@
+from support.cases import (
+    compile_case,
+    format_failures,
+    group_by_precondition,
+    load_cases,
+    parse_markdown,
+)
+
+
+COMPILED, SKIPPED = load_cases()
+CASE_GROUPS = group_by_precondition(COMPILED)
+
+
+def test_markdown_cases_compile():
+    assert COMPILED, "ни один кейс из test_cases_*.md не скомпилировался"
+    keys = [case.key for case in COMPILED]
+    assert len(keys) == len(set(keys))
+    assert not set(keys) & set(SKIPPED)
+
+
+def test_compile_case_from_markdown():
+    text = "\n".join((
+        "### TC-001 — Комиссия 10%",
+        "**Предусловия:** открыта `http://localhost:8000/?balance=33000&reserved=1000`.",
+        "**Тестовые данные:**",
+        "* Номер карты: `5559 0000 0000 0000`",
+        "* Сумма: `1234`",
+        "**Ожидаемый результат:** Комиссия = 123, кнопка **«Перевести»** активна.",
+    ))
+    [case] = parse_markdown(text, "sample")
+    compiled = compile_case(case)
+    assert compiled.key == "sample/TC-001"
+    assert compiled.precondition == ("33000", "1000")
+    assert (compiled.card, compiled.amount, compiled.fee) == ("5559000000000000", "1234", "123")
+    assert compiled.accepted is True
+
+
+def test_markdown_case_group(case_groups, run_case_groups):
+    """Кейсы с одинаковыми предусловиями прогоняются подряд на одной загрузке страницы."""
+    failures = run_case_groups(case_groups)
+    assert not failures, format_failures(failures)
@@ -0,0 +1,57 @@
+import pytest
+
+from support.memory import (
+    DEFAULT_THRESHOLDS,
+    MemorySample,
+    leak,
+    leaks,
+    parse_thresholds,
+    read_samples,
+    rss_unavailable,
+    write_samples,
+)
+
+
+def samples(test: str, heap: list[float]) -> list[MemorySample]:
+    return [MemorySample(test, "cycle", float(i), value, 100, 10, None) for i, value in enumerate(heap)]
+
+
+def test_leak_ignores_gc_sawtooth():
+    # куча растёт до сборки мусора и возвращается к прежнему уровню
+    sawtooth = [10, 20, 30, 10, 20, 30, 10, 20, 30, 10, 20, 30, 10, 20, 30]
+    assert leak(sawtooth, threshold=1) is None
+
+
+def test_leak_flags_monotonic_growth_past_threshold():
+    growing = [value + (value % 3) * 5 for value in range(0, 100, 5)]
+    assert leak(growing, threshold=50) is not None
+    assert leak(growing, threshold=1000) is None
+    assert leak(growing[:5], threshold=1) is None
+
+
+def test_leaks_reports_per_test():
+    found = leaks(
+        samples("t::leaky", [i * 2**20 for i in range(20)]) + samples("t::flat", [2**20] * 20),
+        DEFAULT_THRESHOLDS,
+    )
+    assert found == ["t::leaky: js_heap +16.0 MB over 20 samples"]
+
+
+def test_parse_thresholds():
+    assert parse_thresholds(["nodes=500"])["nodes"] == 500
+    with pytest.raises(ValueError):
+        parse_thresholds(["heap=1"])
+
+
+def test_samples_round_trip_jsonl(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    write_samples(path, samples("t", [1.0, 2.0]))
+    assert read_samples(path) == samples("t", [1.0, 2.0])
+
+
+def test_missing_rss_is_reported():
+    assert rss_unavailable(samples("t", [1.0, 2.0])) == (
+        "rss unavailable in 2 of 2 samples (install psutil from requirements.txt), rss leaks not checked"
+    )
+    measured = [MemorySample("t", "cycle", 0.0, 1.0, 100, 10, 2**20)]
+    assert rss_unavailable(measured) is None
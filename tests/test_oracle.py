@@ -0,0 +1,98 @@
+from decimal import Decimal
+
+import pytest
+
+from support.fuzzing import (
+    FuzzCase,
+    boundary_cases,
+    differential_cases,
+    differential_sample,
+    fuzz,
+    known_divergences,
+)
+from support.oracle import TransferInput, check, fee, max_amount, parse_amount
+
+
+CARD = "5559000000000000"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1000", Decimal("1000")),
+        ("1 000", Decimal("1000")),
+        ("1234,56", Decimal("1234.56")),
+        ("12.5", Decimal("12.5")),
+        ("0,01", Decimal("0.01")),
+        ("1234,567", None),
+        ("000123", None),
+        ("0", None),
+        ("-100", None),
+        ("", None),
+    ],
+)
+def test_parse_amount(text, expected):
+    assert parse_amount(text) == expected
+
+
+def test_fee_is_floored():
+    assert fee(Decimal("1234.56")) == 123
+    assert fee(Decimal("99")) == 9
+    assert fee(Decimal("9.99")) == 0
+
+
+def test_exact_available_balance_is_accepted():
+    assert max_amount(Decimal(1100)) == 1000
+    assert check(TransferInput("rub", "1100", "0", CARD, "1000")).accepted
+    assert not check(TransferInput("rub", "1100", "0", CARD, "1001")).accepted
+
+
+@pytest.mark.parametrize("card", [CARD[:15], CARD + "0"])
+def test_card_must_have_16_digits(card):
+    assert not check(TransferInput("rub", "33000", "1000", card, "100")).accepted
+
+
+def test_fixed_accounts():
+    assert check(TransferInput("usd", "33000", "1000", CARD, "91")).accepted
+    assert not check(TransferInput("usd", "33000", "1000", CARD, "92")).accepted
+    assert not check(TransferInput("euro", "33000", "1000", CARD, "250")).accepted
+
+
+def test_fuzz_finds_no_violations():
+    report = fuzz(5_000, seed=1)
+    assert not report.violations, report.summary()
+
+
+def test_differential_sample_covers_strata_and_boundaries():
+    sample = differential_sample(5_000, seed=1)
+    strata = {case.stratum for case in fuzz(5_000, seed=1).cases}
+    assert strata <= {case.stratum for case in sample}
+    assert all(case in sample for case in boundary_cases())
+
+
+def known(currency: str, card: str, amount: str, balance: str = "33000") -> list[str]:
+    transfer = TransferInput(currency, balance, "0", card, amount)
+    return known_divergences(FuzzCase(("", "", ""), transfer, check(transfer)))
+
+
+@pytest.mark.parametrize(
+    "currency, card, amount, balance, reasons",
+    [
+        ("rub", CARD, "100", "33000", []),
+        ("rub", CARD, "1234", "33000", ["fee_tens"]),
+        ("rub", CARD, "12,34", "33000", ["amount_format"]),
+        ("rub", CARD, "-5", "33000", ["amount_format"]),
+        ("usd", CARD, "200", "33000", ["rub_balance"]),
+        ("rub", CARD, "1000", "1100", ["strict_limit"]),
+        ("rub", CARD + "0", "100", "33000", ["long_card"]),
+        ("rub", CARD[:15], "100", "33000", []),
+    ],
+)
+def test_known_divergences_explain_app_behaviour(currency, card, amount, balance, reasons):
+    assert known(currency, card, amount, balance) == reasons
+
+
+def test_differential_cases_split_the_sample():
+    clean, divergent = differential_cases(known=False), differential_cases(known=True)
+    assert clean and divergent
+    assert len(clean) + len(divergent) == len(differential_sample())
@@ -0,0 +1,14 @@
+from support.cases import format_failures, group_by_precondition
+from support.fuzzing import differential_cases
+
+
+SEED = 0
+
+# Кейсы с известными расхождениями сверяются в test_oracle_known_divergences.py
+CASE_GROUPS = group_by_precondition(differential_cases(known=False, seed=SEED))
+
+
+def test_app_matches_oracle(case_groups, run_case_groups):
+    """Выборка из фаззинга по стратам и границам сверяется с реальным приложением."""
+    failures = run_case_groups(case_groups)
+    assert not failures, format_failures(failures)
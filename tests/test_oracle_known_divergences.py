@@ -0,0 +1,22 @@
+import pytest
+
+from support.cases import format_failures, group_by_precondition
+from support.fuzzing import KNOWN_DIVERGENCES, differential_cases
+
+
+SEED = 0
+
+CASE_GROUPS = group_by_precondition(differential_cases(known=True, seed=SEED))
+
+# strict: если в группе все кейсы вдруг совпали с оракулом, расхождение исправлено
+# и его пора убрать из KNOWN_DIVERGENCES
+pytestmark = pytest.mark.xfail(
+    reason="известные расхождения со спецификацией: " + "; ".join(KNOWN_DIVERGENCES.values()),
+    strict=True,
+)
+
+
+def test_known_divergences_persist(case_groups, run_case_groups):
+    """Кейсы выборки, где приложение по известным причинам расходится с оракулом."""
+    failures = run_case_groups(case_groups)
+    assert not failures, format_failures(failures)
@@ -0,0 +1,50 @@
+from support.parallel import group_key, junit_address, read_junit, strip_option, worker_buckets
+
+
+def test_group_key_keeps_classes_together():
+    assert group_key("tests/test_a.py::TestA::test_x[1]") == "tests/test_a.py::TestA"
+    assert group_key("tests/test_a.py::test_x") == "tests/test_a.py"
+
+
+def test_worker_buckets_balance_whole_groups():
+    nodeids = [f"tests/test_a.py::TestA::test_{i}" for i in range(4)]
+    nodeids += [f"tests/test_b.py::test_{i}" for i in range(3)]
+    nodeids += ["tests/test_c.py::test_0", "tests/test_d.py::test_0"]
+    buckets = worker_buckets(nodeids, 2)
+    assert sorted(map(len, buckets)) == [4, 5]
+    assert sorted(sum(buckets, [])) == sorted(nodeids)
+    for bucket in buckets:
+        assert len({group_key(nodeid) for nodeid in bucket if "TestA" in nodeid}) <= 1
+    assert worker_buckets(nodeids[:1], 3)[1:] == [[], []]
+
+
+def test_junit_address_matches_pytest_classname():
+    assert junit_address("tests/test_a.py::TestA::test_x[1]") == ("tests.test_a.TestA", "test_x[1]")
+    assert junit_address("tests/sub/test_b.py::test_y") == ("tests.sub.test_b", "test_y")
+
+
+def test_strip_option_removes_both_forms():
+    args = ["tests", "--workers", "4", "--junitxml=out.xml", "-q", "--workers=2"]
+    assert strip_option(strip_option(args, "--workers"), "--junitxml") == ["tests", "-q"]
+
+
+def test_read_junit_outcomes(tmp_path):
+    path = tmp_path / "report.xml"
+    path.write_text(
+        """<testsuites><testsuite>
+        <testcase classname="tests.test_a" name="test_ok" time="1.5"/>
+        <testcase classname="tests.test_a" name="test_bad" time="2"><failure message="boom">trace</failure></testcase>
+        <testcase classname="tests.test_a" name="test_skip" time=""><skipped message="нет браузера"/></testcase>
+        <testcase classname="tests.test_a" name="test_known" time="0.5"><skipped type="pytest.xfail" message="баг 12"/></testcase>
+        <testcase classname="tests.test_a" name="test_teardown" time="1"><error message="teardown"/></testcase>
+        <testcase classname="tests.test_a" name="test_teardown" time="0"/>
+        </testsuite></testsuites>""",
+        encoding="utf-8",
+    )
+    assert read_junit(path) == {
+        ("tests.test_a", "test_ok"): ("passed", None, 1.5),
+        ("tests.test_a", "test_bad"): ("failed", "trace", 2.0),
+        ("tests.test_a", "test_skip"): ("skipped", "нет браузера", 0.0),
+        ("tests.test_a", "test_known"): ("xfailed", "баг 12", 0.5),
+        ("tests.test_a", "test_teardown"): ("failed", "teardown", 1.0),
+    }
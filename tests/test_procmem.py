@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+from support.procmem import megabytes, tree_rss
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="без psutil RSS читается из /proc")
+def test_tree_rss_of_current_process():
+    assert tree_rss(os.getpid()) > 0
+
+
+def test_megabytes():
+    assert megabytes(None) == "n/a"
+    assert megabytes(3 * 2**20) == "3 MB"
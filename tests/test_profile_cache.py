@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from support.profile_cache import MARKER, ProfileCache, origin_slug
+
+
+pytestmark = pytest.mark.usefixtures("isolated_timings")
+
+
+class SeedDriver:
+    """Вместо Chrome пишет в профиль файлы кэша и файл блокировки."""
+
+    def __init__(self, user_data_dir: str):
+        self.profile = Path(user_data_dir)
+        (self.profile / "SingletonLock").write_text("locked")
+        self.visits = 0
+
+    def get(self, url: str):
+        if url != "about:blank":
+            self.visits += 1
+            (self.profile / "Code Cache").mkdir(exist_ok=True)
+            (self.profile / "Code Cache" / f"visit-{self.visits}").write_text(url)
+
+    def execute_async_script(self, script, *args):
+        return {"ready": True, "at": 1.0, "bundle": None}
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def assets(tmp_path):
+    path = tmp_path / "assets"
+    path.mkdir()
+    (path / "index-AAAA.js").write_text("console.log(1)")
+    return path
+
+
+def profiles(tmp_path: Path, assets: Path) -> ProfileCache:
+    return ProfileCache("http://127.0.0.1:18765", "137.0.7151.68", tmp_path / "profiles", assets)
+
+
+def test_seed_once_and_clone_without_locks(tmp_path, assets):
+    cache = profiles(tmp_path, assets)
+    seeded = []
+    cache.seed(lambda user_data_dir: seeded.append(SeedDriver(user_data_dir)) or seeded[-1])
+    cache.seed(lambda user_data_dir: pytest.fail("профиль уже прогрет"))
+    assert len(seeded) == 1 and (cache.path / MARKER).exists()
+    assert cache.path.name.startswith("v1-chrome137-127-0-0-1-18765-")
+
+    clone = Path(cache.clone())
+    assert len(list((clone / "Code Cache").iterdir())) == 3
+    assert not (clone / "SingletonLock").exists()
+    cache.close()
+    assert not clone.exists() and cache.ready
+
+
+def test_new_bundle_gets_new_profile_and_drops_old(tmp_path, assets):
+    old = profiles(tmp_path, assets)
+    old.seed(SeedDriver)
+    (assets / "index-AAAA.js").unlink()
+    (assets / "index-BBBB.js").write_text("console.log(2)")
+    new = profiles(tmp_path, assets)
+    assert new.key != old.key and not new.ready
+    new.seed(SeedDriver)
+    assert new.ready and not old.path.exists()
+
+
+def test_origin_slug():
+    assert origin_slug("http://localhost:8000/") == "localhost-8000"
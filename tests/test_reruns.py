@@ -0,0 +1,18 @@
+import pytest
+
+from support.reruns import FAILED, FLAKY, PASSED, flake_rate
+
+
+@pytest.mark.parametrize(
+    "history, rate",
+    [
+        ([], 0.0),
+        ([PASSED] * 5, 0.0),
+        ([FAILED] * 5, 0.0),
+        ([PASSED] * 14 + [FAILED] * 6, 0.0),
+        ([PASSED, FLAKY, PASSED, FAILED], 0.25),
+        ([FLAKY] * 4, 1.0),
+    ],
+)
+def test_flake_rate(history, rate):
+    assert flake_rate(history) == rate
@@ -0,0 +1,62 @@
+from support.result_cache import digest_files, shared_digest
+
+
+def test_shared_digest_tracks_bundle_and_browser(tmp_path):
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "index.html").write_text("<div id=root></div>")
+    bundle = dist / "assets" / "index-A.js"
+    bundle.write_text("render()")
+    root = tmp_path / "repo"
+    (root / "tests" / "support").mkdir(parents=True)
+    (root / "tests" / "conftest.py").write_text("")
+
+    before = shared_digest(dist, root, "Chrome 126")
+    assert shared_digest(dist, root, "Chrome 126") == before
+    assert shared_digest(dist, root, "Chrome 127") != before
+
+    bundle.rename(dist / "assets" / "index-B.js")
+    assert shared_digest(dist, root, "Chrome 126") != before
+
+
+def test_shared_digest_tracks_requirements_and_options(tmp_path):
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<div id=root></div>")
+    root = tmp_path / "repo"
+    root.mkdir()
+    requirements = root / "requirements.txt"
+    requirements.write_text("selenium==4.33.0\n")
+
+    options = {"--fill-mode": "keys", "--serve": "memory"}
+    before = shared_digest(dist, root, "Chrome 126", options)
+    assert shared_digest(dist, root, "Chrome 126", {**options, "--fill-mode": "fast"}) != before
+    assert shared_digest(dist, root, "Chrome 126", {**options, "--serve": "intercept"}) != before
+
+    requirements.write_text("selenium==4.34.0\n")
+    assert shared_digest(dist, root, "Chrome 126", options) != before
+
+
+def test_shared_digest_tracks_baselines_and_budget(tmp_path):
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<div id=root></div>")
+    root = tmp_path / "repo"
+    baselines = root / "tests" / "visual_baselines" / "win32"
+    baselines.mkdir(parents=True)
+    (baselines / "rubles_card.png").write_bytes(b"png-1")
+
+    options = {"--validation-budget": 1.0}
+    before = shared_digest(dist, root, "Chrome 126", options)
+    assert shared_digest(dist, root, "Chrome 126", {"--validation-budget": 0.5}) != before
+
+    (baselines / "rubles_card.png").write_bytes(b"png-2")
+    assert shared_digest(dist, root, "Chrome 126", options) != before
+
+
+def test_digest_files_depends_on_content(tmp_path):
+    path = tmp_path / "test_x.py"
+    path.write_text("def test_x(): pass\n")
+    before = digest_files([path], tmp_path)
+    path.write_text("def test_x(): assert True\n")
+    assert digest_files([path], tmp_path) != before
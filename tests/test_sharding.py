@@ -0,0 +1,74 @@
+import argparse
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from support.parallel import read_junit
+from support.sharding import estimate, main, merge_junit, parse_shard, partition, read_durations
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (1, 4)
+    for value in ("0/4", "5/4", "a/b", "3"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+
+def test_partition_balances_total_time():
+    # пара долгих тестов ожидания и много быстрых проверок длины поля
+    durations = {"wait_a": 10.0, "wait_b": 10.0, "wait_c": 9.0}
+    durations |= {f"length_{i}": 0.5 for i in range(22)}
+    shards = partition(durations, 3)
+    totals = [sum(durations[nodeid] for nodeid in shard) for shard in shards]
+    assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(durations)
+    assert max(totals) - min(totals) <= 0.5
+    assert partition(durations, 3) == shards
+
+
+def test_unknown_tests_get_mean_duration():
+    assert estimate(["a", "b", "new"], {"a": 1.0, "b": 3.0}) == {"a": 1.0, "b": 3.0, "new": 2.0}
+    assert estimate(["new"], {})["new"] == 1.0
+
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">{cases}</testsuite></testsuites>
+"""
+
+
+def test_merge_shards(tmp_path):
+    (tmp_path / "shard-1.xml").write_text(JUNIT.format(cases=(
+        '<testcase classname="tests.test_a" name="test_ok" time="1.5"/>'
+        '<testcase classname="tests.test_a" name="test_bad" time="2"><failure message="x">boom</failure></testcase>'
+    )), encoding="utf-8")
+    (tmp_path / "shard-2.xml").write_text(JUNIT.format(cases=(
+        '<testcase classname="tests.test_b" name="test_skip" time="0"><skipped message="s"/></testcase>'
+    )), encoding="utf-8")
+    (tmp_path / "durations-1.json").write_text('{"tests/test_a.py::test_ok": 1.5}', encoding="utf-8")
+    durations = tmp_path / ".test_durations"
+    durations.write_text('{"tests/test_b.py::test_skip": 0.1}', encoding="utf-8")
+
+    code = main([
+        "--junit", str(tmp_path / "report.xml"),
+        "--durations", str(durations),
+        "--shard-durations", str(tmp_path / "durations-*.json"),
+        "--", str(tmp_path / "shard-*.xml"),
+    ])
+    assert code == 1
+    results = read_junit(tmp_path / "report.xml")
+    assert results[("tests.test_a", "test_bad")][0] == "failed"
+    assert len(results) == 3
+    assert read_durations(durations) == {"tests/test_a.py::test_ok": 1.5, "tests/test_b.py::test_skip": 0.1}
+    assert merge_junit([tmp_path / "shard-2.xml"], tmp_path / "only.xml")["skipped"] == 1
+
+
+def test_merge_shards_keeps_xfail(tmp_path):
+    (tmp_path / "shard-1.xml").write_text(JUNIT.format(cases=(
+        '<testcase classname="tests.test_a" name="test_known" time="1">'
+        '<skipped type="pytest.xfail" message="баг 12"/></testcase>'
+        '<testcase classname="tests.test_a" name="test_skip" time="0"><skipped message="s"/></testcase>'
+    )), encoding="utf-8")
+    counts = merge_junit([tmp_path / "shard-1.xml"], tmp_path / "report.xml")
+    assert (counts["skipped"], counts["xfailed"]) == (1, 1)
+    assert read_junit(tmp_path / "report.xml")[("tests.test_a", "test_known")][0] == "xfailed"
+    suite = ET.parse(tmp_path / "report.xml").getroot().find("testsuite")
+    assert suite.get("skipped") == "2"
@@ -0,0 +1,26 @@
+import pytest
+
+
+@pytest.mark.usefixtures("page")
+class TestSnapshot:
+    def test_snapshot_matches_getters(self):
+        self.page.open(balance=33000, reserved=1000)
+        self.page.enable_rubles()
+        self.page.card_input("5559000000000000")
+        self.page.amount_input("1000")
+        state = self.page.snapshot()
+        assert state.currency == "rub"
+        assert state.amount == "1000"
+        assert state.fee == self.page.get_fee()
+        assert state.balance == self.page.get_ruble_balance()
+        assert state.reserve == self.page.get_ruble_reserve()
+
+    def test_reserve_unchanged_after_transfer(self):
+        self.page.open(balance=33000, reserved=2000)
+        before = self.page.snapshot()
+        self.page.enable_rubles()
+        self.page.card_input("1111111111111111")
+        self.page.amount_input("1000")
+        self.page.send_money(self.page.get_send_button())
+        self.page.get_alert()
+        assert self.page.snapshot().reserve == before.reserve
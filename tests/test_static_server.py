@@ -0,0 +1,43 @@
+import gzip
+import urllib.error
+import urllib.request
+
+import pytest
+
+from support.static_server import DIST_DIR, StaticServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = StaticServer().start()
+    yield server
+    server.stop()
+
+
+def fetch(url: str, **headers) -> urllib.request.addinfourl:
+    return urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+
+
+def test_index_served_from_root(server):
+    response = fetch(f"{server.url}/")
+    assert response.status == 200
+    assert response.read() == (DIST_DIR / "index.html").read_bytes()
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_bundle_gzip_and_etag(server):
+    path = next((DIST_DIR / "assets").glob("*.js"))
+    response = fetch(f"{server.url}/assets/{path.name}", **{"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert gzip.decompress(response.read()) == path.read_bytes()
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(f"{server.url}/assets/{path.name}", **{"If-None-Match": response.headers["ETag"]})
+    assert error.value.code == 304
+
+
+def test_unknown_path_is_404(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(f"{server.url}/**?balance=33000&reserved=2000")
+    assert error.value.code == 404
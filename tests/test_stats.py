@@ -0,0 +1,22 @@
+from support.stats import TimingStats
+
+
+def test_histogram_buckets():
+    stats = TimingStats()
+    for seconds in (0.0004, 0.003, 0.004, 0.2, 7.0):
+        stats.record("wait.observer clickable", seconds)
+    stats.record("page.navigate", 0.1)
+
+    assert stats.histogram("wait.observer clickable", (1, 5, 1000)) == [1, 2, 1, 1]
+    assert stats.histogram_lines("wait.", (1, 5, 1000)) == [
+        "wait.observer clickable: <1ms 1 | <5ms 2 | <1000ms 1 | >=1000ms 1"
+    ]
+
+
+def test_isolated_keeps_samples_apart():
+    stats = TimingStats()
+    stats.record("page.navigate", 0.1)
+    with stats.isolated():
+        stats.record("capture.step", 0.001)
+        assert stats.names() == ["capture.step"]
+    assert stats.names() == ["page.navigate"]
@@ -0,0 +1,47 @@
+import pytest
+
+from support.tracing import Span, Tracer, read_spans, regressions, slowest_lines, write_spans
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    tracer.enabled = True
+    tracer.test = "tests/test_x.py::test_x"
+    return tracer
+
+
+def test_nested_spans_keep_parent(tracer):
+    with tracer.span("page.card_input"):
+        with tracer.span("webdriver.sendKeysToElement"):
+            pass
+    inner, outer = tracer.spans
+    assert (inner.name, inner.parent) == ("webdriver.sendKeysToElement", "page.card_input")
+    assert (outer.name, outer.parent) == ("page.card_input", None)
+    assert outer.test == "tests/test_x.py::test_x"
+    assert outer.seconds >= inner.seconds
+
+
+def test_disabled_tracer_records_nothing(tracer):
+    tracer.enabled = False
+    with tracer.span("page.open"):
+        pass
+    assert tracer.spans == []
+
+
+def test_spans_round_trip_jsonl(tmp_path, tracer):
+    with tracer.span("page.open"):
+        pass
+    path = tmp_path / "spans.jsonl"
+    write_spans(path, tracer.spans)
+    assert read_spans(path) == tracer.spans
+
+
+def test_slowest_and_regressions():
+    def spans(name: str, seconds: float) -> list[Span]:
+        return [Span("t", name, None, 0.0, seconds)] * 3
+
+    baseline = spans("page.open", 0.1) + spans("page.snapshot", 0.01)
+    current = spans("page.open", 0.2) + spans("page.snapshot", 0.0101)
+    assert slowest_lines(current)[0].startswith("page.open: n=3")
+    assert regressions(current, baseline) == ["page.open: median 100.0ms -> 200.0ms"]
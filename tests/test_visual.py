@@ -0,0 +1,53 @@
+import pytest
+
+from support.visual import element_png
+
+
+ELEMENTS = ("rubles_card", "dollars_card", "euro_card")
+
+pytestmark = pytest.mark.visual
+
+
+def check(visual, name: str, png: bytes, **options):
+    result = visual.check(name, png, **options)
+    if result.method == "new":
+        pytest.skip(f"записан эталон {name}")
+    assert result.method != "missing", (
+        f"нет эталона {name} для этой платформы: снимок в {result.diff}, записать — --update-baselines"
+    )
+    assert result.matched, (
+        f"{name}: {result.method}, {result.different} px ({result.ratio:.2%}), "
+        f"phash {result.phash_distance}, см. {result.diff}"
+    )
+
+
+@pytest.fixture
+def transfer_form(page):
+    page.open(balance=30000, reserved=20001)
+    page.enable_rubles()
+    return page
+
+
+@pytest.mark.parametrize("name", ELEMENTS)
+def test_currency_card(page, visual, name):
+    page.open(balance=30000, reserved=20001)
+    check(visual, name, element_png(page.driver, name))
+
+
+@pytest.mark.parametrize(
+    "field,text", [("card_number", "5559000000000000"), ("amount", "1234,5")], ids=["card", "amount"]
+)
+def test_input_mask(transfer_form, visual, field, text):
+    transfer_form.card_input("5559000000000000", clear=True)
+    if field == "amount":
+        transfer_form.amount_input(text)
+    # мигающий курсор не должен попадать в снимок
+    transfer_form.driver.execute_script("document.activeElement.blur()")
+    check(visual, f"{field}_filled", element_png(transfer_form.driver, field))
+
+
+def test_error_message(transfer_form, visual):
+    transfer_form.card_input("5559000000000000", clear=True)
+    transfer_form.amount_input("100000")
+    assert transfer_form.get_exception_message() is not None
+    check(visual, "error_message", element_png(transfer_form.driver, "error_message"))
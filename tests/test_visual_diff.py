@@ -0,0 +1,108 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from support.visual import PHASH_LIMIT, Region, VisualBaselines, hamming, phash
+
+
+pytestmark = pytest.mark.usefixtures("isolated_timings")
+
+
+def png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def card(width: int = 240, height: int = 120) -> np.ndarray:
+    pixels = np.full((height, width, 3), 245, dtype=np.uint8)
+    pixels[20:60, 20:200] = (40, 90, 200)
+    pixels[80:100, 20:120] = (30, 30, 30)
+    return pixels
+
+
+def record(tmp_path, pixels: np.ndarray):
+    baselines = VisualBaselines(tmp_path / "base", tmp_path / "diffs", update=True)
+    assert baselines.check("card", png(pixels)).method == "new"
+
+
+def test_missing_baseline_is_a_mismatch(tmp_path):
+    result = VisualBaselines(tmp_path / "base", tmp_path / "diffs").check("card", png(card()))
+    assert (result.matched, result.method) == (False, "missing")
+    assert (result.diff / "actual.png").exists()
+    assert not (tmp_path / "base").exists()
+
+
+def test_identical_capture_matches_by_digest(tmp_path):
+    record(tmp_path, card())
+    result = VisualBaselines(tmp_path / "base", tmp_path / "diffs").check("card", png(card()))
+    assert (result.matched, result.method) == (True, "digest")
+    assert not (tmp_path / "diffs").exists()
+
+
+def test_tolerance_and_masks(tmp_path):
+    record(tmp_path, card())
+    baselines = VisualBaselines(tmp_path / "base", tmp_path / "diffs")
+
+    noisy = card()
+    noisy[20:60, 20:200] += 3
+    assert baselines.check("card", png(noisy)).matched
+
+    caret = card()
+    caret[80:100, 150:152] = 0
+    assert not baselines.check("card", png(caret)).matched
+    result = baselines.check("card", png(caret), masks=(Region(148, 78, 8, 24),))
+    assert (result.matched, result.method) == (True, "pixels")
+
+
+def test_mismatch_writes_diff_image(tmp_path):
+    record(tmp_path, card())
+    changed = card()
+    changed[80:100, 20:120] = (200, 30, 30)
+    result = VisualBaselines(tmp_path / "base", tmp_path / "diffs").check("card", png(changed))
+    assert not result.matched and result.different == 20 * 100
+    diff = np.asarray(Image.open(result.diff / "diff.png"))
+    assert (diff[90, 50] == (255, 0, 0)).all()
+    assert (result.diff / "actual.png").exists()
+
+
+def test_size_change_is_a_mismatch(tmp_path):
+    record(tmp_path, card())
+    result = VisualBaselines(tmp_path / "base", tmp_path / "diffs").check("card", png(card(width=250)))
+    assert (result.matched, result.method) == (False, "size")
+
+
+def moved_card() -> np.ndarray:
+    moved = np.full_like(card(), 245)
+    moved[60:100, 40:220] = (40, 90, 200)
+    moved[10:30, 120:220] = (30, 30, 30)
+    return moved
+
+
+def test_phash_separates_layout_changes():
+    base = card()
+    noisy = base.copy()
+    noisy[::7, ::5] += 4
+    assert hamming(phash(base), phash(noisy)) <= PHASH_LIMIT
+    assert hamming(phash(base), phash(moved_card())) > PHASH_LIMIT
+
+
+def test_layout_change_is_labelled_by_phash(tmp_path):
+    record(tmp_path, card())
+    result = VisualBaselines(tmp_path / "base", tmp_path / "diffs").check("card", png(moved_card()))
+    assert (result.matched, result.method) == (False, "phash")
+    assert result.phash_distance > PHASH_LIMIT
+    assert (result.diff / "diff.png").exists()
+
+
+def test_low_contrast_noise_within_tolerance_matches(tmp_path):
+    # почти однотонное пустое поле: шум меняет phash сильнее PHASH_LIMIT, но не пиксели
+    rng = np.random.default_rng(0)
+    field = np.full((40, 300, 3), 250, dtype=np.uint8)
+    noisy = (field + rng.integers(-6, 7, field.shape)).clip(0, 255).astype(np.uint8)
+    record(tmp_path, field)
+    assert hamming(phash(field), phash(noisy)) > PHASH_LIMIT
+    result = VisualBaselines(tmp_path / "base", tmp_path / "diffs").check("card", png(noisy))
+    assert (result.matched, result.method, result.different) == (True, "pixels", 0)